@@ -0,0 +1,86 @@
+"""Benchmark: duplicating a large Titel.
+
+Compares ``copy.deepcopy`` plus a second pass assigning new UUIDs (the former
+DuplicateCategoryCommand) with the structural clone of models/clone.py.
+
+Usage:
+    python benchmarks/bench_duplicate.py [--items 20000]
+"""
+import argparse
+import sys
+import time
+import uuid
+from copy import deepcopy
+from decimal import Decimal
+from pathlib import Path
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lvgenerator.models.category import BoQCategory  # noqa: E402
+from lvgenerator.models.clone import clone_category  # noqa: E402
+from lvgenerator.models.item import Item, ItemDescription  # noqa: E402
+
+
+def build(items: int, items_per_category: int = 500) -> BoQCategory:
+    root = BoQCategory(id="root", rno_part="01", label="Titel")
+    perf = etree.fromstring(
+        "<PerfDescr><Description><CompleteText><DetailTxt><Text>"
+        + "<p><span>Leistungsbeschreibung</span></p>" * 5
+        + "</Text></DetailTxt></CompleteText></Description></PerfDescr>"
+    )
+    for c in range(0, items, items_per_category):
+        cat = BoQCategory(id=f"c{c}", rno_part=f"{c // items_per_category + 1:02d}")
+        for i in range(min(items_per_category, items - c)):
+            description = ItemDescription(
+                outline_text=f"Position {c + i}",
+                detail_html="<Text><p><span>" + "Langtext " * 40 + "</span></p></Text>",
+            )
+            description.perf_descr_raw = perf
+            cat.items.append(Item(
+                id=f"i{c + i}", rno_part=f"{i + 1:04d}",
+                qty=Decimal("12.500"), up=Decimal("48.20"), qu="m2",
+                description=description,
+            ))
+        root.subcategories.append(cat)
+    return root
+
+
+def deepcopy_with_ids(cat: BoQCategory) -> BoQCategory:
+    """The duplication as implemented before the structural clone."""
+    def assign(node: BoQCategory) -> None:
+        node.id = str(uuid.uuid4())
+        for sub in node.subcategories:
+            assign(sub)
+        for item in node.items:
+            item.id = str(uuid.uuid4())
+
+    copy = deepcopy(cat)
+    assign(copy)
+    return copy
+
+
+def _timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:7.3f} s")
+    return result, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000)
+    args = parser.parse_args()
+
+    source = build(args.items)
+    print(f"{args.items} Positionen")
+    old, old_time = _timed("deepcopy + neue IDs", lambda: deepcopy_with_ids(source))
+    new, new_time = _timed("clone_category", lambda: clone_category(source))
+    assert new.calculate_total() == old.calculate_total()
+    print(f"Faktor {old_time / new_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: xlsx export of a large LV and Preisspiegel.
+
+Usage:
+    python benchmarks/bench_excel_export.py [--rows 100000] [--bidders 5]
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lvgenerator.constants import GAEBPhase  # noqa: E402
+from lvgenerator.export.excel_exporter import ExcelExporter  # noqa: E402
+from lvgenerator.export.preisspiegel_exporter import PreisSpiegelExporter  # noqa: E402
+from lvgenerator.models.boq import BoQ, BoQInfo  # noqa: E402
+from lvgenerator.models.category import BoQCategory  # noqa: E402
+from lvgenerator.models.item import Item, ItemDescription  # noqa: E402
+from lvgenerator.models.project import GAEBProject, PrjInfo  # noqa: E402
+from lvgenerator.services.preisspiegel_service import PreisSpiegelBuilder  # noqa: E402
+
+
+def build_project(rows: int, items_per_category: int = 100) -> GAEBProject:
+    categories = []
+    for c in range((rows + items_per_category - 1) // items_per_category):
+        items = []
+        for i in range(min(items_per_category, rows - c * items_per_category)):
+            items.append(Item(
+                id=f"i{c}-{i}",
+                rno_part=f"{(i + 1) * 10:04d}",
+                qty=Decimal(i % 50 + 1),
+                qu="m2",
+                up=Decimal("12.35") + Decimal(i % 17),
+                description=ItemDescription(
+                    outline_text=f"Position {c}.{i}",
+                    detail_text="Liefern und einbauen gemaess Leistungsbeschreibung.",
+                ),
+            ))
+        categories.append(BoQCategory(
+            id=f"c{c}", rno_part=f"{c + 1:04d}", label=f"Titel {c + 1}", items=items,
+        ))
+    return GAEBProject(
+        prj_info=PrjInfo(name="Benchmark"),
+        phase=GAEBPhase.X84,
+        boq=BoQ(id="boq", info=BoQInfo(name="Benchmark"), categories=categories),
+    )
+
+
+def _timed(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{label:<32} {elapsed:8.2f} s   peak RSS {rss_mb:8.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--bidders", type=int, default=5)
+    args = parser.parse_args()
+
+    project = build_project(args.rows)
+    builder = PreisSpiegelBuilder(project)
+    for b in range(args.bidders):
+        builder.add_bidder_project(project, f"bieter{b}.x84")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _timed(f"ExcelExporter ({args.rows} rows)",
+               lambda: ExcelExporter().export(project, os.path.join(tmp, "lv.xlsx")))
+        _timed(f"PreisSpiegelExporter ({args.bidders} bidders)",
+               lambda: PreisSpiegelExporter().export(
+                   builder.spiegel, os.path.join(tmp, "ps.xlsx")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark: memory footprint of Item objects in a large LV.
+
+Builds an LV with 100k items the way the reader fills them (numbers, texts,
+no optional lists) and reports the traced allocation per item.
+
+Usage:
+    python benchmarks/bench_item_memory.py [--items 100000]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lvgenerator.models.category import BoQCategory  # noqa: E402
+from lvgenerator.models.item import Item, ItemDescription  # noqa: E402
+
+# Shared across all items so that only the model overhead is measured
+_TEXT = "Liefern und einbauen gemaess Leistungsbeschreibung."
+_QTY = Decimal("12.5")
+_UP = Decimal("47.11")
+
+
+def build_items(count: int, items_per_category: int = 100) -> list[BoQCategory]:
+    categories = []
+    for c in range(0, count, items_per_category):
+        cat = BoQCategory(id=f"c{c}", rno_part=f"{c // items_per_category + 1:02d}")
+        for i in range(min(items_per_category, count - c)):
+            cat.items.append(Item(
+                id=f"i{c + i}",
+                rno_part=f"{(i + 1) * 10:04d}",
+                qty=_QTY,
+                qu="m2",
+                up=_UP,
+                description=ItemDescription(outline_text=_TEXT, detail_text=_TEXT),
+            ))
+        categories.append(cat)
+    return categories
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    categories = build_items(args.items)
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"items:          {args.items}")
+    print(f"build time:     {elapsed:.2f} s (with tracing)")
+    print(f"traced memory:  {current / 1024 / 1024:.1f} MB")
+    print(f"bytes per item: {current / args.items:.0f}")
+    print(f"Item size:      {sys.getsizeof(categories[0].items[0])} B (shallow)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: diffing two large LVs.
+
+Builds an LV, copies it and changes a few positions in the copy (prices,
+texts, one moved and one added position), then times ``diff_projects``.
+A second run after one more edit shows the diff with cached content hashes.
+Here: cold about 0.6-1.0 s (nearly all hashing both trees), cached about
+10-15 ms for 50k vs 50k positions.
+
+Usage:
+    python benchmarks/bench_lv_diff.py [--items 50000] [--changes 50]
+"""
+import argparse
+import sys
+import time
+from copy import deepcopy
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lvgenerator.models.boq import BoQ  # noqa: E402
+from lvgenerator.models.category import BoQCategory  # noqa: E402
+from lvgenerator.models.item import Item, ItemDescription  # noqa: E402
+from lvgenerator.models.node_cache import invalidate_node_caches  # noqa: E402
+from lvgenerator.models.project import GAEBProject  # noqa: E402
+from lvgenerator.services.lv_diff import diff_projects  # noqa: E402
+
+
+def build(items: int, items_per_category: int = 250) -> GAEBProject:
+    lots = []
+    for c in range(0, items, items_per_category):
+        cat = BoQCategory(id=f"c{c}", rno_part=f"{c // items_per_category + 1:03d}")
+        for i in range(min(items_per_category, items - c)):
+            cat.items.append(Item(
+                id=f"i{c + i}", rno_part=f"{i + 1:04d}",
+                qty=Decimal("12.500"), up=Decimal("48.20"), qu="m2",
+                description=ItemDescription(
+                    outline_text=f"Position {c + i}",
+                    detail_text="Langtext " * 40,
+                ),
+            ))
+        lots.append(cat)
+    return GAEBProject(boq=BoQ(categories=lots))
+
+
+def change(project: GAEBProject, changes: int) -> None:
+    categories = project.boq.categories
+    stride = max(1, len(categories) // max(changes, 1))
+    for n, cat in enumerate(categories[::stride][:changes]):
+        cat.items[n % len(cat.items)].up += Decimal("1")
+    moved = categories[0].items.pop(0)
+    moved.rno_part = "9990"
+    categories[-1].items.append(moved)
+    categories[-1].items.append(Item(id="new", rno_part="9999"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--changes", type=int, default=50)
+    args = parser.parse_args()
+
+    old = build(args.items)
+    new = deepcopy(old)
+    change(new, args.changes)
+
+    start = time.perf_counter()
+    diff = diff_projects(old, new)
+    elapsed = time.perf_counter() - start
+    print(f"{args.items} Positionen, {len(old.boq.categories)} Titel")
+    print(f"diff_projects                {elapsed:7.3f} s")
+    print(f"geändert {len(diff.changed)}, verschoben {len(diff.moved)}, "
+          f"neu {len(diff.added)}, entfallen {len(diff.removed)}, "
+          f"übersprungene Titel {diff.skipped_subtrees}")
+
+    # Like an EditItemPropertyCommand: only the path to the root is rehashed
+    item = new.boq.categories[len(new.boq.categories) // 2].items[-1]
+    item.qty += Decimal("1")
+    invalidate_node_caches(item)
+    start = time.perf_counter()
+    diff = diff_projects(old, new)
+    elapsed = time.perf_counter() - start
+    print(f"diff_projects (gecacht)      {elapsed:7.3f} s, geändert {len(diff.changed)}")
+
+
+if __name__ == "__main__":
+    main()
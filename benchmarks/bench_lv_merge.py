@@ -0,0 +1,44 @@
+"""Benchmark: three-way merge of two edited copies of a large LV.
+
+Ours changes prices in the first half of the Titel, theirs quantities and
+texts in the second half plus one conflicting price; then ``merge_projects``
+is timed. The LV is the one of bench_lv_diff.py.
+
+Usage:
+    python benchmarks/bench_lv_merge.py [--items 50000]
+"""
+import argparse
+import time
+from copy import deepcopy
+from decimal import Decimal
+
+from bench_lv_diff import build
+
+from lvgenerator.services.lv_merge import merge_projects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    args = parser.parse_args()
+
+    base = build(args.items)
+    ours, theirs = deepcopy(base), deepcopy(base)
+    half = len(base.boq.categories) // 2
+    for cat in ours.boq.categories[:half]:
+        cat.items[0].up += Decimal("1")
+    for cat in theirs.boq.categories[half:]:
+        cat.items[1].qty += Decimal("1")
+        cat.items[2].description.outline_text += " (geändert)"
+    theirs.boq.categories[0].items[0].up += Decimal("2")
+
+    start = time.perf_counter()
+    result = merge_projects(base, ours, theirs)
+    elapsed = time.perf_counter() - start
+    print(f"{args.items} Positionen, {len(base.boq.categories)} Titel")
+    print(f"merge_projects               {elapsed:7.3f} s")
+    print(f"übernommen {result.applied}, Konflikte {len(result.conflicts)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark: application startup (imports and time to first window).
+
+Starts the GUI in fresh interpreters under ``-X importtime`` and measures
+the cumulative import time of ``MainController`` and the time until the
+main window has been shown. Fails (exit code 1) when the median exceeds the
+stored baseline by more than the tolerance, or when modules that are meant
+to be imported on first use are loaded during startup.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--tolerance 0.25]
+    python benchmarks/bench_startup.py --update-baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / "startup_baseline.json"
+
+sys.path.insert(0, str(ROOT / "src"))
+
+from lvgenerator.main import DEFERRED_MODULES  # noqa: E402
+
+_STARTUP_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from lvgenerator.controllers.main_controller import MainController
+from lvgenerator.views.main_window import MainWindow
+app = QApplication(sys.argv)
+window = MainWindow()
+controller = MainController(window)
+window.show()
+app.processEvents()
+elapsed = time.perf_counter() - start
+print(json.dumps({"first_window_ms": elapsed * 1000, "modules": sorted(sys.modules)}))
+"""
+
+
+def run_once() -> dict:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join([str(ROOT / "src"), env.get("PYTHONPATH", "")])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _STARTUP_SCRIPT],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["import_ms"] = _cumulative_import_ms(
+        proc.stderr, "lvgenerator.controllers.main_controller"
+    )
+    return result
+
+
+def _cumulative_import_ms(importtime_log: str, module: str) -> float:
+    """Cumulative import time of ``module`` from ``-X importtime`` output."""
+    for line in importtime_log.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    return 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative regression against the baseline")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    current = {
+        "import_ms": statistics.median(r["import_ms"] for r in runs),
+        "first_window_ms": statistics.median(r["first_window_ms"] for r in runs),
+    }
+    print(f"import main_controller:  {current['import_ms']:8.1f} ms (median of {args.runs})")
+    print(f"time to first window:    {current['first_window_ms']:8.1f} ms")
+
+    failed = False
+    eager = [m for m in DEFERRED_MODULES if m in runs[0]["modules"]]
+    if eager:
+        print("FAIL: imported at startup although deferred: " + ", ".join(eager))
+        failed = True
+
+    if args.update_baseline:
+        rounded = {key: round(value, 1) for key, value in current.items()}
+        BASELINE.write_text(json.dumps(rounded, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {BASELINE}")
+    elif BASELINE.exists():
+        baseline = json.loads(BASELINE.read_text(encoding="utf-8"))
+        for key, value in current.items():
+            limit = baseline[key] * (1 + args.tolerance)
+            status = "ok" if value <= limit else "FAIL"
+            print(f"{key}: {value:.1f} ms, baseline {baseline[key]:.1f} ms, "
+                  f"limit {limit:.1f} ms -> {status}")
+            failed = failed or value > limit
+    else:
+        print("no baseline yet (run with --update-baseline)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
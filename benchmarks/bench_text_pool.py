@@ -0,0 +1,103 @@
+"""Benchmark: memory of a read LV with and without text interning.
+
+Writes a synthetic X83 with many positions that reuse a small set of long
+texts and units (as typical for construction LVs), reads it back with and
+without the reader's text pool and reports the retained memory.
+
+Usage:
+    python benchmarks/bench_text_pool.py [--items 5000] [--texts 200]
+"""
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lvgenerator.constants import GAEBPhase  # noqa: E402
+from lvgenerator.gaeb.reader import GAEBReader  # noqa: E402
+from lvgenerator.gaeb.writer import GAEBWriter  # noqa: E402
+from lvgenerator.models.boq import BoQ, BoQBkdn, BoQInfo  # noqa: E402
+from lvgenerator.models.category import BoQCategory  # noqa: E402
+from lvgenerator.models.item import Item, ItemDescription  # noqa: E402
+from lvgenerator.models.project import GAEBProject, PrjInfo  # noqa: E402
+
+UNITS = ["m2", "m3", "St", "psch", "m", "kg", "t", "h"]
+
+
+def build_project(items: int, texts: int, items_per_category: int = 500) -> GAEBProject:
+    categories = []
+    for c in range(0, items, items_per_category):
+        cat = BoQCategory(id=f"c{c}", rno_part=f"{c // items_per_category + 1:02d}",
+                          label=f"Abschnitt {c // items_per_category + 1}")
+        for i in range(min(items_per_category, items - c)):
+            t = (c + i) % texts
+            detail = (f"Text {t}: Liefern und fachgerecht einbauen gemaess DIN 18331, "
+                      "einschliesslich aller Nebenleistungen. " * 6)
+            cat.items.append(Item(
+                id=f"i{c + i}", rno_part=f"{i + 1:04d}",
+                qty=Decimal(i % 50 + 1), qu=UNITS[t % len(UNITS)],
+                description=ItemDescription(
+                    outline_text=f"Position Typ {t}",
+                    detail_text=detail,
+                    detail_html=f"<p>{detail}</p>",
+                    compl_tsa="Fabrikat: ....", compl_tsb="Typ: ....",
+                ),
+            ))
+        categories.append(cat)
+    return GAEBProject(
+        phase=GAEBPhase.X83,
+        prj_info=PrjInfo(name="Benchmark"),
+        boq=BoQ(id="boq", info=BoQInfo(name="LV", breakdowns=[
+            BoQBkdn(type="BoQLevel", length=2), BoQBkdn(type="Item", length=4),
+        ]), categories=categories),
+    )
+
+
+def measure(path: str, intern_texts: bool):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    reader = GAEBReader(intern_texts=intern_texts)
+    project = reader.read(path)
+    elapsed = time.perf_counter() - start
+    reader.text_pool = None  # keep only what the project retains
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return project, current, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--texts", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.x83")
+        GAEBWriter().write(build_project(args.items, args.texts), path)
+
+        results = {}
+        for intern_texts in (False, True):
+            project, mem, elapsed = measure(path, intern_texts)
+            results[intern_texts] = mem
+            label = "with pool   " if intern_texts else "without pool"
+            print(f"{label}: {mem / 1024 / 1024:7.1f} MB retained, read {elapsed:.2f} s"
+                  " (with tracing)")
+            del project
+
+        reader = GAEBReader()
+        reader.read(path)
+        stats = reader.text_pool.stats()
+        print(f"pool: {stats.unique} unique of {stats.requests} texts, "
+              f"hit rate {stats.hit_rate:.1%}, {stats.saved_bytes / 1024 / 1024:.1f} MB deduplicated")
+        print(f"reduction: {1 - results[True] / results[False]:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: LV totals over many positions.
+
+Compares the former Decimal summation (quantize per position, Decimal adds)
+with BoQCategory.calculate_total, cold and after the positions cached their
+cents (as BoQStatistics and BoQSnapshot do).
+
+Usage:
+    python benchmarks/bench_totals.py [--items 1000000]
+"""
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from lvgenerator.models.category import BoQCategory  # noqa: E402
+from lvgenerator.models.item import Item  # noqa: E402
+
+
+def build(items: int, items_per_category: int = 1000) -> BoQCategory:
+    rnd = random.Random(42)
+    root = BoQCategory(id="root", rno_part="01")
+    for c in range(0, items, items_per_category):
+        cat = BoQCategory(id=f"c{c}", rno_part=f"{c // items_per_category + 1:04d}")
+        for i in range(min(items_per_category, items - c)):
+            cat.items.append(Item(
+                id=f"i{c + i}",
+                qty=Decimal(rnd.randint(1, 10**6)).scaleb(-3),
+                up=Decimal(rnd.randint(1, 10**5)).scaleb(-2),
+            ))
+        root.subcategories.append(cat)
+    return root
+
+
+def decimal_total(cat: BoQCategory):
+    """The summation as implemented before fixed-point cents."""
+    total = Decimal("0.00")
+    has_any = False
+    for item in cat.items:
+        item_total = item.it
+        if item_total is None and item.qty is not None and item.up is not None:
+            item_total = (item.qty * item.up).quantize(Decimal("0.01"))
+        if item_total is not None:
+            total += item_total
+            has_any = True
+    for sub in cat.subcategories:
+        sub_total = decimal_total(sub)
+        if sub_total is not None:
+            total += sub_total
+            has_any = True
+    return total if has_any else None
+
+
+def _timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:7.3f} s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    root = _timed(f"build {args.items} positions", lambda: build(args.items))
+    expected = _timed("Decimal summation", lambda: decimal_total(root))
+    first = _timed("calculate_total, cold", root.calculate_total)
+    _timed("cache cents (total_cents)", lambda: [
+        item.total_cents() for cat in root.subcategories for item in cat.items])
+    cached = _timed("calculate_total, cached", root.calculate_total)
+    for total in (first, cached):
+        assert expected == total and str(expected) == str(total), (expected, total)
+    print(f"total: {first}")
+
+
+if __name__ == "__main__":
+    main()
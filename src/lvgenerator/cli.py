@@ -0,0 +1,335 @@
+"""Headless command-line interface for batch processing of GAEB files.
+
+Runs the read/validate/convert/export pipelines without a QApplication so
+that conversions can run on servers. Per-file jobs are distributed over a
+process pool (``--jobs N``); progress is printed as each file finishes.
+Called without a subcommand, the GUI is started.
+"""
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, TextIO
+
+from lvgenerator.constants import GAEBPhase
+
+if TYPE_CHECKING:
+    from lvgenerator.services.batch_validation import FileProblem
+
+
+@dataclass
+class JobResult:
+    """Ergebnis der Verarbeitung einer Datei."""
+    file_path: str
+    ok: bool = True
+    output: str = ""
+    messages: list[str] = field(default_factory=list)
+    records: list["FileProblem"] = field(default_factory=list)  # for the JSONL report
+
+
+# ── Jobs (module level so they can be pickled for the process pool) ──
+
+def _output_path(file_path: str, output_dir: Optional[str], suffix: str) -> str:
+    path = Path(file_path)
+    directory = Path(output_dir) if output_dir else path.parent
+    out = directory / (path.stem + suffix)
+    # samefile also catches other spellings on case-insensitive file systems
+    if out.exists() and os.path.samefile(out, path):
+        raise ValueError(f"Ausgabe {out} würde die Eingabedatei überschreiben")
+    return str(out)
+
+
+def output_conflicts(files: list[str], output_dir: Optional[str], suffix: str) -> list[str]:
+    """Messages for inputs whose output would overwrite an input or
+    another file's output (e.g. same stem in different folders with ``-o``)."""
+    messages: list[str] = []
+    inputs = {os.path.normcase(os.path.abspath(fp)) for fp in files}
+    targets: dict[str, str] = {}
+    for fp in files:
+        try:
+            out = _output_path(fp, output_dir, suffix)
+        except ValueError as e:
+            messages.append(f"{fp}: {e}")
+            continue
+        key = os.path.normcase(os.path.abspath(out))
+        if key in inputs:
+            messages.append(f"{fp}: Ausgabe {out} würde eine Eingabedatei überschreiben")
+        elif key in targets:
+            messages.append(f"{fp}: Ausgabe {out} wird auch aus {targets[key]} geschrieben")
+        else:
+            targets[key] = fp
+    return messages
+
+
+def validate_job(file_path: str) -> JobResult:
+    """XSD-validate a single file."""
+    from lvgenerator.gaeb.xsd_validator import validate_file
+
+    result = validate_file(file_path)
+    return JobResult(
+        file_path=file_path,
+        ok=result.is_valid,
+        messages=[f"Zeile {e.line}: {e.message}" for e in result.errors],
+    )
+
+
+def convert_job(file_path: str, target: str, output_dir: Optional[str],
+                validate: bool) -> JobResult:
+    """Read a file, convert it to the target phase and write it."""
+    from lvgenerator.gaeb.phase_converter import PhaseConverter
+    from lvgenerator.gaeb.reader import GAEBReader
+    from lvgenerator.gaeb.writer import GAEBWriter
+
+    phase = GAEBPhase[target]
+    project = GAEBReader().read(file_path)
+    result = PhaseConverter().convert(project, phase)
+    out = _output_path(file_path, output_dir, phase.file_extension)
+    GAEBWriter().write(result.project, out)
+
+    job = JobResult(file_path=file_path, output=out, messages=list(result.warnings))
+    if validate:
+        check = validate_job(out)
+        job.ok = check.ok
+        job.messages.extend(check.messages)
+    return job
+
+
+def export_job(file_path: str, fmt: str, output_dir: Optional[str]) -> JobResult:
+    """Read a file and export it as xlsx, csv or parquet."""
+    from lvgenerator.gaeb.reader import GAEBReader
+
+    project = GAEBReader().read(file_path)
+    out = _output_path(file_path, output_dir, f".{fmt}")
+    if fmt == "xlsx":
+        from lvgenerator.export.excel_exporter import ExcelExporter
+        ExcelExporter().export(project, out)
+    else:
+        from lvgenerator.export.tabular_exporter import TabularExporter
+        exporter = TabularExporter()
+        if fmt == "csv":
+            exporter.export_lv_csv([project], out)
+        else:
+            exporter.export_lv_parquet([project], out)
+    return JobResult(file_path=file_path, output=out)
+
+
+def check_job(file_path: str, xsd: bool) -> JobResult:
+    """Quality gate for one file: XSD, LV validation and OZ mask."""
+    from lvgenerator.services.batch_validation import check_file
+
+    problems = check_file(file_path, xsd=xsd)
+    errors = sum(1 for p in problems if p.severity == "error")
+    job = JobResult(file_path=file_path, ok=errors == 0, records=problems)
+    if problems:
+        job.messages.append(f"{errors} Fehler, {len(problems) - errors} Warnungen")
+    return job
+
+
+# ── Runner ───────────────────────────────────────────────────────
+
+def expand_patterns(patterns: list[str]) -> list[str]:
+    """Expand glob patterns (also on shells that do not do it themselves)."""
+    files: list[str] = []
+    seen: set[str] = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) \
+            else [pattern]
+        for match in matches:
+            if match not in seen and os.path.isfile(match):
+                seen.add(match)
+                files.append(match)
+    return files
+
+
+def run_jobs(job: Callable[..., JobResult], files: list[str], args: tuple = (),
+             jobs: int = 1, out: TextIO = sys.stdout,
+             on_result: Optional[Callable[[JobResult], None]] = None) -> list[JobResult]:
+    """Run ``job(file, *args)`` for every file and stream progress to ``out``.
+
+    With ``jobs > 1`` the files are processed in a process pool; results are
+    reported (and passed to ``on_result``) in completion order.
+    """
+    total = len(files)
+    results: list[JobResult] = []
+
+    def report(result: JobResult) -> None:
+        results.append(result)
+        status = "OK" if result.ok else "FEHLER"
+        target = f" -> {result.output}" if result.output else ""
+        print(f"[{len(results)}/{total}] {status} {result.file_path}{target}",
+              file=out, flush=True)
+        for message in result.messages:
+            print(f"    {message}", file=out, flush=True)
+        if on_result is not None:
+            on_result(result)
+
+    if jobs <= 1 or total <= 1:
+        for fp in files:
+            report(_guarded(job, fp, args))
+        return results
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_guarded, job, fp, args) for fp in files]
+        for future in as_completed(futures):
+            report(future.result())
+    return results
+
+
+def _guarded(job: Callable[..., JobResult], file_path: str, args: tuple) -> JobResult:
+    """Run a job and turn exceptions into a failed result."""
+    try:
+        return job(file_path, *args)
+    except Exception as e:
+        return JobResult(file_path=file_path, ok=False, messages=[f"{type(e).__name__}: {e}"])
+
+
+# ── Commands ─────────────────────────────────────────────────────
+
+def _cmd_validate(args) -> int:
+    return _run(args, validate_job, ())
+
+
+def _cmd_convert(args) -> int:
+    return _run(args, convert_job, (args.to, args.output_dir, args.validate),
+                suffix=GAEBPhase[args.to].file_extension)
+
+
+def _cmd_export(args) -> int:
+    return _run(args, export_job, (args.format, args.output_dir),
+                suffix=f".{args.format}")
+
+
+def _cmd_check(args) -> int:
+    files = expand_patterns(args.files)
+    if not files:
+        print("Keine Dateien gefunden.", file=sys.stderr)
+        return 2
+    from lvgenerator.services.batch_validation import write_jsonl
+
+    with open(args.report, "w", encoding="utf-8") as report:
+        def write(result: JobResult) -> None:
+            write_jsonl(result.records, report)
+            report.flush()
+
+        results = run_jobs(check_job, files, (not args.no_xsd,), jobs=args.jobs,
+                           on_result=write)
+    failed = sum(1 for r in results if not r.ok)
+    records = sum(len(r.records) for r in results)
+    print(f"{len(results) - failed} ohne Fehler, {failed} mit Fehlern, "
+          f"{records} Befunde in {args.report}", flush=True)
+    return 1 if failed else 0
+
+
+def _cmd_preisspiegel(args) -> int:
+    from lvgenerator.export.preisspiegel_exporter import PreisSpiegelExporter
+    from lvgenerator.gaeb.reader import GAEBReader
+    from lvgenerator.services.preisspiegel_service import create_preisspiegel
+
+    bidder_files = expand_patterns(args.bidders)
+    if not bidder_files:
+        print("Keine Bieterdateien gefunden.", file=sys.stderr)
+        return 2
+    reference = GAEBReader().read(args.reference)
+    print(f"Lese {len(bidder_files)} Bieterdateien ...", flush=True)
+    spiegel = create_preisspiegel(reference, bidder_files)
+    PreisSpiegelExporter().export(spiegel, args.output)
+    print(f"Preisspiegel geschrieben: {args.output}", flush=True)
+    return 0
+
+
+def _cmd_merge(args) -> int:
+    from lvgenerator.services.lv_merge import merge_files
+
+    result = merge_files(args.base, args.ours, args.theirs, args.output)
+    for conflict in result.conflicts:
+        detail = f" {conflict.field}" if conflict.field else ""
+        print(f"KONFLIKT {conflict.kind} {conflict.oz}{detail}", flush=True)
+    print(f"{result.applied} Änderungen übernommen, {len(result.conflicts)} Konflikte, "
+          f"Ergebnis: {args.output}", flush=True)
+    return 1 if result.conflicts else 0
+
+
+def _run(args, job: Callable[..., JobResult], job_args: tuple,
+         suffix: Optional[str] = None) -> int:
+    files = expand_patterns(args.files)
+    if not files:
+        print("Keine Dateien gefunden.", file=sys.stderr)
+        return 2
+    if suffix is not None:
+        # Checked before any job runs: parallel workers would race for the same file
+        conflicts = output_conflicts(files, getattr(args, "output_dir", None), suffix)
+        for message in conflicts:
+            print(message, file=sys.stderr)
+        if conflicts:
+            return 2
+    if getattr(args, "output_dir", None):
+        os.makedirs(args.output_dir, exist_ok=True)
+    results = run_jobs(job, files, job_args, jobs=args.jobs)
+    failed = sum(1 for r in results if not r.ok)
+    print(f"{len(results) - failed} erfolgreich, {failed} fehlgeschlagen", flush=True)
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lvgenerator",
+        description="GAEB DA XML Stapelverarbeitung (ohne Angabe eines Befehls startet die GUI)",
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="+", help="Dateien oder Glob-Muster")
+    common.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Anzahl paralleler Prozesse (Standard: 1)")
+
+    p = sub.add_parser("validate", parents=[common], help="XSD-Validierung")
+    p.set_defaults(func=_cmd_validate)
+
+    p = sub.add_parser("convert", parents=[common], help="Phasenkonvertierung")
+    p.add_argument("--to", required=True, choices=[ph.name for ph in GAEBPhase],
+                   help="Zielphase")
+    p.add_argument("-o", "--output-dir", help="Ausgabeverzeichnis (Standard: neben der Quelle)")
+    p.add_argument("--validate", action="store_true", help="Ergebnis per XSD prüfen")
+    p.set_defaults(func=_cmd_convert)
+
+    p = sub.add_parser("export", parents=[common], help="Export als xlsx/csv/parquet")
+    p.add_argument("-f", "--format", choices=["xlsx", "csv", "parquet"], default="xlsx")
+    p.add_argument("-o", "--output-dir", help="Ausgabeverzeichnis (Standard: neben der Quelle)")
+    p.set_defaults(func=_cmd_export)
+
+    p = sub.add_parser("check", parents=[common],
+                       help="Qualitätsprüfung (XSD, LV-Regeln, OZ-Maske) mit JSONL-Bericht")
+    p.add_argument("-r", "--report", required=True, help="Ziel-Datei (JSON Lines)")
+    p.add_argument("--no-xsd", action="store_true", help="XSD-Prüfung überspringen")
+    p.set_defaults(func=_cmd_check)
+
+    p = sub.add_parser("preisspiegel", help="Preisspiegel aus X83 und X84-Angeboten")
+    p.add_argument("reference", help="Referenz-LV (X83)")
+    p.add_argument("bidders", nargs="+", help="Bieterdateien (X84) oder Glob-Muster")
+    p.add_argument("-o", "--output", required=True, help="Ziel-Excel-Datei")
+    p.set_defaults(func=_cmd_preisspiegel)
+
+    p = sub.add_parser("merge", help="Dreiwege-Zusammenführung paralleler LV-Bearbeitungen")
+    p.add_argument("base", help="Gemeinsamer Ausgangsstand")
+    p.add_argument("ours", help="Eigene Bearbeitung (gilt bei Konflikten)")
+    p.add_argument("theirs", help="Fremde Bearbeitung")
+    p.add_argument("-o", "--output", required=True, help="Ziel-Datei")
+    p.set_defaults(func=_cmd_merge)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        from lvgenerator.main import main as gui_main
+        gui_main()
+        return 0
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
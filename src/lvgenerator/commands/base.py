@@ -4,4 +4,7 @@ from PySide6.QtGui import QUndoCommand
 class BaseCommand(QUndoCommand):
     """Base for all undoable commands in LVGenerator."""
 
-    pass
+    # Whether redo/undo add or remove model objects of the project (False
+    # for commands that only change values or the order of nodes); the
+    # undo memory budget then has to refresh its set of shared objects.
+    changes_structure = True
@@ -1,26 +1,40 @@
+from typing import Optional
+
 from PySide6.QtGui import QUndoCommand
 
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.node_cache import invalidate_node_caches
 
 
 class EditCategoryPropertyCommand(BaseCommand):
     """Undoable command for changing a property on a BoQCategory."""
 
+    changes_structure = False
+
     def __init__(self, category: BoQCategory, property_name: str,
-                 old_value, new_value):
+                 old_value, new_value, boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Kategorie-Eigenschaft '{property_name}' ändern")
         self.category = category
         self.property_name = property_name
         self.old_value = old_value
         self.new_value = new_value
+        self.boq_index = boq_index
         self._id = hash(("cat_prop", id(self.category), self.property_name)) % (2**31)
 
     def redo(self) -> None:
-        setattr(self.category, self.property_name, self.new_value)
+        self._set(self.new_value)
 
     def undo(self) -> None:
-        setattr(self.category, self.property_name, self.old_value)
+        self._set(self.old_value)
+
+    def _set(self, value) -> None:
+        setattr(self.category, self.property_name, value)
+        self.category.revision += 1
+        invalidate_node_caches(self.category)
+        if self.boq_index is not None and self.property_name == "rno_part":
+            self.boq_index.renumber((self.category,))
 
     def id(self) -> int:
         return self._id
@@ -1,53 +1,65 @@
-import uuid
-from copy import deepcopy
+from typing import Optional
 
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.clone import clone_category, clone_item
 from lvgenerator.models.item import Item
+from lvgenerator.models.node_cache import invalidate_node_caches, invalidate_parent_caches
 
 
 class DuplicateItemCommand(BaseCommand):
     """Undoable command for duplicating an item."""
 
-    def __init__(self, parent_category: BoQCategory, source_item: Item):
+    def __init__(self, parent_category: BoQCategory, source_item: Item,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Position '{source_item.rno_part}' duplizieren")
         self.parent_category = parent_category
         self.source_item = source_item
         self.new_item = None
+        self.boq_index = boq_index
 
     def redo(self) -> None:
         if self.new_item is None:
-            self.new_item = deepcopy(self.source_item)
-            self.new_item.id = str(uuid.uuid4())
+            self.new_item = clone_item(self.source_item)
         idx = self.parent_category.items.index(self.source_item) + 1
         self.parent_category.items.insert(idx, self.new_item)
+        invalidate_node_caches(self.parent_category)
+        if self.boq_index is not None:
+            self.boq_index.add(self.new_item, self.parent_category)
 
     def undo(self) -> None:
         self.parent_category.items.remove(self.new_item)
+        invalidate_node_caches(self.parent_category)
+        if self.boq_index is not None:
+            self.boq_index.remove(self.new_item)
 
 
 class DuplicateCategoryCommand(BaseCommand):
     """Undoable command for duplicating a category with all children."""
 
-    def __init__(self, parent_list: list, source_category: BoQCategory):
+    def __init__(self, parent_list: list, source_category: BoQCategory,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Kategorie '{source_category.label}' duplizieren")
         self.parent_list = parent_list
         self.source_category = source_category
         self.new_category = None
+        self.boq_index = boq_index
 
     def redo(self) -> None:
         if self.new_category is None:
-            self.new_category = deepcopy(self.source_category)
-            self._assign_new_ids(self.new_category)
+            self.new_category = clone_category(self.source_category)
         idx = self.parent_list.index(self.source_category) + 1
         self.parent_list.insert(idx, self.new_category)
+        # The source is a sibling and knows the Titel owning the list
+        invalidate_parent_caches(self.source_category)
+        if self.boq_index is not None:
+            self.boq_index.add(self.new_category,
+                               self.boq_index.parent(self.source_category))
 
     def undo(self) -> None:
         self.parent_list.remove(self.new_category)
+        invalidate_parent_caches(self.source_category)
+        if self.boq_index is not None:
+            self.boq_index.remove(self.new_category)
 
-    def _assign_new_ids(self, cat: BoQCategory) -> None:
-        cat.id = str(uuid.uuid4())
-        for sub in cat.subcategories:
-            self._assign_new_ids(sub)
-        for item in cat.items:
-            item.id = str(uuid.uuid4())
@@ -1,26 +1,56 @@
+from typing import Optional
+
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.boq_index import BoQIndex
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.node_cache import invalidate_node_caches, invalidate_parent_caches
 
 
 class DragDropMoveCommand(BaseCommand):
-    """Undoable Verschiebung per Drag-and-Drop."""
+    """Undoable Verschiebung per Drag-and-Drop.
+
+    ``source_parent``/``target_parent`` are the categories owning the lists
+    (None on top level).
+    """
+
+    changes_structure = False
 
     def __init__(self, source_list: list, source_item,
                  source_index: int, target_list: list,
-                 target_index: int, description: str = ""):
+                 target_index: int, description: str = "",
+                 source_parent: Optional[BoQCategory] = None,
+                 target_parent: Optional[BoQCategory] = None,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(description or "Element per Drag-and-Drop verschoben")
         self.source_list = source_list
         self.source_item = source_item
         self.source_index = source_index
         self.target_list = target_list
         self.target_index = target_index
+        self.source_parent = source_parent
+        self.target_parent = target_parent
+        self.boq_index = boq_index
+
+    def _invalidate_hashes(self) -> None:
+        invalidate_parent_caches(self.source_item, self.source_parent)
+        invalidate_node_caches(self.target_parent)
 
     def redo(self) -> None:
+        self._invalidate_hashes()
         self.source_list.remove(self.source_item)
         idx = self.target_index
         if self.source_list is self.target_list and self.source_index < idx:
             idx -= 1
         self.target_list.insert(idx, self.source_item)
+        self._reindex(self.target_parent)
 
     def undo(self) -> None:
+        self._invalidate_hashes()
         self.target_list.remove(self.source_item)
         self.source_list.insert(self.source_index, self.source_item)
+        self._reindex(self.source_parent)
+
+    def _reindex(self, parent: Optional[BoQCategory]) -> None:
+        if self.boq_index is not None:
+            self.boq_index.remove(self.source_item)
+            self.boq_index.add(self.source_item, parent)
@@ -1,28 +1,45 @@
+from decimal import Decimal
+from typing import Any, Iterable, Optional, Sequence
+
 from PySide6.QtGui import QUndoCommand
 
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.models.money import apply_percent
+from lvgenerator.models.node_cache import invalidate_node_caches
 
 
 class EditItemPropertyCommand(BaseCommand):
     """Undoable command for changing a single property on an Item."""
 
+    changes_structure = False
+
     _merge_id_counter = 100
 
     def __init__(self, item: Item, property_name: str,
-                 old_value, new_value, description: str = ""):
+                 old_value, new_value, description: str = "",
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(description or f"Eigenschaft '{property_name}' ändern")
         self.item = item
         self.property_name = property_name
         self.old_value = old_value
         self.new_value = new_value
+        self.boq_index = boq_index
         self._id = hash(("item_prop", id(self.item), self.property_name)) % (2**31)
 
     def redo(self) -> None:
-        setattr(self.item, self.property_name, self.new_value)
+        self._set(self.new_value)
 
     def undo(self) -> None:
-        setattr(self.item, self.property_name, self.old_value)
+        self._set(self.old_value)
+
+    def _set(self, value) -> None:
+        self.item.revision += 1
+        invalidate_node_caches(self.item)
+        setattr(self.item, self.property_name, value)
+        if self.boq_index is not None and self.property_name == "rno_part":
+            self.boq_index.renumber((self.item,))
 
     def id(self) -> int:
         return self._id
@@ -38,9 +55,61 @@ class EditItemPropertyCommand(BaseCommand):
         return True
 
 
+class BulkEditItemsCommand(BaseCommand):
+    """Undoable change of one property on many items as a single step.
+
+    ``new_values`` holds one value per item. Use ``set_value`` to assign the
+    same value everywhere or ``uplift_up`` for a percentage change of the
+    unit price.
+    """
+
+    changes_structure = False
+
+    def __init__(self, items: Sequence[Item], property_name: str,
+                 new_values: Sequence[Any], description: str = ""):
+        super().__init__(
+            description
+            or f"Eigenschaft '{property_name}' für {len(items)} Positionen ändern"
+        )
+        self.items = list(items)
+        self.property_name = property_name
+        self.old_values = [getattr(item, property_name) for item in self.items]
+        self.new_values = list(new_values)
+
+    @classmethod
+    def set_value(cls, items: Iterable[Item], property_name: str,
+                  value) -> "BulkEditItemsCommand":
+        items = [item for item in items if getattr(item, property_name) != value]
+        return cls(items, property_name, [value] * len(items))
+
+    @classmethod
+    def uplift_up(cls, items: Iterable[Item], percent: Decimal) -> "BulkEditItemsCommand":
+        """EP um ``percent`` Prozent ändern; Positionen ohne EP bleiben unverändert."""
+        items = [item for item in items if item.up is not None]
+        return cls(
+            items, "up", [apply_percent(item.up, percent) for item in items],
+            description=f"EP um {percent} % ändern ({len(items)} Positionen)",
+        )
+
+    def redo(self) -> None:
+        self._apply(self.new_values)
+
+    def undo(self) -> None:
+        self._apply(self.old_values)
+
+    def _apply(self, values: list) -> None:
+        name = self.property_name
+        for item, value in zip(self.items, values):
+            item.revision += 1
+            invalidate_node_caches(item)
+            setattr(item, name, value)
+
+
 class EditItemDescriptionCommand(BaseCommand):
     """Undoable command for changing a field on ItemDescription."""
 
+    changes_structure = False
+
     def __init__(self, description: ItemDescription, field_name: str,
                  old_value: str, new_value: str):
         super().__init__(f"Beschreibung '{field_name}' ändern")
@@ -52,9 +121,13 @@ class EditItemDescriptionCommand(BaseCommand):
 
     def redo(self) -> None:
         setattr(self.description, self.field_name, self.new_value)
+        self.description.revision += 1
+        invalidate_node_caches(self.description)
 
     def undo(self) -> None:
         setattr(self.description, self.field_name, self.old_value)
+        self.description.revision += 1
+        invalidate_node_caches(self.description)
 
     def id(self) -> int:
         return self._id
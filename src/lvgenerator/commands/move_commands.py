@@ -1,9 +1,12 @@
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.node_cache import invalidate_parent_caches
 
 
 class MoveNodeCommand(BaseCommand):
     """Undoable command for moving an item or category up/down."""
 
+    changes_structure = False
+
     def __init__(self, parent_list: list, item, direction: int,
                  description: str = ""):
         super().__init__(description or "Element verschieben")
@@ -12,6 +15,7 @@ class MoveNodeCommand(BaseCommand):
         self.direction = direction  # -1 for up, +1 for down
 
     def redo(self) -> None:
+        invalidate_parent_caches(self.item)
         idx = self.parent_list.index(self.item)
         new_idx = idx + self.direction
         if 0 <= new_idx < len(self.parent_list):
@@ -21,6 +25,7 @@ class MoveNodeCommand(BaseCommand):
             )
 
     def undo(self) -> None:
+        invalidate_parent_caches(self.item)
         idx = self.parent_list.index(self.item)
         new_idx = idx - self.direction
         if 0 <= new_idx < len(self.parent_list):
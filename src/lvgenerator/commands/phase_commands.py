@@ -15,9 +15,7 @@ class PhaseConvertCommand(BaseCommand):
         self.new_project = new_project
 
     def redo(self) -> None:
-        self.main_ctrl.project = self.new_project
-        self.main_ctrl.set_project(self.new_project)
+        self.main_ctrl.show_project(self.new_project)
 
     def undo(self) -> None:
-        self.main_ctrl.project = self.old_project
-        self.main_ctrl.set_project(self.old_project)
+        self.main_ctrl.show_project(self.old_project)
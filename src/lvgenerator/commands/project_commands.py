@@ -1,11 +1,14 @@
 from PySide6.QtGui import QUndoCommand
 
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.boq import BoQ, BoQBkdn
 
 
 class EditProjectPropertyCommand(BaseCommand):
     """Undoable Änderung an Projekteigenschaften."""
 
+    changes_structure = False
+
     def __init__(self, obj, property_name: str, old_value, new_value,
                  description: str = ""):
         super().__init__(
@@ -37,3 +40,23 @@ class EditProjectPropertyCommand(BaseCommand):
             return False
         self.new_value = other.new_value
         return True
+
+
+class ChangeOZMaskCommand(BaseCommand):
+    """Undoable Änderung der OZ-Maske (BoQBkdn).
+
+    Breakdown lists are never modified in place, only replaced, so the old
+    and new list are shared with the BoQ instead of copied on every step.
+    """
+
+    def __init__(self, boq: BoQ, new_breakdowns: list[BoQBkdn]):
+        super().__init__("OZ-Maske ändern")
+        self.boq = boq
+        self.old_breakdowns = boq.info.breakdowns
+        self.new_breakdowns = new_breakdowns
+
+    def redo(self) -> None:
+        self.boq.info.breakdowns = self.new_breakdowns
+
+    def undo(self) -> None:
+        self.boq.info.breakdowns = self.old_breakdowns
@@ -1,17 +1,31 @@
+from typing import TYPE_CHECKING, Optional
+
 from lvgenerator.commands.base import BaseCommand
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.item import Item
+from lvgenerator.models.node_cache import invalidate_node_caches, invalidate_parent_caches
+
+if TYPE_CHECKING:
+    from lvgenerator.services.renumbering import RenumberPlan
 
 
 class AddCategoryCommand(BaseCommand):
-    """Undoable command for adding a category to a list."""
+    """Undoable command for adding a category to a list.
+
+    ``parent`` is the category owning ``parent_list`` (None on top level).
+    """
 
     def __init__(self, parent_list: list, category: BoQCategory,
-                 index: int = -1):
+                 index: int = -1,
+                 parent: Optional[BoQCategory] = None,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Kategorie '{category.label}' hinzufügen")
         self.parent_list = parent_list
         self.category = category
         self.index = index
+        self.parent = parent
+        self.boq_index = boq_index
 
     def redo(self) -> None:
         if self.index == -1 or self.index >= len(self.parent_list):
@@ -19,37 +33,58 @@ class AddCategoryCommand(BaseCommand):
             self.index = len(self.parent_list) - 1
         else:
             self.parent_list.insert(self.index, self.category)
+        invalidate_parent_caches(self.category, self.parent)
+        if self.boq_index is not None:
+            self.boq_index.add(self.category, self.parent)
 
     def undo(self) -> None:
         self.parent_list.remove(self.category)
+        invalidate_parent_caches(self.category, self.parent)
+        if self.boq_index is not None:
+            self.boq_index.remove(self.category)
 
 
 class DeleteCategoryCommand(BaseCommand):
-    """Undoable command for removing a category from a list."""
+    """Undoable command for removing a category from a list.
+
+    ``parent`` is the category owning ``parent_list`` (None on top level).
+    """
 
-    def __init__(self, parent_list: list, category: BoQCategory):
+    def __init__(self, parent_list: list, category: BoQCategory,
+                 parent: Optional[BoQCategory] = None,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Kategorie '{category.label}' löschen")
         self.parent_list = parent_list
         self.category = category
         self.index = -1
+        self.parent = parent
+        self.boq_index = boq_index
 
     def redo(self) -> None:
         self.index = self.parent_list.index(self.category)
         self.parent_list.remove(self.category)
+        invalidate_parent_caches(self.category, self.parent)
+        if self.boq_index is not None:
+            self.boq_index.remove(self.category)
 
     def undo(self) -> None:
         self.parent_list.insert(self.index, self.category)
+        invalidate_parent_caches(self.category, self.parent)
+        if self.boq_index is not None:
+            self.boq_index.add(self.category, self.parent)
 
 
 class AddItemCommand(BaseCommand):
     """Undoable command for adding an item to a category."""
 
     def __init__(self, parent_category: BoQCategory, item: Item,
-                 index: int = -1):
+                 index: int = -1,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Position '{item.rno_part or 'neu'}' hinzufügen")
         self.parent_category = parent_category
         self.item = item
         self.index = index
+        self.boq_index = boq_index
 
     def redo(self) -> None:
         if self.index == -1 or self.index >= len(self.parent_category.items):
@@ -57,23 +92,64 @@ class AddItemCommand(BaseCommand):
             self.index = len(self.parent_category.items) - 1
         else:
             self.parent_category.items.insert(self.index, self.item)
+        invalidate_node_caches(self.parent_category)
+        if self.boq_index is not None:
+            self.boq_index.add(self.item, self.parent_category)
 
     def undo(self) -> None:
         self.parent_category.items.remove(self.item)
+        invalidate_node_caches(self.parent_category)
+        if self.boq_index is not None:
+            self.boq_index.remove(self.item)
 
 
 class DeleteItemCommand(BaseCommand):
     """Undoable command for removing an item from a category."""
 
-    def __init__(self, parent_category: BoQCategory, item: Item):
+    def __init__(self, parent_category: BoQCategory, item: Item,
+                 boq_index: Optional[BoQIndex] = None):
         super().__init__(f"Position '{item.rno_part}' löschen")
         self.parent_category = parent_category
         self.item = item
         self.index = -1
+        self.boq_index = boq_index
 
     def redo(self) -> None:
         self.index = self.parent_category.items.index(self.item)
         self.parent_category.items.remove(self.item)
+        invalidate_node_caches(self.parent_category)
+        if self.boq_index is not None:
+            self.boq_index.remove(self.item)
 
     def undo(self) -> None:
         self.parent_category.items.insert(self.index, self.item)
+        invalidate_node_caches(self.parent_category)
+        if self.boq_index is not None:
+            self.boq_index.add(self.item, self.parent_category)
+
+
+class RenumberCommand(BaseCommand):
+    """Undoable application of a RenumberPlan (new rno_parts)."""
+
+    changes_structure = False
+
+    def __init__(self, plan: "RenumberPlan", description: str = "Neu nummerieren",
+                 boq_index: Optional[BoQIndex] = None):
+        super().__init__(description)
+        self.plan = plan
+        self.boq_index = boq_index
+
+    def redo(self) -> None:
+        self._apply(self.plan.new)
+
+    def undo(self) -> None:
+        self._apply(self.plan.old)
+
+    def _apply(self, values: tuple[str, ...]) -> None:
+        for node, value in zip(self.plan.nodes, values):
+            node.rno_part = value
+            node.revision += 1
+            # The number is part of the Titel's hash, not of the node's own
+            invalidate_parent_caches(node)
+        if self.boq_index is not None:
+            self.boq_index.renumber(self.plan.nodes)
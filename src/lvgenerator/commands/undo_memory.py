@@ -0,0 +1,206 @@
+"""Memory accounting and budget for the undo stack.
+
+Commands keep references to the data they need for undo/redo. Objects that
+are still part of the open project are shared with it and cost nothing
+extra, so only the state held exclusively by the stack is counted (deleted
+nodes, old values, the previous project of a phase conversion, ...).
+
+When the estimate exceeds the budget, the oldest undoable commands are
+evicted: their state is released and they are marked obsolete, which makes
+QUndoStack skip and drop them once they are reached. Evicted commands are
+always the bottom of the stack, so the remaining history stays consistent.
+"""
+import sys
+from dataclasses import dataclass, fields, is_dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import AbstractSet, Callable, Optional
+
+from lxml import etree
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QUndoCommand, QUndoStack
+from shiboken6 import isValid
+
+from lvgenerator.models.derived import is_derived
+from lvgenerator.models.project import GAEBProject
+
+DEFAULT_UNDO_BUDGET = 64 * 1024 * 1024
+
+_ATOMS = (str, bytes, int, float, bool, Decimal)
+
+
+def estimate_size(obj, shared: AbstractSet[int] = frozenset()) -> int:
+    """Rough deep size of model data in bytes.
+
+    Objects whose id is in ``shared`` (and everything below them) are not
+    counted. Only model data is followed: dataclasses, containers, atoms and
+    lxml elements; controllers, Qt objects and enums count as zero.
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current is None or id(current) in seen or id(current) in shared:
+            continue
+        seen.add(id(current))
+        if isinstance(current, Enum):
+            continue
+        if isinstance(current, _ATOMS):
+            size += sys.getsizeof(current)
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            size += sys.getsizeof(current)
+            stack.extend(current)
+        elif isinstance(current, dict):
+            size += sys.getsizeof(current)
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif is_dataclass(current) and not isinstance(current, type):
+            size += sys.getsizeof(current)
+            if hasattr(current, "__dict__"):
+                size += sys.getsizeof(current.__dict__)
+            # Derived caches are not part of the command data
+            stack.extend(getattr(current, f.name, None) for f in fields(current)
+                         if not is_derived(f))
+        elif etree.iselement(current):
+            size += len(etree.tostring(current))
+    return size
+
+
+def live_ids(project: Optional[GAEBProject]) -> set[int]:
+    """Ids of the project structure that commands may share for free."""
+    if project is None:
+        return set()
+    ids = {id(project)}
+    boq = project.boq
+    if boq is None:
+        return ids
+    ids.update((id(boq), id(boq.info), id(boq.info.breakdowns), id(boq.categories)))
+    ids.update(id(b) for b in boq.info.breakdowns)
+    stack = list(boq.categories)
+    while stack:
+        cat = stack.pop()
+        ids.update((id(cat), id(cat.subcategories), id(cat.items)))
+        for item in cat.items:
+            ids.add(id(item))
+            ids.add(id(item.description))
+        stack.extend(cat.subcategories)
+    return ids
+
+
+def command_size(command: QUndoCommand, shared: AbstractSet[int] = frozenset()) -> int:
+    """Estimated bytes held exclusively by ``command`` and its children."""
+    size = estimate_size(list(vars(command).values()), shared)
+    for i in range(command.childCount()):
+        size += command_size(command.child(i), shared)
+    return size
+
+
+def evict_command(command: QUndoCommand) -> None:
+    """Release the state of ``command`` and mark it obsolete."""
+    for name, value in vars(command).items():
+        if value is not None and not isinstance(value, (int, str, bool, Enum)):
+            setattr(command, name, None)
+    command.setObsolete(True)
+
+
+@dataclass(frozen=True)
+class UndoMemoryReport:
+    """Stand der Undo-Historie."""
+    commands: int
+    size: int
+    budget: int
+    evicted: int
+
+    @property
+    def size_mb(self) -> float:
+        return self.size / (1024 * 1024)
+
+
+class UndoMemoryBudget(QObject):
+    """Keeps the estimated undo memory of a QUndoStack below a budget.
+
+    ``project_getter`` returns the currently open project; its structure is
+    treated as shared. Sizes are estimated once per command when it is
+    pushed; the top command is re-estimated because merges change it.
+    The set of shared objects is kept until a command that changes the
+    structure (``changes_structure``) is done or undone, or another project
+    is opened, so plain field edits cost O(1) here.
+    """
+
+    usage_changed = Signal(object)  # UndoMemoryReport
+
+    def __init__(self, stack: QUndoStack,
+                 project_getter: Callable[[], Optional[GAEBProject]],
+                 budget: int = DEFAULT_UNDO_BUDGET, keep_last: int = 1,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._stack = stack
+        self._project_getter = project_getter
+        self.budget = budget
+        self.keep_last = keep_last
+        self._sizes: dict[int, int] = {}
+        self._evicted_total = 0
+        self._shared: Optional[set[int]] = None
+        self._shared_project: Optional[GAEBProject] = None
+        self._last_index = stack.index()
+        stack.indexChanged.connect(self._on_index_changed)
+
+    def _commands(self) -> list[QUndoCommand]:
+        return [self._stack.command(i) for i in range(self._stack.count())]
+
+    def _on_index_changed(self, _index: int) -> None:
+        # ~QUndoStack clears the stack and signals once more
+        if isValid(self._stack):
+            self.update()
+
+    def update(self) -> UndoMemoryReport:
+        """Re-estimate new commands, enforce the budget and emit a report."""
+        commands = self._commands()
+        alive = {id(cmd) for cmd in commands}
+        self._sizes = {k: v for k, v in self._sizes.items() if k in alive}
+        index = self._stack.index()
+        # Commands done or undone since the last update
+        passed = commands[min(index, self._last_index):max(index, self._last_index)]
+        self._last_index = index
+        project = self._project_getter()
+        if project is not self._shared_project or any(
+                getattr(cmd, "changes_structure", True) for cmd in passed):
+            self._shared = None
+        shared = self._shared
+        top = index - 1
+        for row, cmd in enumerate(commands):
+            if id(cmd) in self._sizes and row != top:
+                continue
+            if cmd.isObsolete():
+                self._sizes[id(cmd)] = 0
+                continue
+            if shared is None:
+                shared = self._shared = live_ids(project)
+                self._shared_project = project
+            self._sizes[id(cmd)] = command_size(cmd, shared)
+        self._enforce(commands)
+        report = self.report()
+        self.usage_changed.emit(report)
+        return report
+
+    def _enforce(self, commands: list[QUndoCommand]) -> None:
+        total = sum(self._sizes.values())
+        last_evictable = self._stack.index() - self.keep_last
+        for row, cmd in enumerate(commands):
+            if total <= self.budget or row >= last_evictable:
+                break
+            if cmd.isObsolete():
+                continue
+            total -= self._sizes.get(id(cmd), 0)
+            self._sizes[id(cmd)] = 0
+            evict_command(cmd)
+            self._evicted_total += 1
+
+    def report(self) -> UndoMemoryReport:
+        return UndoMemoryReport(
+            commands=self._stack.count(),
+            size=sum(self._sizes.values()),
+            budget=self.budget,
+            evicted=self._evicted_total,
+        )
@@ -15,8 +15,10 @@ from lvgenerator.commands.structure_commands import (
     DeleteItemCommand,
 )
 from lvgenerator.models.boq import BoQBkdn
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.validators import mask_level_for_category, mask_level_for_item
 from lvgenerator.viewmodels.boq_tree_model import BoQTreeNode
 
 
@@ -48,24 +50,6 @@ def generate_next_rno(existing_parts: list[str], mask_level: BoQBkdn) -> str:
         return str(next_num).zfill(mask_level.length)
 
 
-def _get_mask_level_for_category(
-    breakdowns: list[BoQBkdn], depth: int
-) -> Optional[BoQBkdn]:
-    """Findet die passende BoQBkdn-Ebene für eine Kategorie in gegebener Tiefe."""
-    boq_levels = [b for b in breakdowns if b.type in ("Lot", "BoQLevel")]
-    if depth < len(boq_levels):
-        return boq_levels[depth]
-    return None
-
-
-def _get_mask_level_for_item(breakdowns: list[BoQBkdn]) -> Optional[BoQBkdn]:
-    """Findet die BoQBkdn-Ebene für Positionen."""
-    for b in breakdowns:
-        if b.type == "Item":
-            return b
-    return None
-
-
 class BoQController:
     def __init__(self, main_ctrl):
         self.main = main_ctrl
@@ -95,16 +79,18 @@ class BoQController:
         node = self._get_selected_node()
 
         if node is not None and node.node_type == "category":
-            parent_list = node.data.subcategories
+            parent = node.data
+            parent_list = parent.subcategories
             depth = self._get_category_depth(node)
         else:
+            parent = None
             parent_list = self.main.project.boq.categories
             depth = 0
 
         # Auto-Nummerierung
         rno_part = ""
         breakdowns = self._get_breakdowns()
-        mask_level = _get_mask_level_for_category(breakdowns, depth)
+        mask_level = mask_level_for_category(breakdowns, depth)
         if mask_level:
             existing = [c.rno_part for c in parent_list]
             rno_part = generate_next_rno(existing, mask_level)
@@ -115,7 +101,8 @@ class BoQController:
             label="Neue Kategorie",
         )
 
-        cmd = AddCategoryCommand(parent_list, new_cat)
+        cmd = AddCategoryCommand(parent_list, new_cat, parent=parent,
+                                 boq_index=self._boq_index())
         self.main.execute_command(cmd)
 
     def add_item(self) -> None:
@@ -127,7 +114,7 @@ class BoQController:
         # Auto-Nummerierung
         rno_part = ""
         breakdowns = self._get_breakdowns()
-        mask_level = _get_mask_level_for_item(breakdowns)
+        mask_level = mask_level_for_item(breakdowns)
 
         if node is not None and node.node_type == "category":
             parent_cat: BoQCategory = node.data
@@ -139,7 +126,7 @@ class BoQController:
                 rno_part=rno_part,
                 description=ItemDescription(outline_text="Neue Position"),
             )
-            cmd = AddItemCommand(parent_cat, new_item)
+            cmd = AddItemCommand(parent_cat, new_item, boq_index=self._boq_index())
             self.main.execute_command(cmd)
         elif node is not None and node.node_type == "item":
             parent_node = node.parent_node
@@ -153,7 +140,7 @@ class BoQController:
                     rno_part=rno_part,
                     description=ItemDescription(outline_text="Neue Position"),
                 )
-                cmd = AddItemCommand(parent_cat, new_item)
+                cmd = AddItemCommand(parent_cat, new_item, boq_index=self._boq_index())
                 self.main.execute_command(cmd)
             else:
                 QMessageBox.warning(
@@ -188,12 +175,19 @@ class BoQController:
         if node.node_type == "category":
             parent_list = self._get_parent_list(node)
             if parent_list is not None:
-                cmd = DeleteCategoryCommand(parent_list, node.data)
+                parent_node = node.parent_node
+                parent = (parent_node.data if parent_node is not None
+                          and parent_node.node_type == "category" else None)
+                cmd = DeleteCategoryCommand(
+                    parent_list, node.data, parent=parent, boq_index=self._boq_index(),
+                )
                 self.main.execute_command(cmd)
         elif node.node_type == "item":
             parent_node = node.parent_node
             if parent_node and parent_node.node_type == "category":
-                cmd = DeleteItemCommand(parent_node.data, node.data)
+                cmd = DeleteItemCommand(
+                    parent_node.data, node.data, boq_index=self._boq_index(),
+                )
                 self.main.execute_command(cmd)
 
     def move_up(self) -> None:
@@ -234,14 +228,75 @@ class BoQController:
         if node.node_type == "item":
             parent_node = node.parent_node
             if parent_node and parent_node.node_type == "category":
-                cmd = DuplicateItemCommand(parent_node.data, node.data)
+                cmd = DuplicateItemCommand(
+                    parent_node.data, node.data, boq_index=self._boq_index(),
+                )
                 self.main.execute_command(cmd)
         elif node.node_type == "category":
             parent_list = self._get_parent_list(node)
             if parent_list is not None:
-                cmd = DuplicateCategoryCommand(parent_list, node.data)
+                cmd = DuplicateCategoryCommand(
+                    parent_list, node.data, boq_index=self._boq_index(),
+                )
                 self.main.execute_command(cmd)
 
+    def bulk_edit_selected(self) -> None:
+        """Change one field on all selected positions in a single undo step.
+
+        A selected category stands for all positions below it.
+        """
+        items = self._get_selected_items()
+        if not items:
+            QMessageBox.information(
+                self.main.window,
+                "Keine Positionen",
+                "Bitte wählen Sie Positionen oder Bereiche aus.",
+            )
+            return
+
+        from lvgenerator.views.bulk_edit_dialog import BulkEditDialog
+        dialog = BulkEditDialog(len(items), self.main.window)
+        if dialog.exec() != BulkEditDialog.DialogCode.Accepted:
+            return
+        cmd = dialog.create_command(items)
+        if not cmd.items:
+            return
+        self.main.execute_field_edit(cmd, cmd.items)
+
+    def _get_selected_items(self) -> list[Item]:
+        """Positions of the selected rows, including those below selected
+        categories; each position once, in tree order."""
+        if self.main.tree_model is None:
+            return []
+        selection = self.main.window.tree_view.selectionModel()
+        if selection is None:
+            return []
+        items: list[Item] = []
+        seen: set[int] = set()
+        for index in selection.selectedRows():
+            node = self.main.tree_model.get_node(self.main._get_source_index(index))
+            if node is None:
+                continue
+            if node.node_type == "item":
+                candidates = [node.data]
+            else:
+                candidates = []
+                stack = [node.data]
+                while stack:
+                    cat = stack.pop()
+                    candidates.extend(cat.items)
+                    stack.extend(reversed(cat.subcategories))
+            for item in candidates:
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    items.append(item)
+        return items
+
+    def _boq_index(self) -> Optional[BoQIndex]:
+        if self.main.project is None or self.main.project.boq is None:
+            return None
+        return self.main.project.boq.index
+
     def _get_selected_node(self) -> Optional[BoQTreeNode]:
         if self.main.tree_model is None:
             return None
@@ -1,28 +1,31 @@
-from copy import deepcopy
 from typing import Optional
 
-from PySide6.QtCore import QModelIndex
+from PySide6.QtCore import QCoreApplication, QModelIndex
 from PySide6.QtGui import QKeySequence, QShortcut, QUndoCommand, QUndoStack
 from PySide6.QtWidgets import QMenu, QMessageBox
 
 from lvgenerator.commands.drag_drop_commands import DragDropMoveCommand
 from lvgenerator.commands.phase_commands import PhaseConvertCommand
+from lvgenerator.commands.project_commands import ChangeOZMaskCommand
+from lvgenerator.commands.structure_commands import RenumberCommand
+from lvgenerator.commands.undo_memory import UndoMemoryBudget
 from lvgenerator.constants import GAEBPhase
 from lvgenerator.controllers.boq_controller import BoQController
 from lvgenerator.controllers.item_controller import ItemController
 from lvgenerator.controllers.project_controller import ProjectController
 from lvgenerator.gaeb.namespaces import get_namespace
-from lvgenerator.gaeb.phase_converter import PhaseConverter
 from lvgenerator.gaeb.phase_rules import get_rules
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.project import GAEBProject
+from lvgenerator.models.text_style_settings import text_style_settings
+from lvgenerator.services.html_prefetch import HtmlPrefetcher
+from lvgenerator.services.renumbering import (
+    RenumberPlan, plan_renumber_all, plan_renumber_subtree,
+)
 from lvgenerator.viewmodels.boq_tree_model import (
     BoQFilterProxyModel, BoQTreeModel, BoQTreeNode,
 )
-from lvgenerator.views.global_constants_dialog import GlobalConstantsDialog
 from lvgenerator.views.main_window import MainWindow
-from lvgenerator.views.oz_mask_dialog import OZMaskDialog
-from lvgenerator.views.phase_convert_dialog import PhaseConvertDialog
 
 
 class MainController:
@@ -32,10 +35,16 @@ class MainController:
         self.tree_model: Optional[BoQTreeModel] = None
         self.proxy_model: Optional[BoQFilterProxyModel] = None
         self.undo_stack = QUndoStack(self.window)
+        self.undo_memory = UndoMemoryBudget(
+            self.undo_stack, lambda: self.project, parent=self.undo_stack
+        )
 
         self.project_ctrl = ProjectController(self)
         self.boq_ctrl = BoQController(self)
         self.item_ctrl = ItemController(self)
+        self.html_prefetcher = HtmlPrefetcher()
+        # Queued conversions must not delay the interpreter exit
+        QCoreApplication.instance().aboutToQuit.connect(self.html_prefetcher.shutdown)
 
         self._connect_signals()
 
@@ -52,6 +61,8 @@ class MainController:
         # Undo/Redo
         self.window.action_undo.triggered.connect(self._do_undo)
         self.window.action_redo.triggered.connect(self._do_redo)
+        # Every command (push, undo, redo) may change values in the snapshot
+        self.undo_stack.indexChanged.connect(self._on_undo_stack_changed)
         self.undo_stack.canUndoChanged.connect(self.window.action_undo.setEnabled)
         self.undo_stack.canRedoChanged.connect(self.window.action_redo.setEnabled)
         self.undo_stack.undoTextChanged.connect(
@@ -59,6 +70,7 @@ class MainController:
                 f"Rückgängig: {t}" if t else "Rückgängig"
             )
         )
+        self.undo_memory.usage_changed.connect(self.window.update_undo_memory)
         self.undo_stack.redoTextChanged.connect(
             lambda t: self.window.action_redo.setText(
                 f"Wiederholen: {t}" if t else "Wiederholen"
@@ -72,6 +84,7 @@ class MainController:
         self.window.action_move_up.triggered.connect(self.boq_ctrl.move_up)
         self.window.action_move_down.triggered.connect(self.boq_ctrl.move_down)
         self.window.action_duplicate.triggered.connect(self.boq_ctrl.duplicate_selected)
+        self.window.action_bulk_edit.triggered.connect(self.boq_ctrl.bulk_edit_selected)
         self.window.action_convert_phase.triggered.connect(self._on_convert_phase)
         self.window.action_project_info.triggered.connect(self._on_show_project_info)
 
@@ -88,6 +101,9 @@ class MainController:
         self.window.action_renumber_all.triggered.connect(
             self._on_renumber_all
         )
+        self.window.action_renumber_gaps.triggered.connect(
+            self._on_renumber_gaps
+        )
 
         # About
         self.window.action_about.triggered.connect(self._show_about)
@@ -116,15 +132,37 @@ class MainController:
         search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self.window)
         search_shortcut.activated.connect(self.window.search_bar.focus_search)
 
+    def _on_undo_stack_changed(self, _index: int) -> None:
+        if self.project is not None and self.project.boq is not None:
+            # The commands keep the index current; values may have changed
+            self.project.boq.invalidate_snapshot()
+
     def execute_command(self, command: QUndoCommand) -> None:
         """Push a command onto the undo stack and refresh the tree."""
         self.undo_stack.push(command)
         self.refresh_tree()
 
+    def execute_field_edit(self, command: QUndoCommand, nodes: list) -> None:
+        """Push a command that only changes field values of ``nodes``.
+
+        The tree structure stays, so the model only reports the changed
+        rows instead of being rebuilt; the proxy re-filters just these.
+        """
+        self.undo_stack.push(command)
+        if self.tree_model is not None:
+            self.tree_model.nodes_changed(nodes)
+        self._update_status_counts()
+        # Reload the editor in case the current position was changed
+        self._on_tree_selection(self.window.tree_view.currentIndex())
+
     def set_project(self, project: GAEBProject) -> None:
-        self.project = project
         self.undo_stack.clear()
+        self.html_prefetcher.shutdown()
+        self.show_project(project)
 
+    def show_project(self, project: GAEBProject) -> None:
+        """Display ``project`` without touching the undo history."""
+        self.project = project
         self.tree_model = BoQTreeModel()
         self.tree_model.set_project(project)
 
@@ -144,6 +182,9 @@ class MainController:
         # Pass undo stack to editors
         self.window.item_editor.set_undo_stack(self.undo_stack)
         self.window.category_editor.set_undo_stack(self.undo_stack)
+        boq_index = project.boq.index if project.boq is not None else None
+        self.window.item_editor.set_boq_index(boq_index)
+        self.window.category_editor.set_boq_index(boq_index)
         self.window.project_info_editor.set_undo_stack(self.undo_stack)
         self.window.project_info_editor.set_project(project)
 
@@ -251,6 +292,7 @@ class MainController:
             if total is not None:
                 info += f" | GP: {total}"
             self.window.update_selection_info(info)
+            self._prefetch_neighbours(index)
         elif node.node_type == "category":
             self.window.category_editor.set_category(node.data)
             self.window.show_category_editor()
@@ -263,10 +305,31 @@ class MainController:
             self.window.show_empty_editor()
             self.window.update_selection_info("")
 
+    def _prefetch_neighbours(self, index: QModelIndex) -> None:
+        """Convert the texts of the positions above and below in the background."""
+        view = self.window.tree_view
+        items = []
+        for step in (view.indexBelow, view.indexAbove):
+            neighbour = index
+            for _ in range(self.html_prefetcher.radius):
+                neighbour = step(neighbour)
+                if not neighbour.isValid():
+                    break
+                node = self.tree_model.get_node(self._get_source_index(neighbour))
+                if node is not None and node.node_type == "item":
+                    items.append(node.data)
+        if items:
+            settings = text_style_settings.get_settings()
+            self.html_prefetcher.prefetch(
+                items, settings.font_family, settings.font_size_pt
+            )
+
     def _on_convert_phase(self) -> None:
         if self.project is None or self.project.phase is None:
             return
 
+        from lvgenerator.gaeb.phase_converter import PhaseConverter
+        from lvgenerator.views.phase_convert_dialog import PhaseConvertDialog
         converter = PhaseConverter()
         dialog = PhaseConvertDialog(
             self.project.phase, converter, self.window
@@ -287,8 +350,8 @@ class MainController:
                 "\n".join(result.warnings),
             )
 
-        old_project = deepcopy(self.project)
-        cmd = PhaseConvertCommand(self, old_project, result.project)
+        # The converter works on a deep copy, the current project stays untouched
+        cmd = PhaseConvertCommand(self, self.project, result.project)
         self.undo_stack.push(cmd)
 
     def _on_show_project_info(self) -> None:
@@ -326,13 +389,14 @@ class MainController:
         source_index = source_list.index(source_data)
 
         # Find target list
+        target_cat: Optional[BoQCategory] = None
         if target_parent is None:
             # Drop at root level — only for categories
             if source_node.node_type == "item":
                 return
             target_list = self.project.boq.categories
         else:
-            target_cat: BoQCategory = target_parent.data
+            target_cat = target_parent.data
             if source_node.node_type == "item":
                 target_list = target_cat.items
             else:
@@ -341,46 +405,21 @@ class MainController:
         cmd = DragDropMoveCommand(
             source_list, source_data, source_index,
             target_list, target_row,
+            source_parent=self.project.boq.index.parent(source_data),
+            target_parent=target_cat,
+            boq_index=self.project.boq.index,
         )
         self.execute_command(cmd)
 
     def _find_item_parent_list(self, item) -> Optional[list]:
         if self.project is None or self.project.boq is None:
             return None
-        return self._search_item_in_categories(
-            self.project.boq.categories, item
-        )
-
-    def _search_item_in_categories(self, categories, item) -> Optional[list]:
-        for cat in categories:
-            if item in cat.items:
-                return cat.items
-            result = self._search_item_in_categories(
-                cat.subcategories, item
-            )
-            if result is not None:
-                return result
-        return None
+        return self.project.boq.index.parent_list(item)
 
     def _find_category_parent_list(self, cat) -> Optional[list]:
         if self.project is None or self.project.boq is None:
             return None
-        if cat in self.project.boq.categories:
-            return self.project.boq.categories
-        return self._search_cat_in_categories(
-            self.project.boq.categories, cat
-        )
-
-    def _search_cat_in_categories(self, categories, target) -> Optional[list]:
-        for cat in categories:
-            if target in cat.subcategories:
-                return cat.subcategories
-            result = self._search_cat_in_categories(
-                cat.subcategories, target
-            )
-            if result is not None:
-                return result
-        return None
+        return self.project.boq.index.parent_list(cat)
 
     def _on_context_menu(self, pos) -> None:
         index = self.window.tree_view.indexAt(pos)
@@ -394,6 +433,7 @@ class MainController:
                 menu.addAction(self.window.action_add_item)
                 menu.addSeparator()
                 menu.addAction(self.window.action_duplicate)
+                menu.addAction(self.window.action_bulk_edit)
                 menu.addSeparator()
                 menu.addAction(self.window.action_move_up)
                 menu.addAction(self.window.action_move_down)
@@ -402,10 +442,12 @@ class MainController:
                 menu.addSeparator()
                 menu.addAction(self.window.action_renumber_category)
                 menu.addAction(self.window.action_renumber_all)
+                menu.addAction(self.window.action_renumber_gaps)
             elif node and node.node_type == "item":
                 menu.addAction(self.window.action_add_item)
                 menu.addSeparator()
                 menu.addAction(self.window.action_duplicate)
+                menu.addAction(self.window.action_bulk_edit)
                 menu.addSeparator()
                 menu.addAction(self.window.action_move_up)
                 menu.addAction(self.window.action_move_down)
@@ -414,11 +456,13 @@ class MainController:
                 menu.addSeparator()
                 menu.addAction(self.window.action_renumber_category)
                 menu.addAction(self.window.action_renumber_all)
+                menu.addAction(self.window.action_renumber_gaps)
         else:
             menu.addAction(self.window.action_add_category)
             if self.project and self.project.boq:
                 menu.addSeparator()
                 menu.addAction(self.window.action_renumber_all)
+                menu.addAction(self.window.action_renumber_gaps)
 
         menu.exec(self.window.tree_view.viewport().mapToGlobal(pos))
 
@@ -434,26 +478,18 @@ class MainController:
         if self.project is None or self.project.boq is None:
             self.window.update_counts(0, 0)
             return
-        cat_count, item_count = self._count_recursive(
-            self.project.boq.categories
-        )
-        self.window.update_counts(cat_count, item_count)
-
-    def _count_recursive(self, categories: list) -> tuple[int, int]:
-        cats = len(categories)
-        items = 0
-        for cat in categories:
-            items += len(cat.items)
-            sub_cats, sub_items = self._count_recursive(cat.subcategories)
-            cats += sub_cats
-            items += sub_items
-        return cats, items
+        stats = self.project.boq.statistics
+        self.window.update_counts(stats.categories, stats.items, stats.grand_total)
 
     def _on_global_constants(self) -> None:
+        from lvgenerator.views.global_constants_dialog import GlobalConstantsDialog
         dialog = GlobalConstantsDialog(self.window)
         if dialog.exec() == GlobalConstantsDialog.DialogCode.Accepted:
             # Refresh formula results in the item editor
             self.window.item_editor.refresh_formula()
+            if self.project is not None and self.project.boq is not None:
+                self.project.boq.invalidate()
+                self._update_status_counts()
 
     def _on_oz_mask(self) -> None:
         if self.project is None or self.project.boq is None:
@@ -464,30 +500,13 @@ class MainController:
             )
             return
 
-        from copy import deepcopy
-        from lvgenerator.commands.base import BaseCommand
-
-        old_breakdowns = deepcopy(self.project.boq.info.breakdowns)
-        dialog = OZMaskDialog(old_breakdowns, self.window)
+        from lvgenerator.views.oz_mask_dialog import OZMaskDialog
+        # The dialog edits its own copy
+        dialog = OZMaskDialog(self.project.boq.info.breakdowns, self.window)
         if dialog.exec() != OZMaskDialog.DialogCode.Accepted:
             return
 
-        new_breakdowns = dialog.get_breakdowns()
-
-        class ChangeOZMaskCommand(BaseCommand):
-            def __init__(cmd_self, project, old_bk, new_bk):
-                super().__init__("OZ-Maske ändern")
-                cmd_self._project = project
-                cmd_self._old = old_bk
-                cmd_self._new = new_bk
-
-            def redo(cmd_self) -> None:
-                cmd_self._project.boq.info.breakdowns = deepcopy(cmd_self._new)
-
-            def undo(cmd_self) -> None:
-                cmd_self._project.boq.info.breakdowns = deepcopy(cmd_self._old)
-
-        cmd = ChangeOZMaskCommand(self.project, old_breakdowns, new_breakdowns)
+        cmd = ChangeOZMaskCommand(self.project.boq, dialog.get_breakdowns())
         self.execute_command(cmd)
 
     def _on_text_style(self) -> None:
@@ -512,114 +531,59 @@ class MainController:
         dialog.exec()
 
     def _on_renumber_category(self) -> None:
-        """Renumber items within the selected category."""
+        """Renumber everything below the selected category (or the category
+        of the selected position)."""
         if self.project is None or self.project.boq is None:
             return
         node = self.boq_ctrl._get_selected_node()
-        if node is None:
+        if node is not None and node.node_type == "item":
+            node = node.parent_node
+        if node is None or node.node_type != "category":
+            return
+        breakdowns = self._renumber_breakdowns()
+        if breakdowns is None:
             return
+        depth = self.boq_ctrl._get_category_depth(node) - 1
+        plan = plan_renumber_subtree(node.data, depth, breakdowns)
+        self._apply_renumber_plan(plan, "Bereich neu nummerieren")
 
-        # Find the category to renumber
-        if node.node_type == "category":
-            category = node.data
-        elif node.node_type == "item" and node.parent_node:
-            category = node.parent_node.data
-        else:
+    def _on_renumber_all(self) -> None:
+        """Renumber the entire LV (all Lots, levels and items)."""
+        if self.project is None or self.project.boq is None:
             return
+        breakdowns = self._renumber_breakdowns()
+        if breakdowns is None:
+            return
+        plan = plan_renumber_all(self.project.boq.categories, breakdowns)
+        self._apply_renumber_plan(plan, "Gesamtes LV neu nummerieren")
 
-        from lvgenerator.controllers.boq_controller import (
-            _get_mask_level_for_item,
+    def _on_renumber_gaps(self) -> None:
+        """Give numbers only to missing, invalid or out-of-order OZ."""
+        if self.project is None or self.project.boq is None:
+            return
+        breakdowns = self._renumber_breakdowns()
+        if breakdowns is None:
+            return
+        plan = plan_renumber_all(
+            self.project.boq.categories, breakdowns, gaps_only=True
         )
+        self._apply_renumber_plan(plan, "Fehlende OZ vergeben")
+
+    def _renumber_breakdowns(self) -> Optional[list]:
         breakdowns = self.boq_ctrl._get_breakdowns()
-        mask_level = _get_mask_level_for_item(breakdowns)
-        if not mask_level:
+        if not breakdowns:
             QMessageBox.information(
                 self.window,
                 "Keine OZ-Maske",
                 "Bitte konfigurieren Sie zuerst eine OZ-Maske.",
             )
-            return
-
-        # Build list of (object, old_rno, new_rno)
-        changes = []
-        for i, item in enumerate(category.items):
-            new_rno = str(i + 1).zfill(mask_level.length)
-            if item.rno_part != new_rno:
-                changes.append((item, item.rno_part, new_rno))
-
-        if not changes:
-            return
-
-        from lvgenerator.commands.base import BaseCommand
-
-        class RenumberCommand(BaseCommand):
-            def __init__(cmd_self, changes_list, desc):
-                super().__init__(desc)
-                cmd_self._changes = changes_list
-
-            def redo(cmd_self) -> None:
-                for obj, _old, new in cmd_self._changes:
-                    obj.rno_part = new
-
-            def undo(cmd_self) -> None:
-                for obj, old, _new in cmd_self._changes:
-                    obj.rno_part = old
-
-        cmd = RenumberCommand(changes, "Bereich neu nummerieren")
-        self.execute_command(cmd)
-
-    def _on_renumber_all(self) -> None:
-        """Renumber the entire LV (all categories and items)."""
-        if self.project is None or self.project.boq is None:
-            return
-
-        from lvgenerator.controllers.boq_controller import (
-            _get_mask_level_for_category,
-            _get_mask_level_for_item,
-        )
-        breakdowns = self.boq_ctrl._get_breakdowns()
-        item_mask = _get_mask_level_for_item(breakdowns)
-
-        changes = []
-
-        def renumber_categories(categories, depth):
-            cat_mask = _get_mask_level_for_category(breakdowns, depth)
-            for i, cat in enumerate(categories):
-                if cat_mask:
-                    new_rno = str(i + 1).zfill(cat_mask.length)
-                    if cat.rno_part != new_rno:
-                        changes.append((cat, cat.rno_part, new_rno))
-                # Renumber items within this category
-                if item_mask:
-                    for j, item in enumerate(cat.items):
-                        new_rno = str(j + 1).zfill(item_mask.length)
-                        if item.rno_part != new_rno:
-                            changes.append((item, item.rno_part, new_rno))
-                # Recurse into subcategories
-                renumber_categories(cat.subcategories, depth + 1)
-
-        renumber_categories(self.project.boq.categories, 0)
-
-        if not changes:
-            return
-
-        from lvgenerator.commands.base import BaseCommand
-
-        class RenumberCommand(BaseCommand):
-            def __init__(cmd_self, changes_list, desc):
-                super().__init__(desc)
-                cmd_self._changes = changes_list
-
-            def redo(cmd_self) -> None:
-                for obj, _old, new in cmd_self._changes:
-                    obj.rno_part = new
-
-            def undo(cmd_self) -> None:
-                for obj, old, _new in cmd_self._changes:
-                    obj.rno_part = old
+            return None
+        return breakdowns
 
-        cmd = RenumberCommand(changes, "Gesamtes LV neu nummerieren")
-        self.execute_command(cmd)
+    def _apply_renumber_plan(self, plan: RenumberPlan, description: str) -> None:
+        if plan:
+            cmd = RenumberCommand(plan, description, boq_index=self.project.boq.index)
+            self.execute_field_edit(cmd, plan.nodes)
 
     def _show_about(self) -> None:
         QMessageBox.about(
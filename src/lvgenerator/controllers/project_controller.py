@@ -1,31 +1,38 @@
 import uuid
 from datetime import date
+from functools import cached_property
 from typing import Optional
 
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
 from lvgenerator.constants import GAEBPhase
-from lvgenerator.export.excel_exporter import ExcelExporter
 from lvgenerator.gaeb.formula_persistence import load_formula_metadata, save_formula_metadata
 from lvgenerator.gaeb.phase_rules import get_rules
-from lvgenerator.gaeb.reader import GAEBReader
-from lvgenerator.gaeb.writer import GAEBWriter
 from lvgenerator.models.boq import BoQ, BoQBkdn, BoQInfo
 from lvgenerator.models.project import AwardInfo, GAEBInfo, GAEBProject, PrjInfo
 from lvgenerator.services.recent_files import RecentFilesManager
-from lvgenerator.views.phase_selector import PhaseSelectDialog
 
 
 class ProjectController:
     def __init__(self, main_ctrl):
         self.main = main_ctrl
-        self.reader = GAEBReader()
-        self.writer = GAEBWriter()
         self._current_file_path: Optional[str] = None
         self._recent_files = RecentFilesManager()
         self._update_recent_menu()
 
+    # Reader and writer pull in lxml; created on first open/save
+    @cached_property
+    def reader(self):
+        from lvgenerator.gaeb.reader import GAEBReader
+        return GAEBReader()
+
+    @cached_property
+    def writer(self):
+        from lvgenerator.gaeb.writer import GAEBWriter
+        return GAEBWriter()
+
     def new_project(self) -> None:
+        from lvgenerator.views.phase_selector import PhaseSelectDialog
         dialog = PhaseSelectDialog(self.main.window)
         if dialog.exec() != PhaseSelectDialog.Accepted:
             return
@@ -142,6 +149,7 @@ class ProjectController:
             return
 
         try:
+            from lvgenerator.export.excel_exporter import ExcelExporter
             exporter = ExcelExporter()
             exporter.export(self.main.project, file_path)
             self.main.window.status_bar.showMessage(
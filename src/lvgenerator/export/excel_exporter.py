@@ -1,12 +1,11 @@
-from decimal import Decimal
 from typing import Optional
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
 
 from lvgenerator.constants import GAEBPhase
+from lvgenerator.export.xlsx_writer import StreamingSheetWriter
 from lvgenerator.gaeb.phase_rules import get_rules
+from lvgenerator.models.boq_statistics import category_statistics
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.item import Item
 from lvgenerator.models.project import GAEBProject
@@ -23,51 +22,70 @@ class ExcelExporter:
     NUMBER_FORMAT = '#,##0.00'
     QTY_FORMAT = '#,##0.000'
 
+    MIN_WIDTHS = {"OZ": 12, "Kurztext": 30, "Langtext": 40, "Menge": 12,
+                  "Einheit": 10, "EP": 14, "GP": 14}
+
+    # Named styles (created once per export, referenced by name per cell)
+    S_HEADER = "lv_header"
+    S_COL_HEADER = "lv_col_header"
+    S_CATEGORY = "lv_category"
+    S_CATEGORY_FILL = "lv_category_fill"
+    S_CATEGORY_TOTAL = "lv_category_total"
+    S_WRAP = "lv_wrap"
+    S_QTY = "lv_qty"
+    S_NUMBER = "lv_number"
+    S_TOTAL_LABEL = "lv_total_label"
+    S_TOTAL = "lv_total"
+
+    def _named_styles(self) -> list[NamedStyle]:
+        return [
+            NamedStyle(self.S_HEADER, font=self.HEADER_FONT),
+            NamedStyle(self.S_COL_HEADER, font=self.COL_HEADER_FONT),
+            NamedStyle(self.S_CATEGORY, font=self.CATEGORY_FONT, fill=self.CATEGORY_FILL),
+            NamedStyle(self.S_CATEGORY_FILL, fill=self.CATEGORY_FILL),
+            NamedStyle(self.S_CATEGORY_TOTAL, font=self.TOTAL_FONT, fill=self.CATEGORY_FILL,
+                       number_format=self.NUMBER_FORMAT),
+            NamedStyle(self.S_WRAP, alignment=Alignment(wrap_text=True)),
+            NamedStyle(self.S_QTY, number_format=self.QTY_FORMAT),
+            NamedStyle(self.S_NUMBER, number_format=self.NUMBER_FORMAT),
+            NamedStyle(self.S_TOTAL_LABEL, font=self.TOTAL_FONT),
+            NamedStyle(self.S_TOTAL, font=self.TOTAL_FONT, number_format=self.NUMBER_FORMAT),
+        ]
+
     def export(self, project: GAEBProject, file_path: str) -> None:
         """Exportiert das Projekt nach Excel."""
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Leistungsverzeichnis"
-
         rules = get_rules(project.phase)
         headers = self._get_headers(rules)
+        sheet = StreamingSheetWriter(
+            "Leistungsverzeichnis",
+            self._named_styles(),
+            [self.MIN_WIDTHS.get(h, 12) for h in headers],
+        )
 
         # Projektkopf
-        ws.cell(row=1, column=1, value=project.prj_info.name).font = self.HEADER_FONT
-        ws.cell(row=2, column=1,
-                value=f"Phase: {project.phase.name} - {project.phase.label_de}")
+        sheet.append([(project.prj_info.name, self.S_HEADER)], measure=False)
+        sheet.append(
+            [f"Phase: {project.phase.name} - {project.phase.label_de}"], measure=False
+        )
+        sheet.append([])
 
         # Spaltenüberschriften
-        row = 4
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.COL_HEADER_FONT
-        row += 1
+        sheet.append([(header, self.S_COL_HEADER) for header in headers])
 
         # Daten
         if project.boq:
-            row = self._write_categories(
-                ws, project.boq.categories, rules, headers, row, ""
-            )
+            self._write_categories(sheet, project.boq.categories, rules, headers, "")
 
             # Gesamtsumme
             if rules.has_totals and project.boq.categories:
-                grand_total = Decimal("0.00")
-                has_any = False
-                for cat in project.boq.categories:
-                    t = cat.calculate_total()
-                    if t is not None:
-                        grand_total += t
-                        has_any = True
-                if has_any:
-                    gp_col = len(headers)
-                    ws.cell(row=row, column=1, value="Gesamtsumme").font = self.TOTAL_FONT
-                    cell = ws.cell(row=row, column=gp_col, value=float(grand_total))
-                    cell.number_format = self.NUMBER_FORMAT
-                    cell.font = self.TOTAL_FONT
-
-        self._auto_fit_columns(ws, headers)
-        wb.save(file_path)
+                grand_total = project.boq.statistics.grand_total
+                if grand_total is not None:
+                    row: list = [None] * len(headers)
+                    row[0] = ("Gesamtsumme", self.S_TOTAL_LABEL)
+                    row[-1] = (float(grand_total), self.S_TOTAL)
+                    sheet.append(row)
+
+        sheet.save(file_path)
 
     def _get_headers(self, rules) -> list[str]:
         headers = ["OZ", "Kurztext", "Langtext"]
@@ -79,76 +97,46 @@ class ExcelExporter:
             headers.append("GP")
         return headers
 
-    def _write_categories(self, ws, categories: list[BoQCategory],
-                          rules, headers: list[str],
-                          row: int, parent_oz: str) -> int:
+    def _write_categories(self, sheet: StreamingSheetWriter,
+                          categories: list[BoQCategory],
+                          rules, headers: list[str], parent_oz: str) -> None:
         for cat in categories:
             oz = f"{parent_oz}.{cat.rno_part}" if parent_oz else cat.rno_part
             # Kategoriezeile
-            ws.cell(row=row, column=1, value=oz).font = self.CATEGORY_FONT
-            ws.cell(row=row, column=2, value=cat.label).font = self.CATEGORY_FONT
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row, column=col).fill = self.CATEGORY_FILL
-
+            row: list = [(None, self.S_CATEGORY_FILL)] * len(headers)
+            row[0] = (oz, self.S_CATEGORY)
+            row[1] = (cat.label, self.S_CATEGORY)
             if rules.has_totals:
-                total = cat.calculate_total()
+                total = category_statistics(cat).grand_total
                 if total is not None:
-                    gp_col = len(headers)
-                    cell = ws.cell(row=row, column=gp_col, value=float(total))
-                    cell.number_format = self.NUMBER_FORMAT
-                    cell.font = self.TOTAL_FONT
-                    cell.fill = self.CATEGORY_FILL
-            row += 1
+                    row[-1] = (float(total), self.S_CATEGORY_TOTAL)
+            sheet.append(row)
 
             # Unterkategorien
-            row = self._write_categories(
-                ws, cat.subcategories, rules, headers, row, oz
-            )
+            self._write_categories(sheet, cat.subcategories, rules, headers, oz)
 
             # Positionen
             for item in cat.items:
-                row = self._write_item(ws, item, rules, headers, row, oz)
-
-        return row
+                self._write_item(sheet, item, rules, oz)
 
-    def _write_item(self, ws, item: Item, rules, headers: list[str],
-                    row: int, parent_oz: str) -> int:
-        col = 1
+    def _write_item(self, sheet: StreamingSheetWriter, item: Item, rules,
+                    parent_oz: str) -> None:
         full_oz = f"{parent_oz}.{item.rno_part}" if parent_oz else item.rno_part
-        ws.cell(row=row, column=col, value=full_oz)
-        col += 1
-        ws.cell(row=row, column=col, value=item.description.outline_text)
-        col += 1
-        detail = item.description.detail_text
-        cell = ws.cell(row=row, column=col, value=detail)
-        cell.alignment = Alignment(wrap_text=True)
-        col += 1
+        row: list = [
+            full_oz,
+            item.description.outline_text,
+            (item.description.detail_text, self.S_WRAP),
+        ]
 
         if rules.has_quantities:
-            if item.qty is not None:
-                c = ws.cell(row=row, column=col, value=float(item.qty))
-                c.number_format = self.QTY_FORMAT
-            col += 1
-            ws.cell(row=row, column=col, value=item.qu)
-            col += 1
+            row.append((float(item.qty), self.S_QTY) if item.qty is not None else None)
+            row.append(item.qu)
 
         if rules.has_prices:
-            if item.up is not None:
-                c = ws.cell(row=row, column=col, value=float(item.up))
-                c.number_format = self.NUMBER_FORMAT
-            col += 1
+            row.append((float(item.up), self.S_NUMBER) if item.up is not None else None)
 
         if rules.has_totals:
             total = item.it if item.it is not None else item.calculate_total()
-            if total is not None:
-                c = ws.cell(row=row, column=col, value=float(total))
-                c.number_format = self.NUMBER_FORMAT
-
-        return row + 1
-
-    def _auto_fit_columns(self, ws, headers: list[str]) -> None:
-        min_widths = {"OZ": 12, "Kurztext": 30, "Langtext": 40, "Menge": 12,
-                      "Einheit": 10, "EP": 14, "GP": 14}
-        for col, header in enumerate(headers, 1):
-            width = min_widths.get(header, 12)
-            ws.column_dimensions[get_column_letter(col)].width = width
+            row.append((float(total), self.S_NUMBER) if total is not None else None)
+
+        sheet.append(row)
@@ -1,10 +1,9 @@
 from decimal import Decimal
 from typing import Optional
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
 
+from lvgenerator.export.xlsx_writer import StreamingSheetWriter
 from lvgenerator.models.preisspiegel import (
     PreisSpiegel,
     PreisSpiegelCategoryRow,
@@ -28,40 +27,68 @@ class PreisSpiegelExporter:
     NUMBER_FORMAT = '#,##0.00'
     QTY_FORMAT = '#,##0.000'
 
-    def export(self, spiegel: PreisSpiegel, file_path: str) -> None:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Preisspiegel"
+    # Named styles (created once per export, referenced by name per cell)
+    S_HEADER = "ps_header"
+    S_SUB_HEADER = "ps_sub_header"
+    S_COL_HEADER = "ps_col_header"
+    S_CATEGORY = "ps_category"
+    S_CATEGORY_FILL = "ps_category_fill"
+    S_CATEGORY_TOTAL = "ps_category_total"
+    S_QTY = "ps_qty"
+    S_NUMBER = "ps_number"
+    S_NUMBER_MIN = "ps_number_min"
+    S_NUMBER_MAX = "ps_number_max"
+    S_TOTAL_LABEL = "ps_total_label"
+    S_TOTAL = "ps_total"
+
+    def _named_styles(self) -> list[NamedStyle]:
+        return [
+            NamedStyle(self.S_HEADER, font=self.HEADER_FONT),
+            NamedStyle(self.S_SUB_HEADER, font=self.SUB_HEADER_FONT),
+            NamedStyle(self.S_COL_HEADER, font=self.COL_HEADER_FONT_WHITE,
+                       fill=self.COL_HEADER_FILL,
+                       alignment=Alignment(horizontal="center", wrap_text=True)),
+            NamedStyle(self.S_CATEGORY, font=self.CATEGORY_FONT, fill=self.CATEGORY_FILL),
+            NamedStyle(self.S_CATEGORY_FILL, fill=self.CATEGORY_FILL),
+            NamedStyle(self.S_CATEGORY_TOTAL, font=self.TOTAL_FONT, fill=self.CATEGORY_FILL,
+                       number_format=self.NUMBER_FORMAT),
+            NamedStyle(self.S_QTY, number_format=self.QTY_FORMAT),
+            NamedStyle(self.S_NUMBER, number_format=self.NUMBER_FORMAT),
+            NamedStyle(self.S_NUMBER_MIN, fill=self.MIN_FILL,
+                       number_format=self.NUMBER_FORMAT),
+            NamedStyle(self.S_NUMBER_MAX, fill=self.MAX_FILL,
+                       number_format=self.NUMBER_FORMAT),
+            NamedStyle(self.S_TOTAL_LABEL, font=self.TOTAL_FONT),
+            NamedStyle(self.S_TOTAL, font=self.TOTAL_FONT, number_format=self.NUMBER_FORMAT),
+        ]
 
+    def export(self, spiegel: PreisSpiegel, file_path: str) -> None:
         n = len(spiegel.bidders)
+        headers = self._get_headers(spiegel)
+        sheet = StreamingSheetWriter(
+            "Preisspiegel", self._named_styles(), self._min_widths(headers),
+        )
 
         # Header
-        ws.cell(row=1, column=1, value=spiegel.project_name).font = self.HEADER_FONT
-        ws.cell(row=2, column=1, value="Preisspiegel").font = self.SUB_HEADER_FONT
+        sheet.append([(spiegel.project_name, self.S_HEADER)], measure=False)
+        sheet.append([("Preisspiegel", self.S_SUB_HEADER)], measure=False)
+        sheet.append([])
 
-        # Column headers
-        headers = self._get_headers(spiegel)
-        row = 4
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = self.COL_HEADER_FONT_WHITE
-            cell.fill = self.COL_HEADER_FILL
-            cell.alignment = Alignment(horizontal="center", wrap_text=True)
-        row += 1
+        # Column headers (bidder names wrap instead of widening the column)
+        sheet.append([(header, self.S_COL_HEADER) for header in headers], measure=False)
 
         # Data rows
         for data_row in spiegel.rows:
             if isinstance(data_row, PreisSpiegelCategoryRow):
-                row = self._write_category_row(ws, data_row, headers, row, n)
+                self._write_category_row(sheet, data_row, headers)
             else:
-                row = self._write_item_row(ws, data_row, headers, row, n)
+                self._write_item_row(sheet, data_row, n)
 
         # Grand total
         if spiegel.grand_totals:
-            self._write_grand_total(ws, spiegel, headers, row, n)
+            self._write_grand_total(sheet, spiegel, headers)
 
-        self._auto_fit_columns(ws, headers, n)
-        wb.save(file_path)
+        sheet.save(file_path)
 
     def _get_headers(self, spiegel: PreisSpiegel) -> list[str]:
         headers = ["OZ", "Kurztext", "Menge", "Einheit"]
@@ -72,104 +99,81 @@ class PreisSpiegelExporter:
         return headers
 
     def _write_category_row(
-        self, ws, cat_row: PreisSpiegelCategoryRow,
-        headers: list[str], row: int, n: int,
-    ) -> int:
-        total_cols = len(headers)
-        ws.cell(row=row, column=1, value=cat_row.oz).font = self.CATEGORY_FONT
-        ws.cell(row=row, column=2, value=cat_row.label).font = self.CATEGORY_FONT
-        for col in range(1, total_cols + 1):
-            ws.cell(row=row, column=col).fill = self.CATEGORY_FILL
+        self, sheet: StreamingSheetWriter, cat_row: PreisSpiegelCategoryRow,
+        headers: list[str],
+    ) -> None:
+        row: list = [(None, self.S_CATEGORY_FILL)] * len(headers)
+        row[0] = (cat_row.oz, self.S_CATEGORY)
+        row[1] = (cat_row.label, self.S_CATEGORY)
 
         # Category totals (GP columns only)
         for i, total in enumerate(cat_row.totals):
             if total is not None:
-                gp_col = 4 + i * 2 + 2  # GP column for bidder i
-                cell = ws.cell(row=row, column=gp_col, value=float(total))
-                cell.number_format = self.NUMBER_FORMAT
-                cell.font = self.TOTAL_FONT
-                cell.fill = self.CATEGORY_FILL
+                row[4 + i * 2 + 1] = (float(total), self.S_CATEGORY_TOTAL)
 
-        return row + 1
+        sheet.append(row)
 
     def _write_item_row(
-        self, ws, item_row: PreisSpiegelRow,
-        headers: list[str], row: int, n: int,
-    ) -> int:
-        col = 1
-        ws.cell(row=row, column=col, value=item_row.oz)
-        col += 1
-        ws.cell(row=row, column=col, value=item_row.short_text)
-        col += 1
-
-        if item_row.qty is not None:
-            c = ws.cell(row=row, column=col, value=float(item_row.qty))
-            c.number_format = self.QTY_FORMAT
-        col += 1
-        ws.cell(row=row, column=col, value=item_row.qu)
-        col += 1
+        self, sheet: StreamingSheetWriter, item_row: PreisSpiegelRow, n: int,
+    ) -> None:
+        row: list = [
+            item_row.oz,
+            item_row.short_text,
+            self._number(item_row.qty, self.S_QTY),
+            item_row.qu,
+        ]
 
         # Bidder EP/GP pairs
         for i in range(n):
-            # EP
             if item_row.not_offered[i]:
-                ws.cell(row=row, column=col, value="n.a.")
-            elif item_row.unit_prices[i] is not None:
-                c = ws.cell(row=row, column=col, value=float(item_row.unit_prices[i]))
-                c.number_format = self.NUMBER_FORMAT
-                # Highlight min/max
-                if item_row.min_up is not None and item_row.unit_prices[i] == item_row.min_up and n > 1:
-                    c.fill = self.MIN_FILL
-                if item_row.max_up is not None and item_row.unit_prices[i] == item_row.max_up and n > 1:
-                    c.fill = self.MAX_FILL
-            col += 1
+                row.append("n.a.")
+                row.append("n.a.")
+                continue
+
+            # EP, highlight min/max
+            up = item_row.unit_prices[i]
+            style = self.S_NUMBER
+            if up is not None and n > 1:
+                if item_row.max_up is not None and up == item_row.max_up:
+                    style = self.S_NUMBER_MAX
+                elif item_row.min_up is not None and up == item_row.min_up:
+                    style = self.S_NUMBER_MIN
+            row.append(self._number(up, style))
 
             # GP
-            if item_row.not_offered[i]:
-                ws.cell(row=row, column=col, value="n.a.")
-            elif item_row.total_prices[i] is not None:
-                c = ws.cell(row=row, column=col, value=float(item_row.total_prices[i]))
-                c.number_format = self.NUMBER_FORMAT
-            col += 1
+            row.append(self._number(item_row.total_prices[i], self.S_NUMBER))
 
         # Statistics
-        if item_row.min_up is not None:
-            c = ws.cell(row=row, column=col, value=float(item_row.min_up))
-            c.number_format = self.NUMBER_FORMAT
-        col += 1
-        if item_row.max_up is not None:
-            c = ws.cell(row=row, column=col, value=float(item_row.max_up))
-            c.number_format = self.NUMBER_FORMAT
-        col += 1
-        if item_row.avg_up is not None:
-            c = ws.cell(row=row, column=col, value=float(item_row.avg_up))
-            c.number_format = self.NUMBER_FORMAT
-
-        return row + 1
+        row.append(self._number(item_row.min_up, self.S_NUMBER))
+        row.append(self._number(item_row.max_up, self.S_NUMBER))
+        row.append(self._number(item_row.avg_up, self.S_NUMBER))
+
+        sheet.append(row)
 
     def _write_grand_total(
-        self, ws, spiegel: PreisSpiegel,
-        headers: list[str], row: int, n: int,
+        self, sheet: StreamingSheetWriter, spiegel: PreisSpiegel,
+        headers: list[str],
     ) -> None:
-        total_cols = len(headers)
-        ws.cell(row=row, column=1, value="Gesamtsumme").font = self.TOTAL_FONT
+        row: list = [None] * len(headers)
+        row[0] = ("Gesamtsumme", self.S_TOTAL_LABEL)
 
         for i, total in enumerate(spiegel.grand_totals):
             if total is not None:
-                gp_col = 4 + i * 2 + 2  # GP column for bidder i
-                cell = ws.cell(row=row, column=gp_col, value=float(total))
-                cell.number_format = self.NUMBER_FORMAT
-                cell.font = self.TOTAL_FONT
+                row[4 + i * 2 + 1] = (float(total), self.S_TOTAL)
+
+        sheet.append(row)
+
+    def _number(self, value: Optional[Decimal], style: str):
+        return (float(value), style) if value is not None else None
 
-    def _auto_fit_columns(self, ws, headers: list[str], n: int) -> None:
+    def _min_widths(self, headers: list[str]) -> list[float]:
         widths = {"OZ": 14, "Kurztext": 30, "Menge": 12, "Einheit": 10}
-        for col, header in enumerate(headers, 1):
+        result = []
+        for header in headers:
             if header in widths:
-                width = widths[header]
-            elif header.endswith(" EP") or header.endswith(" GP"):
-                width = 14
+                result.append(widths[header])
             elif header in ("Min EP", "Max EP", "Avg EP"):
-                width = 12
+                result.append(12)
             else:
-                width = 14
-            ws.column_dimensions[get_column_letter(col)].width = width
+                result.append(14)
+        return result
@@ -0,0 +1,178 @@
+"""Flat tabular export (CSV, optional Parquet) of LVs and Preisspiegel.
+
+Projects are flattened into columnar batches (dict of column name -> list)
+that are streamed to the output file batch by batch, so portfolios of many
+LVs can be exported without building a workbook in memory. Parquet output
+requires the optional ``pyarrow`` dependency.
+"""
+import csv
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+from lvgenerator.models.boq_snapshot import BoQSnapshot
+from lvgenerator.models.preisspiegel import PreisSpiegel, PreisSpiegelRow
+from lvgenerator.models.project import GAEBProject
+
+Batch = dict[str, list]
+
+# Decimal columns are stored with this scale in Parquet
+_PARQUET_SCALE = 6
+
+
+class TabularExporter:
+    """Exportiert LVs und Preisspiegel als flache Tabellen."""
+
+    LV_COLUMNS = ["project", "oz", "path", "short_text", "qty", "qu", "up", "it", "phase"]
+    LV_DECIMAL_COLUMNS = {"qty", "up", "it"}
+
+    # One row per position and bidder (long format, independent of the bidder count)
+    PREISSPIEGEL_COLUMNS = [
+        "project", "oz", "short_text", "qty", "qu", "bidder",
+        "up", "tp", "not_offered", "min_up", "max_up", "avg_up",
+    ]
+    PREISSPIEGEL_DECIMAL_COLUMNS = {"qty", "up", "tp", "min_up", "max_up", "avg_up"}
+
+    def __init__(self, batch_size: int = 10_000):
+        self.batch_size = batch_size
+
+    # ── Flattening ───────────────────────────────────────────────
+
+    def lv_batches(self, projects: Iterable[GAEBProject]) -> Iterator[Batch]:
+        """Yield the positions of all projects as columnar batches."""
+        batch = self._new_batch(self.LV_COLUMNS)
+        for project in projects:
+            if project.boq is None:
+                continue
+            name = project.prj_info.name
+            phase = project.phase.name if project.phase else ""
+            # Fresh snapshot: the cached one is only current if the caller
+            # invalidates the BoQ after every change
+            snapshot = BoQSnapshot.from_boq(project.boq)
+            paths: list[str] = []
+            for row in range(len(snapshot)):
+                parent = snapshot.parent[row]
+                if not snapshot.is_item[row]:
+                    label = snapshot.short_text[row]
+                    paths.append(f"{paths[parent]} > {label}" if parent >= 0 else label)
+                    continue
+                paths.append("")
+                batch["project"].append(name)
+                batch["oz"].append(snapshot.oz[row])
+                batch["path"].append(paths[parent])
+                batch["short_text"].append(snapshot.short_text[row])
+                batch["qty"].append(snapshot.qty[row])
+                batch["qu"].append(snapshot.qu[row])
+                batch["up"].append(snapshot.up[row])
+                batch["it"].append(snapshot.total[row])
+                batch["phase"].append(phase)
+                if len(batch["oz"]) >= self.batch_size:
+                    yield batch
+                    batch = self._new_batch(self.LV_COLUMNS)
+        if batch["oz"]:
+            yield batch
+
+    def preisspiegel_batches(self, spiegels: Iterable[PreisSpiegel]) -> Iterator[Batch]:
+        """Yield one row per position and bidder as columnar batches."""
+        batch = self._new_batch(self.PREISSPIEGEL_COLUMNS)
+        for spiegel in spiegels:
+            names = [b.name for b in spiegel.bidders]
+            for row in spiegel.rows:
+                if not isinstance(row, PreisSpiegelRow):
+                    continue
+                for i, bidder in enumerate(names):
+                    batch["project"].append(spiegel.project_name)
+                    batch["oz"].append(row.oz)
+                    batch["short_text"].append(row.short_text)
+                    batch["qty"].append(row.qty)
+                    batch["qu"].append(row.qu)
+                    batch["bidder"].append(bidder)
+                    batch["up"].append(row.unit_prices[i])
+                    batch["tp"].append(row.total_prices[i])
+                    batch["not_offered"].append(row.not_offered[i])
+                    batch["min_up"].append(row.min_up)
+                    batch["max_up"].append(row.max_up)
+                    batch["avg_up"].append(row.avg_up)
+                if len(batch["oz"]) >= self.batch_size:
+                    yield batch
+                    batch = self._new_batch(self.PREISSPIEGEL_COLUMNS)
+        if batch["oz"]:
+            yield batch
+
+    @staticmethod
+    def _new_batch(columns: list[str]) -> Batch:
+        return {col: [] for col in columns}
+
+    # ── CSV ──────────────────────────────────────────────────────
+
+    def export_lv_csv(self, projects: Iterable[GAEBProject], file_path: str) -> int:
+        """Write the positions of one or more projects to CSV. Returns the row count."""
+        return self._write_csv(self.LV_COLUMNS, self.lv_batches(projects), file_path)
+
+    def export_preisspiegel_csv(self, spiegels: Iterable[PreisSpiegel],
+                                file_path: str) -> int:
+        """Write one or more Preisspiegel to CSV. Returns the row count."""
+        return self._write_csv(
+            self.PREISSPIEGEL_COLUMNS, self.preisspiegel_batches(spiegels), file_path
+        )
+
+    @staticmethod
+    def _write_csv(columns: list[str], batches: Iterator[Batch], file_path: str) -> int:
+        count = 0
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for batch in batches:
+                rows = zip(*(
+                    ["" if v is None else v for v in batch[col]] for col in columns
+                ))
+                writer.writerows(rows)
+                count += len(batch[columns[0]])
+        return count
+
+    # ── Parquet ──────────────────────────────────────────────────
+
+    def export_lv_parquet(self, projects: Iterable[GAEBProject], file_path: str) -> int:
+        """Write the positions of one or more projects to Parquet (needs pyarrow)."""
+        return self._write_parquet(
+            self.LV_COLUMNS, self.LV_DECIMAL_COLUMNS,
+            self.lv_batches(projects), file_path,
+        )
+
+    def export_preisspiegel_parquet(self, spiegels: Iterable[PreisSpiegel],
+                                    file_path: str) -> int:
+        """Write one or more Preisspiegel to Parquet (needs pyarrow)."""
+        return self._write_parquet(
+            self.PREISSPIEGEL_COLUMNS, self.PREISSPIEGEL_DECIMAL_COLUMNS,
+            self.preisspiegel_batches(spiegels), file_path,
+        )
+
+    def _write_parquet(self, columns: list[str], decimal_columns: set[str],
+                       batches: Iterator[Batch], file_path: str) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet-Export benötigt pyarrow (pip install lvgenerator[parquet])"
+            ) from e
+
+        decimal_type = pa.decimal128(18, _PARQUET_SCALE)
+        schema = pa.schema([
+            pa.field(col, decimal_type if col in decimal_columns
+                     else pa.bool_() if col == "not_offered" else pa.string())
+            for col in columns
+        ])
+        quantum = Decimal(1).scaleb(-_PARQUET_SCALE)
+        count = 0
+        with pq.ParquetWriter(file_path, schema) as writer:
+            for batch in batches:
+                arrays = []
+                for col in columns:
+                    values = batch[col]
+                    if col in decimal_columns:
+                        values = [None if v is None else v.quantize(quantum)
+                                  for v in values]
+                    arrays.append(pa.array(values, type=schema.field(col).type))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                count += len(batch[columns[0]])
+        return count
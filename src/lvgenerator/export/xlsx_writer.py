@@ -0,0 +1,95 @@
+"""Write-only xlsx backend shared by the Excel exporters.
+
+Cells are described as plain values or ``(value, style_name)`` tuples, where
+the style name refers to a precomputed ``NamedStyle``. Column widths are
+tracked while rows are added. Since the ``<cols>`` element precedes the sheet
+data in the xlsx format, rows are buffered as plain tuples (no cell objects)
+and streamed into an openpyxl ``write_only`` workbook on ``save()``.
+"""
+from typing import Any, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import NamedStyle
+from openpyxl.utils import get_column_letter
+
+
+class StreamingSheetWriter:
+    """Collects rows for a single worksheet and saves them in write-only mode."""
+
+    MAX_WIDTH = 60
+    WIDTH_PADDING = 2
+
+    def __init__(self, title: str, styles: list[NamedStyle],
+                 min_widths: Optional[list[float]] = None):
+        self._title = title
+        self._styles = styles
+        self._widths: list[float] = list(min_widths or [])
+        self._rows: list[tuple] = []
+
+    def append(self, row: list[Any], measure: bool = True) -> None:
+        """Add a row. Cells are values or ``(value, style_name)`` tuples.
+
+        With ``measure=False`` the row does not widen any column (e.g. titles
+        that are allowed to overflow into neighbouring cells).
+        """
+        self._rows.append(tuple(row))
+        if not measure:
+            return
+        widths = self._widths
+        for col, cell in enumerate(row):
+            value = cell[0] if isinstance(cell, tuple) else cell
+            if value is None:
+                continue
+            length = self._display_length(value)
+            if col >= len(widths):
+                widths.extend([0] * (col + 1 - len(widths)))
+            if length > widths[col]:
+                widths[col] = min(length, self.MAX_WIDTH)
+
+    @property
+    def row_count(self) -> int:
+        return len(self._rows)
+
+    @property
+    def column_widths(self) -> list[float]:
+        return list(self._widths)
+
+    def save(self, file_path: str) -> None:
+        wb = Workbook(write_only=True)
+        for style in self._styles:
+            wb.add_named_style(style)
+        ws = wb.create_sheet(self._title)
+        for col, width in enumerate(self._widths, 1):
+            if width:
+                ws.column_dimensions[get_column_letter(col)].width = width
+
+        # One reusable cell per style: rows are passed as generators, so each
+        # cell is written before the next value is bound to it.
+        style_cells = {}
+        for style in self._styles:
+            cell = WriteOnlyCell(ws)
+            cell.style = style.name
+            style_cells[style.name] = cell
+
+        for row in self._rows:
+            ws.append(self._cells(row, style_cells))
+        wb.save(file_path)
+
+    def _cells(self, row: tuple, style_cells: dict[str, WriteOnlyCell]):
+        for cell in row:
+            if isinstance(cell, tuple):
+                value, style = cell
+                cell = style_cells[style]
+                cell.value = value
+            yield cell
+
+    def _display_length(self, value: Any) -> int:
+        if isinstance(value, float):
+            # Numbers are shown with thousands separators and two decimals
+            text = f"{value:,.2f}"
+        else:
+            text = str(value)
+        if "\n" in text:
+            text = max(text.split("\n"), key=len)
+        return len(text) + self.WIDTH_PADDING
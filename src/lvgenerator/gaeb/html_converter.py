@@ -1,10 +1,30 @@
 """Bidirectional HTML conversion between GAEB XML text format and QTextEdit HTML."""
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from lxml import etree
 
+# Bounded number of cached conversions per direction (texts are immutable
+# strings, so a cached result stays valid for equal input)
+CONVERSION_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class ConversionCacheStats:
+    """Trefferstatistik eines Konvertierungscaches."""
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 
 def _parse_css(style_str: str) -> dict[str, str]:
     """Parse a CSS style string into a dict."""
@@ -85,6 +105,8 @@ def gaeb_html_to_qt_html(
 ) -> str:
     """Convert GAEB XML text (from extract_html()) to QTextEdit-compatible HTML.
 
+    Results are cached (LRU) by text, font family and font size.
+
     Args:
         gaeb_html: Raw XML string from extract_html(), e.g.
             '<ns:Text xmlns:ns="..."><ns:p><ns:span>text</ns:span></ns:p></ns:Text>'
@@ -95,6 +117,13 @@ def gaeb_html_to_qt_html(
     """
     if not gaeb_html or not gaeb_html.strip():
         return ""
+    return _gaeb_html_to_qt_html_cached(gaeb_html, default_font_family, default_font_size_pt)
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _gaeb_html_to_qt_html_cached(
+    gaeb_html: str, default_font_family: str, default_font_size_pt: int
+) -> str:
 
     try:
         root = etree.fromstring(gaeb_html.encode("utf-8") if isinstance(gaeb_html, str) else gaeb_html)
@@ -128,6 +157,21 @@ def gaeb_html_to_qt_html(
     return f"<html><body{body_style}>\n{body_content}\n</body></html>"
 
 
+def conversion_cache_stats() -> dict[str, ConversionCacheStats]:
+    """Hit/miss counters of both conversion directions ("to_qt", "to_gaeb")."""
+    stats = {}
+    for name, func in (("to_qt", _gaeb_html_to_qt_html_cached),
+                       ("to_gaeb", _qt_html_to_gaeb_html_cached)):
+        info = func.cache_info()
+        stats[name] = ConversionCacheStats(info.hits, info.misses, info.currsize, info.maxsize)
+    return stats
+
+
+def clear_conversion_caches() -> None:
+    _gaeb_html_to_qt_html_cached.cache_clear()
+    _qt_html_to_gaeb_html_cached.cache_clear()
+
+
 def _convert_gaeb_p_to_qt(p_elem) -> str:
     """Convert a GAEB <p> element to Qt HTML <p>."""
     spans = []
@@ -172,6 +216,11 @@ def qt_html_to_gaeb_html(qt_html: str, parent_tag: str, ns: str) -> str:
     """
     if not qt_html or not qt_html.strip():
         return ""
+    return _qt_html_to_gaeb_html_cached(qt_html, parent_tag, ns)
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _qt_html_to_gaeb_html_cached(qt_html: str, parent_tag: str, ns: str) -> str:
 
     # Build the GAEB parent element
     parent = etree.Element(f"{{{ns}}}{parent_tag}")
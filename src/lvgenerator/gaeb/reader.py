@@ -14,12 +14,20 @@ from lvgenerator.models.item import (
     CtlgAssignment, Item, ItemDescription, SubDescription,
 )
 from lvgenerator.models.project import AwardInfo, GAEBInfo, GAEBProject, PrjInfo
+from lvgenerator.models.text_pool import TextPool
 from lvgenerator.models.text_types import AddText
 
 
 class GAEBReader:
 
+    def __init__(self, intern_texts: bool = True):
+        # Texts, units and HTML repeated across positions are stored once.
+        # ``text_pool`` holds the pool of the last read (for statistics).
+        self.intern_texts = intern_texts
+        self.text_pool: Optional[TextPool] = None
+
     def read(self, file_path: str) -> GAEBProject:
+        self.text_pool = TextPool() if self.intern_texts else None
         tree = etree.parse(file_path)
         root = tree.getroot()
         phase, version = detect_phase_and_version(root)
@@ -58,6 +66,15 @@ class GAEBReader:
             return elem.text.strip()
         return ""
 
+    def _pooled(self, text: str) -> str:
+        return self.text_pool.intern(text) if self.text_pool is not None else text
+
+    def _plain_text(self, elem: etree._Element) -> str:
+        return self._pooled(extract_plain_text(elem))
+
+    def _html(self, elem: etree._Element) -> str:
+        return self._pooled(extract_html(elem))
+
     def _decimal(self, parent: etree._Element, xpath: str, ns: dict) -> Optional[Decimal]:
         text = self._text(parent, xpath, ns)
         if text:
@@ -274,8 +291,8 @@ class GAEBReader:
 
         lbl = ctgy_elem.find("g:LblTx", ns)
         if lbl is not None:
-            cat.label = extract_plain_text(lbl)
-            cat.label_html = extract_html(lbl)
+            cat.label = self._plain_text(lbl)
+            cat.label_html = self._html(lbl)
 
         # Grund-/Wahlgruppen auf Kategorieebene
         cat.aln_b_group_no = self._text(ctgy_elem, "g:ALNBGroupNo", ns)
@@ -283,8 +300,8 @@ class GAEBReader:
 
         exec_descr = ctgy_elem.find("g:ExecDescr/g:Text", ns)
         if exec_descr is not None:
-            cat.exec_descr = extract_plain_text(exec_descr)
-            cat.exec_descr_html = extract_html(exec_descr)
+            cat.exec_descr = self._plain_text(exec_descr)
+            cat.exec_descr_html = self._html(exec_descr)
 
         inner_body = ctgy_elem.find("g:BoQBody", ns)
         if inner_body is not None:
@@ -317,7 +334,7 @@ class GAEBReader:
         item.id = item_elem.get("ID", "")
         item.rno_part = item_elem.get("RNoPart", "")
         item.qty = self._decimal(item_elem, "g:Qty", ns)
-        item.qu = self._text(item_elem, "g:QU", ns)
+        item.qu = self._pooled(self._text(item_elem, "g:QU", ns))
         item.up = self._decimal(item_elem, "g:UP", ns)
         item.it = self._decimal(item_elem, "g:IT", ns)
         item.vat = self._decimal(item_elem, "g:VAT", ns)
@@ -380,7 +397,7 @@ class GAEBReader:
             sd.sub_d_no = self._text(sd_elem, "g:SubDNo", ns)
             sd.qty = self._decimal(sd_elem, "g:Qty", ns)
             sd.qty_spec = self._text(sd_elem, "g:QtySpec", ns)
-            sd.qu = self._text(sd_elem, "g:QU", ns)
+            sd.qu = self._pooled(self._text(sd_elem, "g:QU", ns))
             desc_elem = sd_elem.find("g:Description", ns)
             if desc_elem is not None:
                 sd.description = self._parse_description(desc_elem, ns)
@@ -413,18 +430,20 @@ class GAEBReader:
         if desc is not None:
             item.description = self._parse_description(desc, ns)
 
-        # Zusatztexte
-        item.add_texts = self._parse_add_texts(item_elem, ns)
+        # Zusatztexte (leave the list unallocated when there are none)
+        add_texts = self._parse_add_texts(item_elem, ns)
+        if add_texts:
+            item.add_texts = add_texts
 
         # Bieterkommentare und Textergaenzungen
         for bc_elem in item_elem.findall("g:BidComm", ns):
             text_elem = bc_elem.find("g:Text", ns)
             if text_elem is not None:
-                item.bid_comments.append(extract_plain_text(text_elem))
+                item.bid_comments.append(self._plain_text(text_elem))
         for tc_elem in item_elem.findall("g:TextCompl", ns):
             text_elem = tc_elem.find("g:Text", ns)
             if text_elem is not None:
-                item.text_compls.append(extract_plain_text(text_elem))
+                item.text_compls.append(self._plain_text(text_elem))
 
         return item
 
@@ -446,7 +465,7 @@ class GAEBReader:
 
         # MarkupItem can have Qty, QU, UP, IT, ITMarkup, Markup etc.
         item.qty = self._decimal(elem, "g:Qty", ns)
-        item.qu = self._text(elem, "g:QU", ns)
+        item.qu = self._pooled(self._text(elem, "g:QU", ns))
         item.up = self._decimal(elem, "g:UP", ns)
         item.it = self._decimal(elem, "g:IT", ns)
         item.it_markup = self._decimal(elem, "g:ITMarkup", ns)
@@ -495,7 +514,7 @@ class GAEBReader:
     def _parse_description(self, desc_elem: etree._Element, ns: dict) -> ItemDescription:
         from copy import deepcopy
         desc = ItemDescription()
-        desc.stl_no = self._text(desc_elem, "g:StLNo", ns)
+        desc.stl_no = self._pooled(self._text(desc_elem, "g:StLNo", ns))
 
         # STLBBau (preserve raw XML for roundtrip)
         stlb_bau = desc_elem.find("g:STLBBau", ns)
@@ -510,15 +529,15 @@ class GAEBReader:
         complete = desc_elem.find("g:CompleteText", ns)
         if complete is not None:
             # ComplTSA / ComplTSB
-            desc.compl_tsa = self._text(complete, "g:ComplTSA", ns)
-            desc.compl_tsb = self._text(complete, "g:ComplTSB", ns)
+            desc.compl_tsa = self._pooled(self._text(complete, "g:ComplTSA", ns))
+            desc.compl_tsb = self._pooled(self._text(complete, "g:ComplTSB", ns))
 
             detail_txt = complete.find("g:DetailTxt", ns)
             if detail_txt is not None:
                 detail = detail_txt.find("g:Text", ns)
                 if detail is not None:
-                    desc.detail_text = extract_plain_text(detail)
-                    desc.detail_html = extract_html(detail)
+                    desc.detail_text = self._plain_text(detail)
+                    desc.detail_html = self._html(detail)
 
                 # TextComplement (preserve raw XML for roundtrip)
                 for tc in detail_txt.findall("g:TextComplement", ns):
@@ -531,13 +550,13 @@ class GAEBReader:
 
             outline = complete.find("g:OutlineText/g:OutlTxt/g:TextOutlTxt", ns)
             if outline is not None:
-                desc.outline_text = extract_plain_text(outline)
-                desc.outline_html = extract_html(outline)
+                desc.outline_text = self._plain_text(outline)
+                desc.outline_html = self._html(outline)
         else:
             outline = desc_elem.find("g:OutlineText/g:OutlTxt/g:TextOutlTxt", ns)
             if outline is not None:
-                desc.outline_text = extract_plain_text(outline)
-                desc.outline_html = extract_html(outline)
+                desc.outline_text = self._plain_text(outline)
+                desc.outline_html = self._html(outline)
 
         return desc
 
@@ -552,13 +571,13 @@ class GAEBReader:
                 # Manche AddTexts nutzen direkt p/span unter OutlineAddText
                 outline = at_elem.find("g:OutlineAddText", ns)
             if outline is not None:
-                at.outline_text = extract_plain_text(outline)
-                at.outline_html = extract_html(outline)
+                at.outline_text = self._plain_text(outline)
+                at.outline_html = self._html(outline)
             detail = at_elem.find("g:DetailAddText/g:Text", ns)
             if detail is None:
                 detail = at_elem.find("g:DetailAddText", ns)
             if detail is not None:
-                at.detail_text = extract_plain_text(detail)
-                at.detail_html = extract_html(detail)
+                at.detail_text = self._plain_text(detail)
+                at.detail_html = self._html(detail)
             result.append(at)
         return result
@@ -8,6 +8,24 @@ from PySide6.QtWidgets import QApplication
 from lvgenerator.controllers.main_controller import MainController
 from lvgenerator.views.main_window import MainWindow
 
+# Loaded on first use only; importing any of them at startup is a regression
+# (checked by tests/test_startup.py and benchmarks/bench_startup.py)
+DEFERRED_MODULES = [
+    "openpyxl",
+    "lvgenerator.export.excel_exporter",
+    "lvgenerator.export.preisspiegel_exporter",
+    "lvgenerator.services.preisspiegel_service",
+    "lvgenerator.gaeb.reader",
+    "lvgenerator.gaeb.writer",
+    "lvgenerator.gaeb.phase_converter",
+    "lvgenerator.views.preisspiegel_dialog",
+    "lvgenerator.views.oz_mask_dialog",
+    "lvgenerator.views.global_constants_dialog",
+    "lvgenerator.views.phase_convert_dialog",
+    "lvgenerator.views.phase_selector",
+    "lvgenerator.views.text_style_dialog",
+]
+
 
 def _load_dark_theme(app: QApplication) -> None:
     """Load the VS Code-inspired dark theme."""
@@ -6,6 +6,9 @@ from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from lvgenerator.models.boq_index import BoQIndex
+    from lvgenerator.models.boq_snapshot import BoQSnapshot
+    from lvgenerator.models.boq_statistics import BoQStatistics
     from lvgenerator.models.category import BoQCategory
     from lvgenerator.models.text_types import AddText
 
@@ -61,3 +64,48 @@ class BoQ:
     info: BoQInfo = field(default_factory=BoQInfo)
     categories: list[BoQCategory] = field(default_factory=list)
     remarks_raw: list = field(default_factory=list)  # Raw XML elements for roundtrip
+    _index: Optional[BoQIndex] = field(default=None, init=False, repr=False, compare=False)
+    _snapshot: Optional[BoQSnapshot] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def index(self) -> BoQIndex:
+        """OZ/id/parent lookups, kept current by the structure commands."""
+        if self._index is None:
+            from lvgenerator.models.boq_index import BoQIndex
+            self._index = BoQIndex(self)
+        return self._index
+
+    def snapshot(self) -> BoQSnapshot:
+        """Immutable flattened view, built on first use after a change."""
+        if self._snapshot is None:
+            from lvgenerator.models.boq_snapshot import BoQSnapshot
+            self._snapshot = BoQSnapshot.from_boq(self)
+        return self._snapshot
+
+    @property
+    def statistics(self) -> BoQStatistics:
+        """Counters and grand total, from the statistics cached per Titel."""
+        from lvgenerator.models.boq_statistics import BoQStatistics
+        return BoQStatistics.from_boq(self)
+
+    def invalidate(self) -> None:
+        """Rebuild index, snapshot and the per-node caches (hashes,
+        statistics); call after changes made outside of commands."""
+        from lvgenerator.models.node_cache import reset_node_caches
+        if self._index is not None:
+            self._index.invalidate()
+        self._snapshot = None
+        reset_node_caches(self.categories)
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the snapshot after values changed; the index is left as is."""
+        self._snapshot = None
+
+    def __getstate__(self):
+        # Derived data references nodes by identity, which copies do not share
+        state = self.__dict__.copy()
+        state["_index"] = None
+        state["_snapshot"] = None
+        return state
@@ -0,0 +1,113 @@
+"""Content hashes of BoQ nodes, combined bottom-up (merkle style).
+
+An item hash covers the content of the position but not its own number,
+so a moved or renumbered position keeps its hash. A category hash covers
+its own fields and the numbers and hashes of its children in order, so two
+subtrees with equal hashes are equal including all ordinal numbers below.
+Values are hashed by representation, so ``Decimal("1.0")`` and
+``Decimal("1.00")`` differ (as they do in the written file). Hashes are
+BLAKE2b digests and therefore stable across processes.
+
+Hashes are cached on the nodes (``_content_hash``) and dropped by the
+commands along the changed path (see node_cache). After an edit only that
+path is hashed again, and comparing a Titel with an earlier hash is O(1).
+"""
+from __future__ import annotations
+
+from hashlib import blake2b
+from operator import attrgetter
+from typing import TYPE_CHECKING
+from weakref import ref
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.models.node_cache import Node
+
+if TYPE_CHECKING:
+    from lvgenerator.models.boq import BoQ
+
+DIGEST_SIZE = 16
+
+ITEM_HASH_FIELDS = (
+    "qty", "qty_tbd", "qu", "up", "it", "discount_pcnt", "vat",
+    "not_appl", "not_offered", "hour_it", "lump_sum_item", "provis",
+    "formula", "use_calculated_qty", "free_qty", "key_it", "markup_it",
+    "is_markup_item", "ref_descr", "ref_rno",
+)
+DESCRIPTION_HASH_FIELDS = (
+    "outline_text", "detail_text", "outline_html", "detail_html", "stl_no",
+)
+CATEGORY_HASH_FIELDS = ("label", "label_html", "exec_descr", "exec_descr_html")
+
+_SEP = "\x1f"
+
+_item_values = attrgetter(*ITEM_HASH_FIELDS)
+_description_values = attrgetter(*DESCRIPTION_HASH_FIELDS)
+_category_values = attrgetter(*CATEGORY_HASH_FIELDS)
+
+
+def _description_hash(description: ItemDescription) -> bytes:
+    digest = description._content_hash
+    if digest is None:
+        # XML text cannot contain \x1f, so the separator is unambiguous
+        key = _SEP.join(_description_values(description))
+        digest = description._content_hash = \
+            blake2b(key.encode(), digest_size=DIGEST_SIZE).digest()
+    return digest
+
+
+def _item_hash(item: Item) -> bytes:
+    digest = item._content_hash
+    if digest is None:
+        description = item.description
+        combined = blake2b(repr(_item_values(item)).encode(), digest_size=DIGEST_SIZE)
+        combined.update(_description_hash(description))
+        digest = item._content_hash = combined.digest()
+        description._cache_parent = ref(item)
+    return digest
+
+
+def _category_hash(cat: BoQCategory) -> bytes:
+    """Combine the child hashes of ``cat``; subcategories are hashed already."""
+    digest = blake2b(_SEP.join(_category_values(cat)).encode(), digest_size=DIGEST_SIZE)
+    for sub in cat.subcategories:
+        sub._cache_parent = ref(cat)
+        digest.update(b"\x1e" + sub.rno_part.encode() + b"\x1f" + sub._content_hash)
+    for item in cat.items:
+        item_digest = _item_hash(item)
+        # Also for cached items, they may have been moved here
+        item._cache_parent = ref(cat)
+        digest.update(b"\x1e" + item.rno_part.encode() + b"\x1f" + item_digest)
+    return digest.digest()
+
+
+def content_hash(node: Node) -> bytes:
+    """Hash of an item, or of a category with everything below it."""
+    if node._content_hash is not None:
+        return node._content_hash
+    if isinstance(node, Item):
+        return _item_hash(node)
+    # Post-order without recursion; subtrees with cached hash are not entered
+    stack: list[tuple[BoQCategory, bool]] = [(node, False)]
+    while stack:
+        cat, children_done = stack.pop()
+        if children_done:
+            cat._content_hash = _category_hash(cat)
+            continue
+        stack.append((cat, True))
+        stack.extend((sub, False) for sub in cat.subcategories
+                     if sub._content_hash is None)
+    return node._content_hash
+
+
+def changed_since(node: Node, digest: bytes) -> bool:
+    """Whether ``node`` differs from when ``digest`` was taken of it."""
+    return content_hash(node) != digest
+
+
+def boq_fingerprint(boq: BoQ) -> str:
+    """Hex digest over all top-level categories in order."""
+    digest = blake2b(digest_size=DIGEST_SIZE)
+    for cat in boq.categories:
+        digest.update(b"\x1e" + cat.rno_part.encode() + b"\x1f" + content_hash(cat))
+    return digest.hexdigest()
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+
+if TYPE_CHECKING:
+    from lvgenerator.models.boq import BoQ
+
+Node = Union[BoQCategory, Item]
+
+
+class _Table:
+    """Key -> node. A node whose key is taken hides the previous owner
+    (``hidden``), which returns when the newer node is removed."""
+
+    __slots__ = ("visible", "hidden")
+
+    def __init__(self):
+        self.visible: dict[str, Node] = {}
+        self.hidden: dict[str, list[Node]] = {}
+
+    def put(self, key: str, node: Node) -> None:
+        current = self.visible.get(key)
+        if current is not None and current is not node:
+            self.hidden.setdefault(key, []).append(current)
+        self.visible[key] = node
+
+    def drop(self, key: str, node: Node) -> None:
+        waiting = self.hidden.get(key)
+        if self.visible.get(key) is node:
+            if waiting:
+                self.visible[key] = waiting.pop()
+            else:
+                del self.visible[key]
+        elif waiting:
+            for n, other in enumerate(waiting):
+                if other is node:
+                    del waiting[n]
+                    break
+        if waiting is not None and not waiting:
+            del self.hidden[key]
+
+    def clear(self) -> None:
+        self.visible.clear()
+        self.hidden.clear()
+
+
+class BoQIndex:
+    """Lookup tables over the BoQ tree: full OZ -> node, id -> node, node -> parent.
+
+    Nodes are tracked by identity (equal dataclasses may still be different
+    positions). The structure commands keep the index current through
+    ``add``/``remove``/``renumber`` at the cost of the changed subtree, so
+    lookups stay O(1) while editing. ``invalidate`` (``BoQ.invalidate()``)
+    is for changes made outside of commands; the tables are then rebuilt on
+    the next lookup. An OZ or id used twice (e.g. right after duplicating a
+    position) resolves to the node added last; the other one is kept aside
+    and takes over when that node is removed.
+    """
+
+    def __init__(self, boq: BoQ):
+        self._boq = boq
+        self._items_by_oz = _Table()
+        self._categories_by_oz = _Table()
+        self._by_id = _Table()
+        # id(node) -> (node, parent category or None, full OZ); holding the
+        # node keeps its id() from being reused while the index is alive
+        self._nodes: dict[int, tuple[Node, Optional[BoQCategory], str]] = {}
+        self._stale = True
+
+    def _build(self) -> None:
+        self._items_by_oz.clear()
+        self._categories_by_oz.clear()
+        self._by_id.clear()
+        self._nodes.clear()
+        self._stale = False
+        for cat in self._boq.categories:
+            self._add_subtree(cat, None, "")
+
+    def _current(self) -> BoQIndex:
+        if self._stale:
+            self._build()
+        return self
+
+    def _add_subtree(self, node: Node, parent: Optional[BoQCategory],
+                     parent_oz: str) -> None:
+        if isinstance(node, Item):
+            self._add(node, parent, _join(parent_oz, node.rno_part), self._items_by_oz)
+            return
+        stack: list[tuple[BoQCategory, Optional[BoQCategory], str]] = [
+            (node, parent, parent_oz)
+        ]
+        while stack:
+            cat, parent, parent_oz = stack.pop()
+            oz = _join(parent_oz, cat.rno_part)
+            self._add(cat, parent, oz, self._categories_by_oz)
+            for sub in reversed(cat.subcategories):
+                stack.append((sub, cat, oz))
+            for item in cat.items:
+                self._add(item, cat, _join(oz, item.rno_part), self._items_by_oz)
+
+    def _add(self, node: Node, parent: Optional[BoQCategory], oz: str,
+             by_oz: _Table) -> None:
+        self._nodes[id(node)] = (node, parent, oz)
+        by_oz.put(oz, node)
+        if node.id:
+            self._by_id.put(node.id, node)
+
+    # ── Maintenance by the structure commands ────────────────────
+
+    def add(self, node: Node, parent: Optional[BoQCategory]) -> None:
+        """Register ``node`` and its subtree, inserted below ``parent``."""
+        if self._stale:
+            return
+        if parent is None:
+            parent_oz = ""
+        else:
+            entry = self._nodes.get(id(parent))
+            if entry is None:
+                self.invalidate()
+                return
+            parent_oz = entry[2]
+        self._add_subtree(node, parent, parent_oz)
+
+    def remove(self, node: Node) -> None:
+        """Forget ``node`` and its subtree, removed from the tree."""
+        if self._stale:
+            return
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            entry = self._nodes.pop(id(current), None)
+            if entry is None:
+                continue
+            if isinstance(current, Item):
+                self._items_by_oz.drop(entry[2], current)
+            else:
+                self._categories_by_oz.drop(entry[2], current)
+                stack.extend(current.subcategories)
+                stack.extend(current.items)
+            if current.id:
+                self._by_id.drop(current.id, current)
+
+    def renumber(self, nodes: Iterable[Node]) -> None:
+        """Update the full OZs below ``nodes`` after their ``rno_part`` changed."""
+        if self._stale:
+            return
+        nodes = list(nodes)
+        changed = {id(node) for node in nodes}
+        for node in nodes:
+            entry = self._nodes.get(id(node))
+            if entry is None:
+                continue
+            # Subtrees of renumbered ancestors are updated with the ancestor
+            ancestor = entry[1]
+            while ancestor is not None and id(ancestor) not in changed:
+                ancestor = self._nodes[id(ancestor)][1]
+            if ancestor is not None:
+                continue
+            self.remove(node)
+            self.add(node, entry[1])
+
+    def invalidate(self) -> None:
+        """Rebuild on the next lookup, after changes made outside of commands."""
+        self._stale = True
+        self._items_by_oz.clear()
+        self._categories_by_oz.clear()
+        self._by_id.clear()
+        self._nodes.clear()
+
+    # ── Lookups ──────────────────────────────────────────────────
+
+    def __contains__(self, node: Node) -> bool:
+        return id(node) in self._current()._nodes
+
+    def __len__(self) -> int:
+        return len(self._current()._nodes)
+
+    def item(self, oz: str) -> Optional[Item]:
+        """Position by full OZ (e.g. "01.02.0010")."""
+        return self._current()._items_by_oz.visible.get(oz)
+
+    def category(self, oz: str) -> Optional[BoQCategory]:
+        """Category by full OZ (e.g. "01.02")."""
+        return self._current()._categories_by_oz.visible.get(oz)
+
+    def by_id(self, node_id: str) -> Optional[Node]:
+        return self._current()._by_id.visible.get(node_id)
+
+    def items_by_oz(self) -> Iterator[tuple[str, Item]]:
+        return iter(self._current()._items_by_oz.visible.items())
+
+    def full_oz(self, node: Node) -> Optional[str]:
+        entry = self._current()._nodes.get(id(node))
+        return entry[2] if entry is not None else None
+
+    def parent(self, node: Node) -> Optional[BoQCategory]:
+        """Parent category; None for top-level categories and unknown nodes."""
+        entry = self._current()._nodes.get(id(node))
+        return entry[1] if entry is not None else None
+
+    def parent_list(self, node: Node) -> Optional[list]:
+        """The list that contains ``node`` (items, subcategories or BoQ root)."""
+        entry = self._current()._nodes.get(id(node))
+        if entry is None:
+            return None
+        parent = entry[1]
+        if isinstance(node, Item):
+            return parent.items
+        return parent.subcategories if parent is not None else self._boq.categories
+
+
+def _join(parent_oz: str, rno_part: str) -> str:
+    return f"{parent_oz}.{rno_part}" if parent_oz else rno_part
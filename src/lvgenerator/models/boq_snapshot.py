@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.models.money import from_cents
+
+if TYPE_CHECKING:
+    from lvgenerator.models.boq import BoQ
+
+Node = Union[BoQCategory, Item]
+
+
+@dataclass(frozen=True)
+class BoQSnapshot:
+    """Immutable, flattened view of a BoQ for read-only analytics.
+
+    Rows are in LV order (category, its subcategories, then its items) and
+    every column is a tuple indexed by row. ``parent`` holds the row of the
+    parent category (-1 on top level). ``total`` is IT or qty x UP for
+    items and the recursive sum for categories, i.e. the values of
+    ``calculate_total``. The snapshot can be shared between threads; the
+    referenced ``nodes`` must not be modified through it.
+    """
+
+    nodes: tuple[Node, ...]
+    is_item: tuple[bool, ...]
+    depth: tuple[int, ...]
+    parent: tuple[int, ...]
+    oz: tuple[str, ...]
+    short_text: tuple[str, ...]
+    qu: tuple[str, ...]
+    qty: tuple[Optional[Decimal], ...]
+    up: tuple[Optional[Decimal], ...]
+    it: tuple[Optional[Decimal], ...]
+    total: tuple[Optional[Decimal], ...]
+    category_count: int
+    item_count: int
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def item_rows(self) -> Iterator[int]:
+        return (row for row, is_item in enumerate(self.is_item) if is_item)
+
+    def category_rows(self) -> Iterator[int]:
+        return (row for row, is_item in enumerate(self.is_item) if not is_item)
+
+    @property
+    def grand_total(self) -> Optional[Decimal]:
+        """Sum over the top-level categories (None if nothing is priced)."""
+        totals = [
+            self.total[row] for row in range(len(self))
+            if self.parent[row] == -1 and self.total[row] is not None
+        ]
+        return sum(totals, Decimal("0.00")) if totals else None
+
+    @classmethod
+    def from_boq(cls, boq: BoQ) -> BoQSnapshot:
+        nodes: list[Node] = []
+        is_item: list[bool] = []
+        depth: list[int] = []
+        parent: list[int] = []
+        oz: list[str] = []
+        short_text: list[str] = []
+        qu: list[str] = []
+        qty: list[Optional[Decimal]] = []
+        up: list[Optional[Decimal]] = []
+        it: list[Optional[Decimal]] = []
+        # Per row: (cents, sub-cent Decimal rest, has any value)
+        sums: list[list] = []
+
+        def add(node, node_is_item, node_depth, parent_row, node_oz):
+            nodes.append(node)
+            is_item.append(node_is_item)
+            depth.append(node_depth)
+            parent.append(parent_row)
+            oz.append(node_oz)
+            if node_is_item:
+                short_text.append(node.description.outline_text)
+                qu.append(node.qu)
+                qty.append(node.qty)
+                up.append(node.up)
+                it.append(node.it)
+            else:
+                short_text.append(node.label)
+                qu.append("")
+                qty.append(None)
+                up.append(None)
+                it.append(None)
+            sums.append([0, None, False])
+
+        # Explicit stack; (category, parent row, parent OZ, depth) or
+        # (None, row) as marker to emit the items after the subcategories
+        stack: list[tuple] = [(cat, -1, "", 0) for cat in reversed(boq.categories)]
+        while stack:
+            entry = stack.pop()
+            if entry[0] is None:
+                row = entry[1]
+                cat_oz = oz[row]
+                for item in nodes[row].items:
+                    item_oz = f"{cat_oz}.{item.rno_part}" if cat_oz else item.rno_part
+                    add(item, True, depth[row] + 1, row, item_oz)
+                continue
+            cat, parent_row, parent_oz, cat_depth = entry
+            cat_oz = f"{parent_oz}.{cat.rno_part}" if parent_oz else cat.rno_part
+            row = len(nodes)
+            add(cat, False, cat_depth, parent_row, cat_oz)
+            stack.append((None, row))
+            for sub in reversed(cat.subcategories):
+                stack.append((sub, row, cat_oz, cat_depth + 1))
+
+        # Children follow their parent, so one backward pass aggregates totals
+        total: list[Optional[Decimal]] = [None] * len(nodes)
+        for row in range(len(nodes) - 1, -1, -1):
+            acc = sums[row]
+            if is_item[row]:
+                item = nodes[row]
+                if item.it is not None:
+                    cents = item.it_cents()
+                    if cents is None:
+                        acc[1] = item.it
+                    else:
+                        acc[0] = cents
+                    acc[2] = True
+                else:
+                    cents = item.total_cents()
+                    if cents is not None:
+                        acc[0] = cents
+                        acc[2] = True
+            if acc[2]:
+                value = from_cents(acc[0])
+                total[row] = value + acc[1] if acc[1] is not None else value
+                parent_row = parent[row]
+                if parent_row >= 0:
+                    target = sums[parent_row]
+                    target[0] += acc[0]
+                    if acc[1] is not None:
+                        target[1] = acc[1] if target[1] is None else target[1] + acc[1]
+                    target[2] = True
+
+        item_count = sum(is_item)
+        return cls(
+            nodes=tuple(nodes),
+            is_item=tuple(is_item),
+            depth=tuple(depth),
+            parent=tuple(parent),
+            oz=tuple(oz),
+            short_text=tuple(short_text),
+            qu=tuple(qu),
+            qty=tuple(qty),
+            up=tuple(up),
+            it=tuple(it),
+            total=tuple(total),
+            category_count=len(nodes) - item_count,
+            item_count=item_count,
+        )
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
+from weakref import ref
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.models.money import from_cents
+
+if TYPE_CHECKING:
+    from lvgenerator.models.boq import BoQ
+
+# (priced, has formula, cents, sub-cent IT or None)
+Contribution = tuple[int, int, int, Optional[Decimal]]
+
+
+def item_contribution(item: Item) -> Contribution:
+    """What a single position adds to the statistics."""
+    formula = 1 if item.formula else 0
+    if item.it is not None:
+        cents = item.it_cents()
+        if cents is None:
+            return 1, formula, 0, item.it
+        return 1, formula, cents, None
+    cents = item.total_cents()
+    if cents is None:
+        return 0, formula, 0, None
+    return 1, formula, cents, None
+
+
+class BoQStatistics:
+    """Counters of a BoQ or of a Titel subtree for the status bar and exporters.
+
+    Every Titel caches the statistics of its subtree (``_statistics``). They
+    are combined bottom-up and dropped together with the content hash by the
+    commands and editors (see node_cache), so ``BoQ.statistics`` only adds
+    up the top-level Titel and recounts the Titel changed since the last
+    read. Changes made outside of commands (e.g. new global constants for
+    formulas) require ``BoQ.invalidate()``.
+    """
+
+    __slots__ = ("categories", "items", "priced_items", "formula_items",
+                 "_cents", "_extra")
+
+    def __init__(self):
+        self.categories = 0
+        self.items = 0
+        self.priced_items = 0
+        self.formula_items = 0
+        self._cents = 0
+        self._extra: Optional[Decimal] = None
+
+    @classmethod
+    def from_boq(cls, boq: BoQ) -> BoQStatistics:
+        stats = cls()
+        for cat in boq.categories:
+            stats._merge(category_statistics(cat))
+        return stats
+
+    @property
+    def grand_total(self) -> Optional[Decimal]:
+        """Sum of all priced positions (None if nothing is priced)."""
+        if not self.priced_items:
+            return None
+        total = from_cents(self._cents)
+        return total + self._extra if self._extra is not None else total
+
+    def as_dict(self) -> dict:
+        return {
+            "categories": self.categories,
+            "items": self.items,
+            "priced_items": self.priced_items,
+            "formula_items": self.formula_items,
+            "grand_total": self.grand_total,
+        }
+
+    def __repr__(self) -> str:
+        return f"BoQStatistics({self.as_dict()})"
+
+    def _merge(self, other: BoQStatistics) -> None:
+        self.categories += other.categories
+        self.items += other.items
+        self.priced_items += other.priced_items
+        self.formula_items += other.formula_items
+        self._cents += other._cents
+        if other._extra is not None:
+            self._extra = other._extra if self._extra is None else self._extra + other._extra
+
+    def _add(self, contribution: Contribution) -> None:
+        priced, formula, cents, extra = contribution
+        self.priced_items += priced
+        self.formula_items += formula
+        self._cents += cents
+        if extra is not None:
+            self._extra = extra if self._extra is None else self._extra + extra
+
+
+def category_statistics(category: BoQCategory) -> BoQStatistics:
+    """Statistics of ``category`` and everything below it (cached)."""
+    if category._statistics is not None:
+        return category._statistics
+    # Post-order without recursion; subtrees with cached statistics are not entered
+    stack: list[tuple[BoQCategory, bool]] = [(category, False)]
+    while stack:
+        cat, children_done = stack.pop()
+        if not children_done:
+            stack.append((cat, True))
+            stack.extend((sub, False) for sub in cat.subcategories
+                         if sub._statistics is None)
+            continue
+        stats = BoQStatistics()
+        stats.categories = 1
+        stats.items = len(cat.items)
+        parent = ref(cat)
+        for sub in cat.subcategories:
+            sub._cache_parent = parent
+            stats._merge(sub._statistics)
+        for item in cat.items:
+            item._cache_parent = parent
+            stats._add(item_contribution(item))
+        cat._statistics = stats
+    return category._statistics
@@ -4,8 +4,14 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
+from lvgenerator.models.derived import derived_field
+from lvgenerator.models.money import from_cents
+
 if TYPE_CHECKING:
+    from weakref import ref
+
     from lvgenerator.models.boq import Totals
+    from lvgenerator.models.boq_statistics import BoQStatistics
     from lvgenerator.models.item import Item
     from lvgenerator.models.text_types import AddText
 
@@ -27,6 +33,21 @@ class BoQCategory:
     itemlist_remarks_raw: list = field(default_factory=list)  # Raw XML Remark elements in Itemlist
     perf_descrs_raw: list = field(default_factory=list)  # Raw XML PerfDescr elements in Itemlist
     totals: Optional[Totals] = None
+    # Change counter, bumped by the edit commands (see IncrementalValidator)
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    # Cached content hash and subtree statistics, and the Titel they were
+    # combined into (see node_cache)
+    _content_hash: Optional[bytes] = derived_field()
+    _statistics: Optional[BoQStatistics] = derived_field()
+    _cache_parent: Optional[ref[BoQCategory]] = derived_field()
+
+    def __getstate__(self):
+        # The cached values belong to this tree, copies compute their own
+        state = self.__dict__.copy()
+        state["_content_hash"] = None
+        state["_statistics"] = None
+        state["_cache_parent"] = None
+        return state
 
     def get_full_ordinal(self, parent_ordinal: str = "") -> str:
         if parent_ordinal:
@@ -34,17 +55,28 @@ class BoQCategory:
         return self.rno_part
 
     def calculate_total(self) -> Optional[Decimal]:
-        """Sum of all item totals in this category (recursive)."""
-        total = Decimal("0.00")
+        """Sum of all item totals in this category (recursive).
+
+        Sums the cents cached by the positions as int; positions without
+        cached cents (and an IT with sub-cent digits) are added as Decimal.
+        """
+        cents = 0
+        extra: Optional[Decimal] = None
         has_any = False
-        for item in self.items:
-            item_total = item.it if item.it is not None else item.calculate_total()
-            if item_total is not None:
-                total += item_total
-                has_any = True
-        for sub in self.subcategories:
-            sub_total = sub.calculate_total()
-            if sub_total is not None:
-                total += sub_total
+        stack = [self]
+        while stack:
+            cat = stack.pop()
+            for item in cat.items:
+                value = item.summand()
+                if value is None:
+                    continue
                 has_any = True
-        return total if has_any else None
+                if value.__class__ is int:
+                    cents += value
+                else:
+                    extra = value if extra is None else extra + value
+            stack.extend(cat.subcategories)
+        if not has_any:
+            return None
+        total = from_cents(cents)
+        return total + extra if extra is not None else total
@@ -0,0 +1,103 @@
+"""Structural clone of BoQ nodes for duplication.
+
+Unlike ``copy.deepcopy`` this shares all immutable values with the source
+(strings, Decimals, tuples, raw lxml fragments, which are only ever copied
+when written) and copies only mutable containers and model objects. New
+UUIDs are assigned to categories and items in the same pass.
+"""
+import uuid
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from enum import Enum
+from operator import attrgetter
+
+from lxml import etree
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.derived import is_derived
+from lvgenerator.models.item import Item
+
+_SHARED = (str, bytes, int, float, bool, Decimal, tuple, frozenset, Enum)
+
+# Annotations of fields that can only hold immutable values
+_IMMUTABLE_TYPES = frozenset({
+    "str", "bool", "int", "float", "Decimal",
+    "Optional[str]", "Optional[int]", "Optional[Decimal]",
+})
+
+# class -> (fields copied as is, fields cloned), each [(getter, setter)]
+_PLANS: dict[type, tuple[list, list]] = {}
+
+
+def _plan(cls: type) -> tuple[list, list]:
+    plan = _PLANS.get(cls)
+    if plan is None:
+        direct, deep = [], []
+        slotted = "__slots__" in cls.__dict__
+        for f in fields(cls):
+            if slotted:
+                member = cls.__dict__[f.name]
+                accessors = (member.__get__, member.__set__)
+            else:
+                accessors = (attrgetter(f.name), _dict_setter(f.name))
+            if is_derived(f):
+                # Caches of the source tree start empty in the clone
+                direct.append((_none, accessors[1]))
+                continue
+            type_name = f.type if isinstance(f.type, str) else f.type.__name__
+            (direct if type_name in _IMMUTABLE_TYPES else deep).append(accessors)
+        plan = _PLANS[cls] = (direct, deep)
+    return plan
+
+
+def _none(_obj):
+    return None
+
+
+def _dict_setter(name: str):
+    def set_(obj, value):
+        obj.__dict__[name] = value
+    return set_
+
+
+class _Cloner:
+    def __init__(self, new_ids: bool):
+        self.new_ids = new_ids
+
+    def value(self, value):
+        if value is None or isinstance(value, _SHARED) or etree.iselement(value):
+            return value
+        if isinstance(value, list):
+            return [self.value(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self.value(v) for k, v in value.items()}
+        if is_dataclass(value):
+            return self.node(value)
+        raise TypeError(f"Nicht klonbar: {type(value).__name__}")
+
+    def node(self, obj):
+        cls = type(obj)
+        direct, deep = _plan(cls)
+        clone = object.__new__(cls)
+        for get, set_ in direct:
+            set_(clone, get(obj))
+        for get, set_ in deep:
+            value = get(obj)
+            set_(clone, value if value is None else self.value(value))
+        if self.new_ids and cls in (Item, BoQCategory):
+            clone.id = str(uuid.uuid4())
+        return clone
+
+
+def clone_item(item: Item, new_ids: bool = True) -> Item:
+    """Copy of ``item``; with ``new_ids`` it gets a fresh UUID."""
+    return _Cloner(new_ids).node(item)
+
+
+def clone_category(category: BoQCategory, new_ids: bool = True) -> BoQCategory:
+    """Copy of ``category`` with all subcategories and items.
+
+    With ``new_ids`` every category and item of the copy gets a fresh UUID.
+    """
+    return _Cloner(new_ids).node(category)
+
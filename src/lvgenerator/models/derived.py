@@ -0,0 +1,18 @@
+"""Per-node cache fields that copies must not carry over.
+
+Such fields hold data derived from the tree a node currently belongs to
+(e.g. the content hash and the Titel it was hashed under). Deep copies,
+pickles and structural clones start with the default instead.
+"""
+from dataclasses import Field, field
+
+DERIVED = "derived"
+
+
+def derived_field():
+    return field(default=None, init=False, repr=False, compare=False,
+                 metadata={DERIVED: True})
+
+
+def is_derived(f: Field) -> bool:
+    return f.metadata.get(DERIVED, False)
@@ -1,5 +1,6 @@
 import re
 import math
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation, ROUND_UP, ROUND_DOWN, ROUND_HALF_UP
 from typing import Optional, Tuple
 
@@ -46,7 +47,14 @@ def evaluate_formula(formula: str) -> Tuple[Optional[Decimal], Optional[str]]:
     """
     if not formula.strip():
         return None, None
+    # Results only depend on the formula text and the constants
+    return _evaluate_cached(formula, global_constants.version)
 
+
+@lru_cache(maxsize=4096)
+def _evaluate_cached(
+    formula: str, constants_version: int
+) -> Tuple[Optional[Decimal], Optional[str]]:
     try:
         # Replace constants (case-insensitive)
         expr = formula.upper()
@@ -1,10 +1,10 @@
 import json
 import math
+import os
+import sys
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Tuple
-
-from PySide6.QtCore import QStandardPaths
+from typing import Dict, Optional, Tuple
 
 
 # Type: name -> (value, description)
@@ -32,77 +32,169 @@ def _default_constants() -> ConstantsDict:
     }
 
 
+def app_data_dir() -> Path:
+    """Per-user application data directory, resolved without Qt.
+
+    Matches QStandardPaths.AppDataLocation without application name, so
+    existing settings files are found at the same place.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / "LVGenerator"
+
+
+class ConstantsStorage:
+    """Storage backend for global constants.
+
+    ``load`` returns the persisted constants or None if nothing is stored;
+    backends only deal with the serialized form
+    ``{name: {"value": str, "description": str}}``.
+    """
+
+    def load(self) -> Optional[dict]:
+        raise NotImplementedError
+
+    def save(self, data: dict) -> None:
+        raise NotImplementedError
+
+
+class JsonFileStorage(ConstantsStorage):
+    """Stores the constants as JSON file (default: application data directory)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = Path(path) if path else None
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = app_data_dir() / "global_constants.json"
+        return self._path
+
+    def load(self) -> Optional[dict]:
+        if not self.path.exists():
+            return None
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    def save(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+
+class MemoryStorage(ConstantsStorage):
+    """Keeps the constants in memory only (tests, headless batch runs)."""
+
+    def __init__(self, data: Optional[dict] = None):
+        self.data = data
+
+    def load(self) -> Optional[dict]:
+        return self.data
+
+    def save(self, data: dict) -> None:
+        self.data = data
+
+
 class GlobalConstants:
     """Manages global constants for formula calculations.
 
     Constants are stored as (value, description) tuples, keyed by uppercase name.
-    Persistence uses a JSON file in the application data directory.
+    They are loaded from the storage backend on first access, not on import.
+    ``version`` increases with every change and can be used as cache key.
     """
 
-    def __init__(self):
-        self._constants: ConstantsDict = _default_constants()
-        self._settings_path: Path = self._get_settings_path()
-        self.load()
+    def __init__(self, storage: Optional[ConstantsStorage] = None):
+        self._storage: ConstantsStorage = storage or JsonFileStorage()
+        self._constants: Optional[ConstantsDict] = None
+        self._version = 0
 
-    @staticmethod
-    def _get_settings_path() -> Path:
-        app_data = QStandardPaths.writableLocation(
-            QStandardPaths.StandardLocation.AppDataLocation
-        )
-        path = Path(app_data) / "LVGenerator"
-        path.mkdir(parents=True, exist_ok=True)
-        return path / "global_constants.json"
+    @property
+    def version(self) -> int:
+        """Monotonically increasing change counter."""
+        return self._version
+
+    @property
+    def storage(self) -> ConstantsStorage:
+        return self._storage
+
+    def set_storage(self, storage: ConstantsStorage) -> None:
+        """Switch the storage backend; constants are reloaded on next access."""
+        self._storage = storage
+        self._constants = None
+        self._version += 1
+
+    @property
+    def _data(self) -> ConstantsDict:
+        if self._constants is None:
+            self.load()
+        return self._constants
+
+    def _changed(self) -> None:
+        self._version += 1
 
     def get_constant(self, name: str) -> Tuple[Decimal, str]:
         """Get a constant (value, description) by name."""
-        return self._constants.get(name.upper(), (Decimal(0), ""))
+        return self._data.get(name.upper(), (Decimal(0), ""))
 
     def get_value(self, name: str) -> Decimal:
         """Get just the value of a constant."""
-        return self._constants.get(name.upper(), (Decimal(0), ""))[0]
+        return self._data.get(name.upper(), (Decimal(0), ""))[0]
 
     def set_constant(self, name: str, value: Decimal, description: str = "") -> None:
         """Set a constant with value and description."""
-        self._constants[name.upper()] = (value, description)
+        self._data[name.upper()] = (value, description)
+        self._changed()
 
     def remove_constant(self, name: str) -> None:
         """Remove a constant."""
-        self._constants.pop(name.upper(), None)
+        if self._data.pop(name.upper(), None) is not None:
+            self._changed()
+
+    def replace_all(self, constants: ConstantsDict) -> None:
+        """Replace all constants at once."""
+        self._constants = {name.upper(): entry for name, entry in constants.items()}
+        self._changed()
 
     def get_all_constants(self) -> ConstantsDict:
         """Get all constants as a copy."""
-        return self._constants.copy()
+        return self._data.copy()
 
     def reset_defaults(self) -> None:
         """Reset to built-in default constants."""
         self._constants = _default_constants()
+        self._changed()
 
     def save(self) -> None:
-        """Persist constants to JSON file."""
+        """Persist constants to the storage backend."""
         data = {}
-        for name, (value, desc) in self._constants.items():
+        for name, (value, desc) in self._data.items():
             data[name] = {"value": str(value), "description": desc}
         try:
-            self._settings_path.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            self._storage.save(data)
         except OSError:
             pass
 
     def load(self) -> None:
-        """Load constants from JSON file, falling back to defaults."""
-        if not self._settings_path.exists():
-            return
+        """Load constants from the storage backend, falling back to defaults."""
         try:
-            data = json.loads(self._settings_path.read_text(encoding="utf-8"))
-            self._constants = {}
-            for name, entry in data.items():
-                value = Decimal(entry["value"])
-                desc = entry.get("description", "")
-                self._constants[name.upper()] = (value, desc)
-        except (OSError, json.JSONDecodeError, KeyError, Exception):
-            self._constants = _default_constants()
-
-
-# Global singleton instance
+            data = self._storage.load()
+            if data is None:
+                constants = _default_constants()
+            else:
+                constants = {}
+                for name, entry in data.items():
+                    value = Decimal(entry["value"])
+                    desc = entry.get("description", "")
+                    constants[name.upper()] = (value, desc)
+        except Exception:
+            constants = _default_constants()
+        self._constants = constants
+        self._changed()
+
+
+# Global singleton instance (loaded lazily on first access)
 global_constants = GlobalConstants()
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from decimal import Decimal
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Union
+
+from lvgenerator.models.derived import derived_field, is_derived
+from lvgenerator.models.money import from_cents, line_total, line_total_cents, to_cents
 
 if TYPE_CHECKING:
+    from weakref import ref
+
+    from lvgenerator.models.category import BoQCategory
     from lvgenerator.models.text_types import AddText
 
 
-@dataclass
+def _copy_without_derived(cls):
+    """Slot-aware pickling for a slots dataclass; derived fields are reset,
+    so copies and pickles do not carry caches of the source tree."""
+    names = tuple(f.name for f in fields(cls))
+    derived = frozenset(f.name for f in fields(cls) if is_derived(f))
+
+    def __getstate__(self):
+        return tuple(
+            None if name in derived else getattr(self, name)
+            for name in names
+        )
+
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            setattr(self, name, value)
+
+    cls.__getstate__ = __getstate__
+    cls.__setstate__ = __setstate__
+    return cls
+
+
+@dataclass(slots=True)
 class SubDescription:
     """Unterbeschreibung (SubDescr) fuer Leit-/Unterbeschreibungen."""
     sub_d_no: str = ""
@@ -18,14 +45,15 @@ class SubDescription:
     description: Optional[ItemDescription] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CtlgAssignment:
     """Katalogzuordnung (CtlgAssign)."""
     ctlg_id: str = ""
     ctlg_code: str = ""
 
 
-@dataclass
+@_copy_without_derived
+@dataclass(slots=True)
 class ItemDescription:
     outline_text: str = ""
     detail_text: str = ""
@@ -38,9 +66,15 @@ class ItemDescription:
     text_complements_raw: list = field(default_factory=list)  # Raw TextComplement XML
     detail_txt_raw: Optional[object] = None  # Raw DetailTxt XML for roundtrip (interleaved Text/TextComplement)
     perf_descr_raw: Optional[object] = None  # Raw PerfDescr XML element
+    # Change counter, bumped by the edit commands (see IncrementalValidator)
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    # Cached content hash and the item it was combined into (see node_cache)
+    _content_hash: Optional[bytes] = derived_field()
+    _cache_parent: Optional[ref[Item]] = derived_field()
 
 
-@dataclass
+@_copy_without_derived
+@dataclass(slots=True, weakref_slot=True)
 class Item:
     id: str = ""
     rno_part: str = ""
@@ -106,11 +140,61 @@ class Item:
     bid_comments: list[str] = field(default_factory=list)
     text_compls: list[str] = field(default_factory=list)
 
+    # Cached cent values, keyed by identity of the (immutable) Decimal inputs
+    _total_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _it_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Change counter, bumped by the edit commands (see IncrementalValidator)
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    # Cached content hash and the Titel it was combined into (see node_cache)
+    _content_hash: Optional[bytes] = derived_field()
+    _cache_parent: Optional[ref[BoQCategory]] = derived_field()
+
     def calculate_total(self) -> Optional[Decimal]:
-        effective_qty = self.get_effective_qty()
-        if effective_qty is not None and self.up is not None:
-            return (effective_qty * self.up).quantize(Decimal("0.01"))
-        return None
+        cents = self.total_cents()
+        return from_cents(cents) if cents is not None else None
+
+    def total_cents(self) -> Optional[int]:
+        """calculate_total() in integer cents."""
+        qty = self.get_effective_qty() if self.use_calculated_qty else self.qty
+        up = self.up
+        cache = self._total_cache
+        if cache is not None and cache[0] is qty and cache[1] is up:
+            return cache[2]
+        cents = line_total_cents(qty, up) if qty is not None and up is not None else None
+        self._total_cache = (qty, up, cents)
+        return cents
+
+    def it_cents(self) -> Optional[int]:
+        """IT in integer cents; None if not set or not representable in cents."""
+        it = self.it
+        cache = self._it_cache
+        if cache is not None and cache[0] is it:
+            return cache[1]
+        cents = to_cents(it) if it is not None else None
+        self._it_cache = (it, cents)
+        return cents
+
+    def summand(self) -> Union[int, Decimal, None]:
+        """Contribution to a sum: the cached cents if total_cents() or
+        it_cents() already computed them, otherwise the Decimal amount.
+
+        Does not fill the caches, so one pass over an LV costs no more
+        than the plain Decimal summation.
+        """
+        it = self.it
+        if it is not None:
+            cache = self._it_cache
+            if cache is not None and cache[0] is it and cache[1] is not None:
+                return cache[1]
+            return it
+        qty = self.get_effective_qty() if self.use_calculated_qty else self.qty
+        up = self.up
+        cache = self._total_cache
+        if cache is not None and cache[0] is qty and cache[1] is up:
+            return cache[2]
+        if qty is None or up is None:
+            return None
+        return line_total(qty, up)
 
     def get_effective_qty(self) -> Optional[Decimal]:
         """Get the effective quantity: calculated if use_calculated_qty is True, else manual qty."""
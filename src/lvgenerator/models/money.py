@@ -0,0 +1,41 @@
+"""Fixed-point helpers for money totals.
+
+Summation loops work on int cents; values are converted back to Decimal at
+the API boundary. Position totals are still rounded once with
+``Decimal.quantize`` so the GAEB rounding (two places, half-even as in the
+Decimal context) is unchanged.
+"""
+from decimal import Decimal
+from typing import Optional
+
+CENT = Decimal("0.01")
+_HUNDRED = Decimal(100)
+
+
+def to_cents(value: Decimal) -> Optional[int]:
+    """Exact amount in cents, or None if ``value`` has sub-cent digits."""
+    scaled = value.scaleb(2)
+    cents = int(scaled)
+    return cents if cents == scaled else None
+
+
+def from_cents(cents: int) -> Decimal:
+    """Decimal with two places, e.g. 25500 -> Decimal("255.00")."""
+    return Decimal(cents).scaleb(-2)
+
+
+def line_total(qty: Decimal, up: Decimal) -> Decimal:
+    """Position total qty x UP rounded to cents."""
+    return (qty * up).quantize(CENT)
+
+
+def line_total_cents(qty: Decimal, up: Decimal) -> int:
+    """line_total() in integer cents."""
+    return int(line_total(qty, up) * _HUNDRED)
+
+
+def apply_percent(value: Decimal, percent: Decimal) -> Decimal:
+    """``value`` raised by ``percent`` (negative: reduced), keeping its
+    number of decimal places but at least cents."""
+    exponent = min(value.as_tuple().exponent, -2)
+    return (value * (_HUNDRED + percent) / _HUNDRED).quantize(Decimal(1).scaleb(exponent))
@@ -0,0 +1,64 @@
+"""Caches on BoQ nodes that are combined bottom-up from the children.
+
+A node caches what it computed from its subtree: the content hash
+(``_content_hash``, see boq_hash) and, for a Titel, the statistics of its
+subtree (``_statistics``, see boq_statistics). When a Titel combines its
+children, each child remembers the Titel weakly (``_cache_parent``).
+
+The commands and editors drop the caches of a changed node and of every
+Titel above it (``invalidate_node_caches``). The walk stops at the first
+Titel without any cache: a cached value implies cached values below it, so
+nothing above can have been computed from the changed node. After an edit
+only the changed path is combined again. Changes made outside of commands
+need ``reset_node_caches`` (``BoQ.invalidate()``).
+"""
+from __future__ import annotations
+
+from typing import Optional, Union
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item, ItemDescription
+
+Node = Union[BoQCategory, Item]
+
+
+def cache_parent(node: Union[Node, ItemDescription]) -> Optional[Union[Node, Item]]:
+    """The node ``node`` was last combined into, if it still exists."""
+    parent = node._cache_parent
+    return parent() if parent is not None else None
+
+
+def invalidate_node_caches(node: Union[Node, ItemDescription, None]) -> None:
+    """Drop the cached values of ``node`` and of every Titel above it."""
+    while node is not None:
+        if isinstance(node, BoQCategory):
+            if node._content_hash is None and node._statistics is None:
+                return
+            node._statistics = None
+        node._content_hash = None
+        node = cache_parent(node)
+
+
+def invalidate_parent_caches(node: Node, parent: Optional[BoQCategory] = None) -> None:
+    """Drop the cached values above ``node`` before or after it is added,
+    moved or removed; ``parent`` is the Titel whose list changes, if known.
+
+    A node combined before knows its Titel; a new one does not, so
+    inserting into an empty list needs ``parent``.
+    """
+    invalidate_node_caches(parent)
+    invalidate_node_caches(cache_parent(node))
+
+
+def reset_node_caches(categories: list[BoQCategory]) -> None:
+    """Drop all cached values below ``categories``, after changes made
+    outside of commands."""
+    stack = list(categories)
+    while stack:
+        cat = stack.pop()
+        cat._content_hash = None
+        cat._statistics = None
+        for item in cat.items:
+            item._content_hash = None
+            item.description._content_hash = None
+        stack.extend(cat.subcategories)
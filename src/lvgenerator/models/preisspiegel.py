@@ -11,6 +11,14 @@ class BidderInfo:
     file_path: str
 
 
+@dataclass(frozen=True)
+class BidderPrice:
+    """Preisangaben eines Bieters zu einer Position."""
+    up: Optional[Decimal] = None
+    it: Optional[Decimal] = None
+    not_offered: bool = False
+
+
 @dataclass
 class PreisSpiegelRow:
     oz: str
@@ -0,0 +1,63 @@
+import sys
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TextPoolStats:
+    """Deduplizierungsstatistik eines TextPool."""
+    unique: int = 0
+    requests: int = 0
+    hits: int = 0
+    unique_bytes: int = 0
+    saved_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+
+class TextPool:
+    """Content-addressed pool for texts, units and HTML fragments.
+
+    ``intern`` returns the pooled instance for equal content, so repeated
+    long texts across many positions are stored once. The pool itself only
+    holds references; it can be dropped after loading without affecting
+    the shared strings.
+    """
+
+    def __init__(self):
+        self._pool: dict[str, str] = {}
+        self._requests = 0
+        self._hits = 0
+        self._unique_bytes = 0
+        self._saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def intern(self, text: str) -> str:
+        if not text:
+            return text
+        self._requests += 1
+        pooled = self._pool.get(text)
+        if pooled is None:
+            self._pool[text] = text
+            self._unique_bytes += sys.getsizeof(text)
+            return text
+        self._hits += 1
+        if pooled is not text:
+            self._saved_bytes += sys.getsizeof(text)
+        return pooled
+
+    def stats(self) -> TextPoolStats:
+        return TextPoolStats(
+            unique=len(self._pool),
+            requests=self._requests,
+            hits=self._hits,
+            unique_bytes=self._unique_bytes,
+            saved_bytes=self._saved_bytes,
+        )
+
+    def clear(self) -> None:
+        self._pool.clear()
+        self._requests = self._hits = self._unique_bytes = self._saved_bytes = 0
@@ -192,3 +192,12 @@ def icon_duplicate() -> QIcon:
     p.drawLine(QPointF(7, 15), QPointF(13, 15))
     p.drawLine(QPointF(7, 18), QPointF(11, 18))
     return _finish(px, p)
+
+
+def icon_badge(color: str) -> QIcon:
+    """Filled dot, used as error/warning badge in the tree."""
+    px, p = _begin(12)
+    p.setPen(Qt.NoPen)
+    p.setBrush(QBrush(QColor(color)))
+    p.drawEllipse(QRectF(2, 2, 8, 8))
+    return _finish(px, p)
@@ -0,0 +1,95 @@
+"""Batch validation of many LV files (quality gate before award).
+
+Each file is checked against its XSD schema, read, validated with the
+project validator and its ordinal numbers are checked against the OZ mask.
+Every finding becomes one ``FileProblem`` record tagged with file path and
+full OZ; records are written as JSON lines so reports of many files can be
+combined and filtered with standard tools. Qt-free, so it can run in worker
+processes.
+"""
+import json
+from dataclasses import asdict, dataclass
+from typing import Iterable, TextIO
+
+from lvgenerator.validators import (
+    IncrementalValidator,
+    mask_level_for_category,
+    mask_level_for_item,
+    validate_project_info,
+    validate_rno_part,
+)
+
+
+@dataclass(frozen=True)
+class FileProblem:
+    """Ein Befund der Stapelprüfung."""
+    file: str
+    source: str  # "xsd", "read", "lv" oder "oz"
+    severity: str
+    message: str
+    oz: str = ""
+    field: str = ""
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+def check_file(file_path: str, xsd: bool = True) -> list[FileProblem]:
+    """Run all checks on one file; read errors are reported, not raised."""
+    from lvgenerator.gaeb.reader import GAEBReader
+
+    problems: list[FileProblem] = []
+    if xsd:
+        from lvgenerator.gaeb.xsd_validator import validate_file
+
+        for error in validate_file(file_path).errors:
+            problems.append(FileProblem(
+                file_path, "xsd", "error", f"Zeile {error.line}: {error.message}",
+                field="xml",
+            ))
+
+    try:
+        project = GAEBReader().read(file_path)
+    except Exception as e:
+        problems.append(FileProblem(file_path, "read", "error", f"{type(e).__name__}: {e}"))
+        return problems
+
+    for error in validate_project_info(project):
+        problems.append(FileProblem(
+            file_path, "lv", error.severity, error.message, field=error.field_name
+        ))
+    if project.boq is None:
+        return problems
+
+    for problem in IncrementalValidator().problems(project):
+        problems.append(FileProblem(
+            file_path, "lv", problem.error.severity, problem.error.message,
+            oz=problem.oz, field=problem.error.field_name,
+        ))
+
+    breakdowns = project.boq.info.breakdowns
+    if breakdowns:
+        snapshot = project.boq.snapshot()
+        item_mask = mask_level_for_item(breakdowns)
+        for row in range(len(snapshot)):
+            node = snapshot.nodes[row]
+            if snapshot.is_item[row]:
+                mask = item_mask
+            else:
+                mask = mask_level_for_category(breakdowns, snapshot.depth[row])
+            message = validate_rno_part(node.rno_part, mask)
+            if message:
+                problems.append(FileProblem(
+                    file_path, "oz", "error", message,
+                    oz=snapshot.oz[row], field="rno_part",
+                ))
+    return problems
+
+
+def write_jsonl(problems: Iterable[FileProblem], out: TextIO) -> int:
+    """Append problems as JSON lines; returns the number of records."""
+    count = 0
+    for problem in problems:
+        out.write(problem.to_json() + "\n")
+        count += 1
+    return count
@@ -0,0 +1,177 @@
+"""Persistent cache of bidder price maps extracted from X84 files.
+
+Parsing a bid is by far the most expensive part of building a Preisspiegel.
+The cache stores the extracted OZ -> price map and the contractor name in a
+SQLite database in the application data directory, keyed by the SHA-256 of
+the file content. A path/mtime/size table avoids re-hashing unchanged files.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+from lvgenerator.models.global_constants import app_data_dir
+from lvgenerator.models.preisspiegel import BidderPrice
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    hash TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+"""
+
+
+def _encode_prices(prices: dict[str, BidderPrice]) -> bytes:
+    rows = [
+        [oz,
+         str(p.up) if p.up is not None else None,
+         str(p.it) if p.it is not None else None,
+         1 if p.not_offered else 0]
+        for oz, p in prices.items()
+    ]
+    return zlib.compress(json.dumps(rows, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode_prices(payload: bytes) -> dict[str, BidderPrice]:
+    rows = json.loads(zlib.decompress(payload).decode("utf-8"))
+    return {
+        oz: BidderPrice(
+            up=Decimal(up) if up is not None else None,
+            it=Decimal(it) if it is not None else None,
+            not_offered=bool(not_offered),
+        )
+        for oz, up, it, not_offered in rows
+    }
+
+
+class BidderPriceCache:
+    """Size-bounded on-disk cache of parsed bidder price maps.
+
+    Entries are evicted least-recently-used first once the stored payloads
+    exceed ``max_bytes``. Database errors are treated as cache misses.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self._db_path = Path(db_path) if db_path else self._get_db_path()
+        self._max_bytes = max_bytes
+        try:
+            with closing(self._connect()) as conn:
+                conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _get_db_path() -> Path:
+        path = app_data_dir()
+        path.mkdir(parents=True, exist_ok=True)
+        return path / "bidder_cache.sqlite"
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path)
+
+    def file_key(self, file_path: str) -> str:
+        """Content hash of a file; unchanged files (same mtime and size) are not re-read."""
+        path = Path(file_path)
+        stat = path.stat()
+        abs_path = str(path.resolve())
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT mtime_ns, size, hash FROM files WHERE path = ?",
+                    (abs_path,),
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return row[2]
+
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size, hash) "
+                    "VALUES (?, ?, ?, ?)",
+                    (abs_path, stat.st_mtime_ns, stat.st_size, digest),
+                )
+        except sqlite3.Error:
+            pass
+        return digest
+
+    def get(self, key: str) -> Optional[tuple[str, dict[str, BidderPrice]]]:
+        """Return (contractor name, price map) for a content hash, or None."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT name, payload FROM entries WHERE hash = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET last_used = ? WHERE hash = ?",
+                    (time.time(), key),
+                )
+            return row[0], _decode_prices(row[1])
+        except (sqlite3.Error, zlib.error, ValueError):
+            return None
+
+    def put(self, key: str, name: str, prices: dict[str, BidderPrice]) -> None:
+        """Store a parsed bid and evict old entries beyond the size budget."""
+        payload = _encode_prices(prices)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (hash, name, payload, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, name, payload, len(payload), time.time()),
+                )
+                self._evict(conn)
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM entries")
+                conn.execute("DELETE FROM files")
+        except sqlite3.Error:
+            pass
+
+    def total_size(self) -> int:
+        """Total payload size of all cached entries in bytes."""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return row[0]
+        except sqlite3.Error:
+            return 0
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        used = 0
+        stale: list[tuple[str]] = []
+        for key, size in conn.execute(
+            "SELECT hash, size FROM entries ORDER BY last_used DESC, rowid DESC"
+        ):
+            used += size
+            if used > self._max_bytes:
+                stale.append((key,))
+        if stale:
+            conn.executemany("DELETE FROM entries WHERE hash = ?", stale)
+            conn.execute("DELETE FROM files WHERE hash NOT IN (SELECT hash FROM entries)")
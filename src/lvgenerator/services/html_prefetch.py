@@ -0,0 +1,61 @@
+"""Background preparation of item editor HTML for neighbouring positions.
+
+When a position is selected, the outline and detail texts of the next and
+previous positions are converted to Qt HTML on a worker thread. The results
+land in the LRU cache of ``gaeb_html_to_qt_html``, so stepping through the
+tree with the arrow keys only has to load already converted HTML.
+QTextDocuments are not prepared ahead: they belong to the GUI thread.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+from lvgenerator.gaeb.html_converter import gaeb_html_to_qt_html
+from lvgenerator.models.item import Item
+
+
+class HtmlPrefetcher:
+    """Konvertiert Texte benachbarter Positionen im Hintergrund vor."""
+
+    def __init__(self, radius: int = 3):
+        self.radius = radius
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        # Bumped by shutdown(); a running conversion stops at the next text
+        self._generation = 0
+        self.converted = 0
+
+    def prefetch(self, items: Iterable[Item], font_family: str, font_size_pt: int) -> Future:
+        """Queue the texts of ``items``; a not yet started older request is dropped."""
+        texts = [
+            html
+            for item in items
+            for html in (item.description.outline_html, item.description.detail_html)
+            if html
+        ]
+        if self._pending is not None:
+            self._pending.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="html-prefetch"
+            )
+        self._pending = self._executor.submit(
+            self._convert, texts, font_family, font_size_pt, self._generation
+        )
+        return self._pending
+
+    def _convert(self, texts: list[str], font_family: str, font_size_pt: int,
+                 generation: int) -> None:
+        for html in texts:
+            if generation != self._generation:
+                return
+            gaeb_html_to_qt_html(html, font_family, font_size_pt)
+            self.converted += 1
+
+    def shutdown(self) -> None:
+        """Drop queued requests and stop the running one; a later prefetch()
+        starts a new worker."""
+        self._generation += 1
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pending = None
@@ -0,0 +1,398 @@
+"""Three-way merge of LVs edited in parallel copies.
+
+``base`` is the common ancestor, ``ours`` and ``theirs`` are the edited
+copies. The result starts as a structural clone of ours; every change theirs
+made relative to base is carried over unless ours changed the same thing
+differently, in which case ours is kept and a ``MergeConflict`` is recorded.
+
+Nodes are matched to base by id and, where ids differ, by full OZ, through
+the ``BoQIndex`` of each side, so merging is linear in the size of the LV.
+A Titel whose content hash (models/boq_hash.py) is unchanged in theirs is
+skipped as a whole. Items merge at field granularity; the texts of a
+position count as one field (``description``). Qt-free.
+
+Only the fields covered by the content hash are merged: ``rno_part``,
+``ITEM_HASH_FIELDS`` with the texts, and label and execution description
+of a Titel. Changes theirs made to other fields (e.g. ``markup_value``,
+``up_components``, ``sub_descriptions``, catalogue assignments) are
+neither carried over nor reported; the result keeps ours' values.
+"""
+from copy import deepcopy
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Callable, Optional, Union
+
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.boq_hash import (
+    DESCRIPTION_HASH_FIELDS,
+    ITEM_HASH_FIELDS,
+    content_hash,
+)
+from lvgenerator.models.boq_index import BoQIndex
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.clone import clone_category, clone_item
+from lvgenerator.models.item import Item
+from lvgenerator.models.project import GAEBProject
+
+Node = Union[BoQCategory, Item]
+
+# Konfliktarten
+FIELD = "field"                          # beide Seiten ändern ein Feld verschieden
+DELETED_BY_OURS = "deleted_by_ours"      # ours löscht, theirs ändert
+DELETED_BY_THEIRS = "deleted_by_theirs"  # theirs löscht, ours ändert
+ADDED_BY_BOTH = "added_by_both"          # gleiche OZ mit verschiedenem Inhalt
+MOVED_BY_BOTH = "moved_by_both"          # verschoben in verschiedene Titel
+MISSING_PARENT = "missing_parent"        # Ziel-Titel existiert in ours nicht mehr
+
+
+@dataclass(frozen=True)
+class MergeConflict:
+    """Nicht automatisch auflösbare Änderung; im Ergebnis gilt ours."""
+    kind: str
+    oz: str
+    node_id: str = ""
+    field: str = ""
+    base: object = None
+    ours: object = None
+    theirs: object = None
+
+
+@dataclass
+class MergeResult:
+    project: GAEBProject
+    conflicts: list[MergeConflict] = field(default_factory=list)
+    applied: int = 0  # von theirs übernommene Änderungen
+
+    @property
+    def clean(self) -> bool:
+        return not self.conflicts
+
+
+def _copy_attrs(*names: str) -> Callable[[Node, Node], None]:
+    def apply(target: Node, source: Node) -> None:
+        for name in names:
+            setattr(target, name, getattr(source, name))
+    return apply
+
+
+def _copy_description(target: Item, source: Item) -> None:
+    target.description = clone_item(source, new_ids=False).description
+
+
+_description_values = attrgetter(*DESCRIPTION_HASH_FIELDS)
+
+# (Feld, Getter, Übernahme von theirs)
+ITEM_FIELDS = [
+    (name, attrgetter(name), _copy_attrs(name))
+    for name in ("rno_part", *ITEM_HASH_FIELDS)
+] + [("description", lambda item: _description_values(item.description), _copy_description)]
+
+CATEGORY_FIELDS = [
+    ("rno_part", attrgetter("rno_part"), _copy_attrs("rno_part")),
+    ("label", attrgetter("label", "label_html"), _copy_attrs("label", "label_html")),
+    ("exec_descr", attrgetter("exec_descr", "exec_descr_html"),
+     _copy_attrs("exec_descr", "exec_descr_html")),
+]
+
+
+def _walk(categories: list[BoQCategory]):
+    """All categories and items, parents before children."""
+    stack = list(reversed(categories))
+    while stack:
+        cat = stack.pop()
+        yield cat
+        yield from cat.items
+        stack.extend(reversed(cat.subcategories))
+
+
+def _pair(source: list[BoQCategory], clone: list[BoQCategory],
+          mapping: dict[int, Node], parents: dict[int, Optional[BoQCategory]],
+          parent: Optional[BoQCategory] = None) -> None:
+    """Map id(source node) -> clone node for two structurally equal trees."""
+    stack = [(source, clone, parent)]
+    while stack:
+        source_level, clone_level, level_parent = stack.pop()
+        for cat, cat_clone in zip(source_level, clone_level):
+            mapping[id(cat)] = cat_clone
+            parents[id(cat_clone)] = level_parent
+            for item, item_clone in zip(cat.items, cat_clone.items):
+                mapping[id(item)] = item_clone
+                parents[id(item_clone)] = cat_clone
+            stack.append((cat.subcategories, cat_clone.subcategories, cat_clone))
+
+
+def _match(base: BoQIndex, base_nodes: list[Node], side: BoQIndex) -> dict[int, Node]:
+    """id(base node) -> node of ``side``: by id first, then by full OZ."""
+    matched: dict[int, Node] = {}
+    used: set[int] = set()
+    unmatched: list[Node] = []
+    for node in base_nodes:
+        candidate = side.by_id(node.id) if node.id else None
+        if candidate is not None and type(candidate) is type(node):
+            matched[id(node)] = candidate
+            used.add(id(candidate))
+        else:
+            unmatched.append(node)
+    for node in unmatched:
+        oz = base.full_oz(node)
+        if isinstance(node, Item):
+            candidate = side.item(oz)
+        else:
+            candidate = side.category(oz)
+        # A node whose id belongs to another base node is not free for OZ matching
+        if (candidate is not None and id(candidate) not in used
+                and not (candidate.id and base.by_id(candidate.id) is not None)):
+            matched[id(node)] = candidate
+            used.add(id(candidate))
+    return matched
+
+
+class _Merger:
+    def __init__(self, base: BoQ, ours: BoQ, theirs: BoQ, result: BoQ):
+        self.base, self.ours, self.theirs = base.index, ours.index, theirs.index
+        self.root = result.categories
+        self.conflicts: list[MergeConflict] = []
+        self.applied = 0
+
+        base_nodes = list(_walk(base.categories))
+        self.ours_of = _match(self.base, base_nodes, self.ours)
+        self.theirs_of = _match(self.base, base_nodes, self.theirs)
+        self.base_of_ours = {id(n): b for b in base_nodes
+                             if (n := self.ours_of.get(id(b))) is not None}
+        self.base_of_theirs = {id(n): b for b in base_nodes
+                               if (n := self.theirs_of.get(id(b))) is not None}
+
+        # id(ours or theirs node) -> result node, id(result node) -> result parent
+        self.result_of: dict[int, Node] = {}
+        self.parent_of: dict[int, Optional[BoQCategory]] = {}
+        _pair(ours.categories, result.categories, self.result_of, self.parent_of)
+
+        self.moves: list[tuple[Node, Node, Node]] = []  # (result, theirs, base)
+        self.deletions: list[Node] = []
+
+    # ── Helpers ──────────────────────────────────────────────────
+
+    def _conflict(self, kind: str, node: Node, oz: str, **values) -> None:
+        self.conflicts.append(MergeConflict(kind, oz, node.id, **values))
+
+    def _unchanged(self, base_node: Node, node: Node, index: BoQIndex,
+                   base_of: dict[int, Node]) -> bool:
+        # Cached on the nodes; ours is only hashed where theirs deleted something
+        return (
+            content_hash(node) == content_hash(base_node)
+            and node.rno_part == base_node.rno_part
+            and not self._moved(base_node, node, index, base_of)
+        )
+
+    def _moved(self, base_node: Node, node: Node, index: BoQIndex,
+               base_of: dict[int, Node]) -> bool:
+        parent = index.parent(node)
+        base_parent = self.base.parent(base_node)
+        if parent is None:
+            return base_parent is not None
+        return base_of.get(id(parent)) is not base_parent
+
+    def _result_parent(self, theirs_parent: Optional[BoQCategory]
+                       ) -> tuple[bool, Optional[BoQCategory]]:
+        """Result counterpart of a theirs category; (False, None) if ours dropped it."""
+        if theirs_parent is None:
+            return True, None
+        base_parent = self.base_of_theirs.get(id(theirs_parent))
+        if base_parent is not None:
+            ours_parent = self.ours_of.get(id(base_parent))
+            node = self.result_of.get(id(ours_parent)) if ours_parent is not None else None
+        else:
+            node = self.result_of.get(id(theirs_parent))
+        return node is not None, node
+
+    def _container(self, parent: Optional[BoQCategory], node: Node) -> list:
+        if parent is None:
+            return self.root
+        return parent.items if isinstance(node, Item) else parent.subcategories
+
+    def _insert(self, node: Node, parent: Optional[BoQCategory]) -> None:
+        container = self._container(parent, node)
+        position = next(
+            (n for n, sibling in enumerate(container) if sibling.rno_part > node.rno_part),
+            len(container),
+        )
+        container.insert(position, node)
+        self.parent_of[id(node)] = parent
+
+    def _remove(self, node: Node) -> None:
+        container = self._container(self.parent_of.get(id(node)), node)
+        for n, sibling in enumerate(container):
+            if sibling is node:
+                del container[n]
+                return
+
+    # ── Phases ───────────────────────────────────────────────────
+
+    def merge_base_nodes(self, categories: list[BoQCategory]) -> None:
+        stack = list(reversed(categories))
+        while stack:
+            cat = stack.pop()
+            if self._merge_node(cat, CATEGORY_FIELDS):
+                for item in cat.items:
+                    self._merge_node(item, ITEM_FIELDS)
+                stack.extend(reversed(cat.subcategories))
+
+    def _merge_node(self, base_node: Node, fields: list) -> bool:
+        """Carry over theirs' changes of one node; False if its subtree is done."""
+        ours = self.ours_of.get(id(base_node))
+        theirs = self.theirs_of.get(id(base_node))
+        oz = self.base.full_oz(base_node)
+        if theirs is None:
+            if ours is None:
+                return False
+            if self._unchanged(base_node, ours, self.ours, self.base_of_ours):
+                self.deletions.append(self.result_of[id(ours)])
+            else:
+                self._conflict(DELETED_BY_THEIRS, base_node, oz)
+            return True
+        if self._unchanged(base_node, theirs, self.theirs, self.base_of_theirs):
+            return False
+        if ours is None:
+            self._conflict(DELETED_BY_OURS, base_node, oz)
+            return False
+
+        result = self.result_of[id(ours)]
+        for name, get, apply in fields:
+            base_value, theirs_value = get(base_node), get(theirs)
+            if theirs_value == base_value:
+                continue
+            ours_value = get(ours)
+            if ours_value == base_value:
+                apply(result, theirs)
+                self.applied += 1
+            elif ours_value != theirs_value:
+                self._conflict(FIELD, base_node, oz, field=name, base=base_value,
+                               ours=ours_value, theirs=theirs_value)
+        self._merge_move(base_node, ours, theirs, result, oz)
+        return True
+
+    def _merge_move(self, base_node: Node, ours: Node, theirs: Node, result: Node,
+                    oz: str) -> None:
+        if not self._moved(base_node, theirs, self.theirs, self.base_of_theirs):
+            return
+        theirs_parent = self.theirs.parent(theirs)
+        if self._moved(base_node, ours, self.ours, self.base_of_ours):
+            ours_parent = self.ours.parent(ours)
+            ours_target = self.ours.full_oz(ours_parent) if ours_parent else ""
+            theirs_target = self.theirs.full_oz(theirs_parent) if theirs_parent else ""
+            if ours_target != theirs_target:
+                self._conflict(MOVED_BY_BOTH, base_node, oz,
+                               ours=ours_target, theirs=theirs_target)
+            return
+        # Applied after the additions, the target may be a Titel added by theirs
+        self.moves.append((result, theirs, base_node))
+
+    def add_theirs_nodes(self, categories: list[BoQCategory]) -> None:
+        stack = list(reversed(categories))
+        while stack:
+            cat = stack.pop()
+            if self._add_node(cat):
+                for item in cat.items:
+                    self._add_node(item)
+                stack.extend(reversed(cat.subcategories))
+
+    def _add_node(self, node: Node) -> bool:
+        """Insert a node added by theirs; False if its subtree is done."""
+        if id(node) in self.base_of_theirs:
+            return True
+        oz = self.theirs.full_oz(node)
+        found, parent = self._result_parent(self.theirs.parent(node))
+        if not found:
+            self._conflict(MISSING_PARENT, node, oz)
+            return False
+        existing = next(
+            (s for s in self._container(parent, node) if s.rno_part == node.rno_part),
+            None,
+        )
+        if existing is None:
+            if isinstance(node, Item):
+                clone = clone_item(node, new_ids=False)
+            else:
+                clone = clone_category(node, new_ids=False)
+                _pair([node], [clone], self.result_of, self.parent_of, parent)
+            self._insert(clone, parent)
+            self.applied += 1
+            return False
+        if isinstance(node, BoQCategory):
+            # Both added a Titel with this OZ: merge the contents into ours
+            self.result_of[id(node)] = existing
+            return True
+        if not _same_content(node, existing):
+            self._conflict(ADDED_BY_BOTH, node, oz)
+        return False
+
+    def apply_moves(self) -> None:
+        for result, theirs, base_node in self.moves:
+            clone = self.result_of.get(id(theirs))
+            if clone is not None:
+                # Copied along with a Titel added by theirs: the merged node
+                # takes the place of that copy
+                parent = self.parent_of[id(clone)]
+                container = self._container(parent, clone)
+                self._remove(result)
+                container[next(n for n, s in enumerate(container) if s is clone)] = result
+                self.parent_of[id(result)] = parent
+                self.applied += 1
+                continue
+            found, parent = self._result_parent(self.theirs.parent(theirs))
+            if not found:
+                self._conflict(MISSING_PARENT, base_node, self.base.full_oz(base_node))
+                continue
+            self._remove(result)
+            self._insert(result, parent)
+            self.applied += 1
+
+    def apply_deletions(self) -> None:
+        # Items first, a deleted Titel may still hold items moved out of it
+        for node in sorted(self.deletions, key=lambda n: isinstance(n, BoQCategory)):
+            self._remove(node)
+            self.applied += 1
+
+
+def _same_content(a: Item, b: Item) -> bool:
+    return all(get(a) == get(b) for _name, get, _apply in ITEM_FIELDS)
+
+
+def merge_projects(base: GAEBProject, ours: GAEBProject,
+                   theirs: GAEBProject) -> MergeResult:
+    """Merge theirs' changes since base into a copy of ours.
+
+    Fields outside the content hash keep ours' values, also where theirs
+    changed them (see module docstring).
+    """
+    empty = BoQ()
+    ours_boq = ours.boq or empty
+    categories = [clone_category(cat, new_ids=False) for cat in ours_boq.categories]
+    # Everything besides the tree is a deep copy of ours; the memo entries
+    # substitute the cloned tree instead of deep-copying it a second time
+    result_boq = deepcopy(ours_boq, {id(ours_boq.categories): categories})
+    project = deepcopy(ours, {id(ours.boq): result_boq} if ours.boq else None)
+    project.boq = result_boq
+
+    merger = _Merger(base.boq or empty, ours_boq, theirs.boq or empty, result_boq)
+    merger.merge_base_nodes((base.boq or empty).categories)
+    merger.add_theirs_nodes((theirs.boq or empty).categories)
+    merger.apply_moves()
+    merger.apply_deletions()
+    result_boq.invalidate()
+    return MergeResult(project, merger.conflicts, merger.applied)
+
+
+def merge_files(base_path: str, ours_path: str, theirs_path: str,
+                output_path: Optional[str] = None) -> MergeResult:
+    """Read three GAEB files, merge them and optionally write the result."""
+    from lvgenerator.gaeb.reader import GAEBReader
+    from lvgenerator.gaeb.writer import GAEBWriter
+
+    reader = GAEBReader()
+    result = merge_projects(
+        reader.read(base_path), reader.read(ours_path), reader.read(theirs_path)
+    )
+    if output_path:
+        GAEBWriter().write(result.project, output_path)
+    return result
@@ -1,40 +1,42 @@
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Union
 
 from lvgenerator.gaeb.reader import GAEBReader
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.item import Item
 from lvgenerator.models.preisspiegel import (
     BidderInfo,
+    BidderPrice,
     PreisSpiegel,
     PreisSpiegelCategoryRow,
     PreisSpiegelRow,
 )
 from lvgenerator.models.project import GAEBProject
+from lvgenerator.services.bidder_cache import BidderPriceCache
+
+# Full OZ -> bidder position (parsed Item or cached BidderPrice)
+BidderMap = dict[str, Union[Item, BidderPrice]]
 
 
 def _build_item_map(project: GAEBProject) -> dict[str, Item]:
     """Build a flat dict mapping full OZ -> Item from a project."""
-    result: dict[str, Item] = {}
-    if project.boq:
-        for cat in project.boq.categories:
-            _collect_items(cat, "", result)
-    return result
+    if project.boq is None:
+        return {}
+    return dict(project.boq.index.items_by_oz())
 
 
-def _collect_items(cat: BoQCategory, parent_oz: str, result: dict[str, Item]) -> None:
-    oz = f"{parent_oz}.{cat.rno_part}" if parent_oz else cat.rno_part
-    for sub in cat.subcategories:
-        _collect_items(sub, oz, result)
-    for item in cat.items:
-        full_oz = f"{oz}.{item.rno_part}" if oz else item.rno_part
-        result[full_oz] = item
+def _build_price_map(project: GAEBProject) -> dict[str, BidderPrice]:
+    """Reduce a bidder project to the prices needed for the Preisspiegel."""
+    return {
+        oz: BidderPrice(up=item.up, it=item.it, not_offered=item.not_offered)
+        for oz, item in _build_item_map(project).items()
+    }
 
 
 def _traverse_structure(
     categories: list[BoQCategory],
     parent_oz: str,
-    bidder_maps: list[dict[str, Item]],
+    bidder_maps: list[BidderMap],
     rows: list,
     bidder_totals: list[Decimal],
 ) -> None:
@@ -63,13 +65,40 @@ def _traverse_structure(
         cat_row.totals = cat_totals
 
 
+def _bidder_prices(
+    bidder_item: Optional[Union[Item, BidderPrice]],
+    ref_qty: Optional[Decimal],
+) -> tuple[Optional[Decimal], Optional[Decimal], bool]:
+    """Return (EP, GP, not_offered) of one bidder for one position."""
+    if bidder_item is None:
+        return None, None, False
+    if bidder_item.not_offered:
+        return None, None, True
+    up = bidder_item.up
+    if bidder_item.it is not None:
+        return up, bidder_item.it, False
+    if up is not None and ref_qty is not None:
+        return up, (ref_qty * up).quantize(Decimal("0.01")), False
+    return up, None, False
+
+
+def _price_statistics(
+    unit_prices: list[Optional[Decimal]],
+) -> tuple[Optional[Decimal], Optional[Decimal], Optional[Decimal]]:
+    """Min/max/avg over the valid unit prices of one row."""
+    valid_ups = [up for up in unit_prices if up is not None]
+    if not valid_ups:
+        return None, None, None
+    avg_up = (sum(valid_ups) / len(valid_ups)).quantize(Decimal("0.01"))
+    return min(valid_ups), max(valid_ups), avg_up
+
+
 def _build_item_row(
     full_oz: str,
     ref_item: Item,
-    bidder_maps: list[dict[str, Item]],
+    bidder_maps: list[BidderMap],
 ) -> PreisSpiegelRow:
     """Build a PreisSpiegelRow for one position across all bidders."""
-    n = len(bidder_maps)
     unit_prices: list[Optional[Decimal]] = []
     total_prices: list[Optional[Decimal]] = []
     not_offered: list[bool] = []
@@ -77,35 +106,12 @@ def _build_item_row(
     ref_qty = ref_item.qty
 
     for bmap in bidder_maps:
-        bidder_item = bmap.get(full_oz)
-        if bidder_item is None:
-            unit_prices.append(None)
-            total_prices.append(None)
-            not_offered.append(False)
-        elif bidder_item.not_offered:
-            unit_prices.append(None)
-            total_prices.append(None)
-            not_offered.append(True)
-        else:
-            up = bidder_item.up
-            unit_prices.append(up)
-            if bidder_item.it is not None:
-                total_prices.append(bidder_item.it)
-            elif up is not None and ref_qty is not None:
-                total_prices.append((ref_qty * up).quantize(Decimal("0.01")))
-            else:
-                total_prices.append(None)
-            not_offered.append(False)
-
-    # Statistics over valid unit prices
-    valid_ups = [up for up in unit_prices if up is not None]
-    min_up = min(valid_ups) if valid_ups else None
-    max_up = max(valid_ups) if valid_ups else None
-    avg_up = (
-        (sum(valid_ups) / len(valid_ups)).quantize(Decimal("0.01"))
-        if valid_ups
-        else None
-    )
+        up, tp, no = _bidder_prices(bmap.get(full_oz), ref_qty)
+        unit_prices.append(up)
+        total_prices.append(tp)
+        not_offered.append(no)
+
+    min_up, max_up, avg_up = _price_statistics(unit_prices)
 
     return PreisSpiegelRow(
         oz=full_oz,
@@ -124,7 +130,7 @@ def _build_item_row(
 def _compute_category_totals(
     cat: BoQCategory,
     oz: str,
-    bidder_maps: list[dict[str, Item]],
+    bidder_maps: list[BidderMap],
 ) -> list[Optional[Decimal]]:
     """Compute sum of all item GPs in a category for each bidder (recursive)."""
     n = len(bidder_maps)
@@ -135,14 +141,9 @@ def _compute_category_totals(
         full_oz = f"{oz}.{item.rno_part}" if oz else item.rno_part
         ref_qty = item.qty
         for i, bmap in enumerate(bidder_maps):
-            bidder_item = bmap.get(full_oz)
-            if bidder_item is None or bidder_item.not_offered:
-                continue
-            if bidder_item.it is not None:
-                totals[i] += bidder_item.it
-                has_any[i] = True
-            elif bidder_item.up is not None and ref_qty is not None:
-                totals[i] += (ref_qty * bidder_item.up).quantize(Decimal("0.01"))
+            _up, tp, _no = _bidder_prices(bmap.get(full_oz), ref_qty)
+            if tp is not None:
+                totals[i] += tp
                 has_any[i] = True
 
     for sub in cat.subcategories:
@@ -156,25 +157,56 @@ def _compute_category_totals(
     return [totals[i] if has_any[i] else None for i in range(n)]
 
 
+def _contractor_name(project: GAEBProject) -> str:
+    if project.contractor and project.contractor.address:
+        return project.contractor.address.name1
+    return ""
+
+
+def _bidder_name(contractor_name: str, file_path: str) -> str:
+    """Contractor name of a bid, falling back to the file name."""
+    if contractor_name:
+        return contractor_name
+    return file_path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+
+
+def _load_bidder(
+    file_path: str,
+    reader: GAEBReader,
+    cache: Optional[BidderPriceCache],
+) -> tuple[str, dict[str, BidderPrice]]:
+    """Return (contractor name, price map) of a bid, parsing it only on a cache miss."""
+    key = cache.file_key(file_path) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    project = reader.read(file_path)
+    name = _contractor_name(project)
+    prices = _build_price_map(project)
+    if key is not None:
+        cache.put(key, name, prices)
+    return name, prices
+
+
 def create_preisspiegel(
     reference: GAEBProject,
     bidder_files: list[str],
+    cache: Optional[BidderPriceCache] = None,
 ) -> PreisSpiegel:
-    """Create a Preisspiegel from a reference project and bidder X84 files."""
+    """Create a Preisspiegel from a reference project and bidder X84 files.
+
+    With a ``cache``, bidder files whose content is already cached are not parsed.
+    """
     reader = GAEBReader()
     bidders: list[BidderInfo] = []
-    bidder_maps: list[dict[str, Item]] = []
+    bidder_maps: list[BidderMap] = []
 
     for fp in bidder_files:
-        project = reader.read(fp)
-        name = ""
-        if project.contractor and project.contractor.address:
-            name = project.contractor.address.name1
-        if not name:
-            # Use filename as fallback
-            name = fp.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
-        bidders.append(BidderInfo(name=name, file_path=fp))
-        bidder_maps.append(_build_item_map(project))
+        name, prices = _load_bidder(fp, reader, cache)
+        bidders.append(BidderInfo(name=_bidder_name(name, fp), file_path=fp))
+        bidder_maps.append(prices)
 
     rows: list = []
     n = len(bidder_files)
@@ -195,3 +227,127 @@ def create_preisspiegel(
         rows=rows,
         grand_totals=grand_totals,
     )
+
+
+class PreisSpiegelBuilder:
+    """Stateful Preisspiegel that adds or removes single bidders in place.
+
+    The reference structure (rows, full OZ, category nesting) is built once.
+    Adding a bidder parses only that file and appends one EP/GP column;
+    removing a bidder drops its column. Totals and statistics are updated
+    without touching the other bidders.
+    """
+
+    def __init__(
+        self,
+        reference: GAEBProject,
+        reader: Optional[GAEBReader] = None,
+        cache: Optional[BidderPriceCache] = None,
+    ):
+        self._reader = reader or GAEBReader()
+        self._cache = cache
+        self._spiegel = PreisSpiegel(
+            project_name=reference.prj_info.name, bidders=[],
+        )
+        # (item row, reference qty, enclosing category rows from outer to inner)
+        self._item_rows: list[
+            tuple[PreisSpiegelRow, Optional[Decimal], list[PreisSpiegelCategoryRow]]
+        ] = []
+        self._category_rows: list[PreisSpiegelCategoryRow] = []
+        if reference.boq:
+            self._build_rows(reference.boq.categories, "", [])
+
+    @property
+    def spiegel(self) -> PreisSpiegel:
+        return self._spiegel
+
+    @property
+    def bidder_count(self) -> int:
+        return len(self._spiegel.bidders)
+
+    def index_of(self, file_path: str) -> int:
+        """Column index of a bidder file, or -1 if not part of the Preisspiegel."""
+        for i, bidder in enumerate(self._spiegel.bidders):
+            if bidder.file_path == file_path:
+                return i
+        return -1
+
+    def add_bidder(self, file_path: str) -> BidderInfo:
+        """Parse one bidder file (or take it from the cache) and append it as a new column."""
+        name, prices = _load_bidder(file_path, self._reader, self._cache)
+        bidder = BidderInfo(name=_bidder_name(name, file_path), file_path=file_path)
+        return self._append_bidder(bidder, prices)
+
+    def add_bidder_project(self, project: GAEBProject, file_path: str) -> BidderInfo:
+        """Append an already parsed bidder project as a new column."""
+        bidder = BidderInfo(
+            name=_bidder_name(_contractor_name(project), file_path),
+            file_path=file_path,
+        )
+        return self._append_bidder(bidder, _build_price_map(project))
+
+    def _append_bidder(self, bidder: BidderInfo, bmap: BidderMap) -> BidderInfo:
+        cat_totals: dict[int, Decimal] = {}
+        bidder_sum = Decimal("0.00")
+        for row, ref_qty, ancestors in self._item_rows:
+            up, tp, no = _bidder_prices(bmap.get(row.oz), ref_qty)
+            row.unit_prices.append(up)
+            row.total_prices.append(tp)
+            row.not_offered.append(no)
+            row.min_up, row.max_up, row.avg_up = _price_statistics(row.unit_prices)
+            if tp is not None:
+                bidder_sum += tp
+                for cat_row in ancestors:
+                    key = id(cat_row)
+                    cat_totals[key] = cat_totals.get(key, Decimal("0.00")) + tp
+
+        for cat_row in self._category_rows:
+            cat_row.totals.append(cat_totals.get(id(cat_row)))
+
+        self._spiegel.bidders.append(bidder)
+        self._spiegel.grand_totals.append(
+            bidder_sum if bidder_sum != Decimal("0.00") else None
+        )
+        return bidder
+
+    def remove_bidder(self, index: int) -> BidderInfo:
+        """Drop the bidder column at ``index``."""
+        bidder = self._spiegel.bidders.pop(index)
+        for row, _qty, _ancestors in self._item_rows:
+            del row.unit_prices[index]
+            del row.total_prices[index]
+            del row.not_offered[index]
+            row.min_up, row.max_up, row.avg_up = _price_statistics(row.unit_prices)
+        for cat_row in self._category_rows:
+            del cat_row.totals[index]
+        del self._spiegel.grand_totals[index]
+        return bidder
+
+    def _build_rows(
+        self,
+        categories: list[BoQCategory],
+        parent_oz: str,
+        ancestors: list[PreisSpiegelCategoryRow],
+    ) -> None:
+        for cat in categories:
+            oz = f"{parent_oz}.{cat.rno_part}" if parent_oz else cat.rno_part
+            cat_row = PreisSpiegelCategoryRow(oz=oz, label=cat.label)
+            self._spiegel.rows.append(cat_row)
+            self._category_rows.append(cat_row)
+            chain = ancestors + [cat_row]
+
+            self._build_rows(cat.subcategories, oz, chain)
+
+            for item in cat.items:
+                full_oz = f"{oz}.{item.rno_part}" if oz else item.rno_part
+                row = PreisSpiegelRow(
+                    oz=full_oz,
+                    short_text=item.description.outline_text,
+                    qty=item.qty,
+                    qu=item.qu,
+                    unit_prices=[],
+                    total_prices=[],
+                    not_offered=[],
+                )
+                self._spiegel.rows.append(row)
+                self._item_rows.append((row, item.qty, chain))
@@ -0,0 +1,111 @@
+"""Renumbering of ordinal numbers (OZ) according to the BoQBkdn mask.
+
+One pass over the tree computes a ``RenumberPlan``: parallel tuples of the
+nodes whose ``rno_part`` changes with their old and new value. Lots and
+BoQ levels take the mask level of their depth, items the item level; a
+level without mask entry is left as it is. The plan is applied (and undone)
+by ``RenumberCommand``; nothing is changed while planning. Qt-free.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Optional, Union
+
+from lvgenerator.models.boq import BoQBkdn
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.validators import (
+    mask_level_for_category,
+    mask_level_for_item,
+    validate_rno_part,
+)
+
+Node = Union[BoQCategory, Item]
+
+
+@dataclass(frozen=True)
+class RenumberPlan:
+    """Geplante OZ-Änderungen; nodes[i] wechselt von old[i] auf new[i]."""
+    nodes: tuple[Node, ...] = ()
+    old: tuple[str, ...] = ()
+    new: tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __bool__(self) -> bool:
+        return bool(self.nodes)
+
+
+class _Planner:
+    def __init__(self, breakdowns: list[BoQBkdn], gaps_only: bool, step: int):
+        self.breakdowns = breakdowns
+        self.item_mask = mask_level_for_item(breakdowns)
+        self.gaps_only = gaps_only
+        self.step = step
+        self.nodes: list[Node] = []
+        self.old: list[str] = []
+        self.new: list[str] = []
+
+    def siblings(self, nodes: Iterable[Node], mask: Optional[BoQBkdn]) -> None:
+        if mask is None:
+            return
+        previous = 0
+        for node in nodes:
+            current = node.rno_part
+            if self.gaps_only and self._keeps(current, mask, previous):
+                previous = int(current)
+                continue
+            previous += self.step
+            new = str(previous).zfill(mask.length)
+            if new != current:
+                self.nodes.append(node)
+                self.old.append(current)
+                self.new.append(new)
+
+    @staticmethod
+    def _keeps(rno_part: str, mask: BoQBkdn, previous: int) -> bool:
+        # Valid, numeric and ascending numbers stay, so only gaps get numbers
+        return (
+            rno_part.isdigit()
+            and validate_rno_part(rno_part, mask) is None
+            and int(rno_part) > previous
+        )
+
+    def categories(self, categories: list[BoQCategory], depth: int) -> None:
+        stack = [(categories, depth)]
+        while stack:
+            level, level_depth = stack.pop()
+            self.siblings(level, mask_level_for_category(self.breakdowns, level_depth))
+            for cat in level:
+                self.siblings(cat.items, self.item_mask)
+                if cat.subcategories:
+                    stack.append((cat.subcategories, level_depth + 1))
+
+    def plan(self) -> RenumberPlan:
+        return RenumberPlan(tuple(self.nodes), tuple(self.old), tuple(self.new))
+
+
+def plan_renumber_all(categories: list[BoQCategory], breakdowns: list[BoQBkdn],
+                      gaps_only: bool = False, step: int = 1) -> RenumberPlan:
+    """Plan for the whole LV: all Lots, levels and items."""
+    planner = _Planner(breakdowns, gaps_only, step)
+    planner.categories(categories, 0)
+    return planner.plan()
+
+
+def plan_renumber_subtree(category: BoQCategory, depth: int,
+                          breakdowns: list[BoQBkdn], gaps_only: bool = False,
+                          step: int = 1) -> RenumberPlan:
+    """Plan for everything below ``category`` (at ``depth``); its own
+    number is kept."""
+    planner = _Planner(breakdowns, gaps_only, step)
+    planner.siblings(category.items, planner.item_mask)
+    planner.categories(category.subcategories, depth + 1)
+    return planner.plan()
+
+
+def plan_renumber_items(category: BoQCategory, breakdowns: list[BoQBkdn],
+                        gaps_only: bool = False, step: int = 1) -> RenumberPlan:
+    """Plan for the items directly in ``category``."""
+    planner = _Planner(breakdowns, gaps_only, step)
+    planner.siblings(category.items, planner.item_mask)
+    return planner.plan()
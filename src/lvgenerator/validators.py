@@ -1,13 +1,14 @@
 import re
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import Optional, Union
 
 from lvgenerator.constants import GAEBPhase
 from lvgenerator.gaeb.phase_rules import get_rules
 from lvgenerator.models.boq import BoQBkdn
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.formula_evaluator import evaluate_formula
+from lvgenerator.models.global_constants import global_constants
 from lvgenerator.models.item import Item
 from lvgenerator.models.project import GAEBProject
 
@@ -106,16 +107,21 @@ class CategoryValidator:
         return ValidationResult(errors)
 
 
+def validate_project_info(project: GAEBProject) -> list[ValidationError]:
+    """Projektweite Felder (ohne LV-Inhalt)."""
+    errors: list[ValidationError] = []
+    if not project.prj_info.name.strip():
+        errors.append(ValidationError(
+            "prj_name", "Projektname ist Pflichtfeld", "warning"
+        ))
+    return errors
+
+
 class ProjectValidator:
     """Validiert das gesamte Projekt."""
 
     def validate(self, project: GAEBProject) -> ValidationResult:
-        errors: list[ValidationError] = []
-
-        if not project.prj_info.name.strip():
-            errors.append(ValidationError(
-                "prj_name", "Projektname ist Pflichtfeld", "warning"
-            ))
+        errors = validate_project_info(project)
 
         if project.boq:
             item_val = ItemValidator()
@@ -142,6 +148,121 @@ class ProjectValidator:
             )
 
 
+@dataclass(frozen=True)
+class NodeProblem:
+    """Validierungsfehler einer Position oder Kategorie mit voller OZ."""
+    oz: str
+    node: Union[BoQCategory, Item]
+    error: ValidationError
+
+
+class IncrementalValidator:
+    """Validiert ein Projekt und speichert die Ergebnisse je Knoten.
+
+    Results are keyed by the node's change counter (``revision``, bumped by
+    the edit commands), the phase and, for positions with a formula, the
+    version of the global constants. Unchanged nodes are served from the
+    cache, so validating the whole project after an edit only re-checks
+    the edited nodes.
+    """
+
+    def __init__(self):
+        self._item_validator = ItemValidator()
+        self._category_validator = CategoryValidator()
+        # id(node) -> (node, key, result); the node reference keeps id() unique
+        self._cache: dict[int, tuple[object, tuple, ValidationResult]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def result_for(self, node: Union[BoQCategory, Item],
+                   phase: Optional[GAEBPhase]) -> ValidationResult:
+        if isinstance(node, Item):
+            constants = global_constants.version if node.use_calculated_qty else None
+            key = (node.revision, node.description.revision, phase, constants)
+        else:
+            key = (node.revision,)
+        entry = self._cache.get(id(node))
+        if entry is not None and entry[0] is node and entry[1] == key:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        if isinstance(node, Item):
+            result = self._item_validator.validate(node, phase)
+        else:
+            result = self._category_validator.validate(node)
+        self._cache[id(node)] = (node, key, result)
+        return result
+
+    def problems(self, project: GAEBProject, severity: Optional[str] = None,
+                 field_name: Optional[str] = None) -> list[NodeProblem]:
+        """All problems of the BoQ in LV order, optionally filtered."""
+        found: list[NodeProblem] = []
+        if project.boq is None:
+            self.clear()
+            return found
+        snapshot = project.boq.snapshot()
+        for node, oz in zip(snapshot.nodes, snapshot.oz):
+            for error in self.result_for(node, project.phase).errors:
+                if severity is not None and error.severity != severity:
+                    continue
+                if field_name is not None and error.field_name != field_name:
+                    continue
+                found.append(NodeProblem(oz, node, error))
+        self._prune(snapshot.nodes)
+        return found
+
+    def validate(self, project: GAEBProject) -> ValidationResult:
+        """Same result as ``ProjectValidator.validate``, served from the cache."""
+        errors = validate_project_info(project)
+        if project.boq is None:
+            self.clear()
+            return ValidationResult(errors)
+        # Same order as ProjectValidator: category, its items, subcategories
+        visited: list = []
+        stack = list(reversed(project.boq.categories))
+        while stack:
+            cat = stack.pop()
+            visited.append(cat)
+            errors.extend(self.result_for(cat, project.phase).errors)
+            for item in cat.items:
+                visited.append(item)
+                errors.extend(self.result_for(item, project.phase).errors)
+            stack.extend(reversed(cat.subcategories))
+        self._prune(visited)
+        return ValidationResult(errors)
+
+    def invalidate(self, node: Union[BoQCategory, Item]) -> None:
+        """Drop the result of a node changed outside of the commands."""
+        self._cache.pop(id(node), None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _prune(self, nodes) -> None:
+        # Forget deleted nodes once the cache holds noticeably more than the tree
+        if len(self._cache) > 2 * len(nodes) + 64:
+            alive = {id(node) for node in nodes}
+            self._cache = {k: v for k, v in self._cache.items() if k in alive}
+
+
+def mask_level_for_category(
+    breakdowns: list[BoQBkdn], depth: int
+) -> Optional[BoQBkdn]:
+    """Findet die passende BoQBkdn-Ebene für eine Kategorie in gegebener Tiefe."""
+    boq_levels = [b for b in breakdowns if b.type in ("Lot", "BoQLevel")]
+    if depth < len(boq_levels):
+        return boq_levels[depth]
+    return None
+
+
+def mask_level_for_item(breakdowns: list[BoQBkdn]) -> Optional[BoQBkdn]:
+    """Findet die BoQBkdn-Ebene für Positionen."""
+    for b in breakdowns:
+        if b.type == "Item":
+            return b
+    return None
+
+
 def validate_rno_part(rno_part: str, mask_level: Optional[BoQBkdn]) -> Optional[str]:
     """Validiert eine Ordnungszahl gegen die OZ-Maske. Gibt Fehlermeldung zurück."""
     if not rno_part.strip():
@@ -12,6 +12,8 @@ from lvgenerator.models.boq import BoQ
 from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.item import Item
 from lvgenerator.models.project import GAEBProject
+from lvgenerator.resources import theme
+from lvgenerator.validators import IncrementalValidator
 
 
 class BoQTreeNode:
@@ -31,6 +33,11 @@ class BoQTreeNode:
 COLUMNS = ["OZ", "Beschreibung", "Menge", "Einheit", "EP", "GP"]
 MIME_TYPE = "application/x-lvgenerator-node"
 
+# flags() is asked for every row a view checks; combine the enums only once
+_ROOT_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDropEnabled
+_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+_CATEGORY_FLAGS = _ITEM_FLAGS | Qt.ItemIsDropEnabled
+
 
 class BoQTreeModel(QAbstractItemModel):
     drop_requested = Signal(object, object, int)
@@ -39,10 +46,16 @@ class BoQTreeModel(QAbstractItemModel):
         super().__init__(parent)
         self._root_nodes: list[BoQTreeNode] = []
         self._phase: Optional[GAEBPhase] = None
+        self._project: Optional[GAEBProject] = None
+        self._badges: dict[str, object] = {}
+        self.validator = IncrementalValidator()
 
     def set_project(self, project: GAEBProject) -> None:
         self.beginResetModel()
         self._root_nodes = []
+        if project is not self._project:
+            self.validator.clear()
+        self._project = project
         self._phase = project.phase
         if project.boq:
             self._root_nodes = self._build_tree(project.boq)
@@ -76,7 +89,11 @@ class BoQTreeModel(QAbstractItemModel):
         return len(COLUMNS)
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid() or role != Qt.DisplayRole:
+        if not index.isValid():
+            return None
+        if role in (Qt.DecorationRole, Qt.ToolTipRole) and index.column() == 0:
+            return self._problem_data(index.internalPointer(), role)
+        if role != Qt.DisplayRole:
             return None
 
         node: BoQTreeNode = index.internalPointer()
@@ -114,6 +131,20 @@ class BoQTreeModel(QAbstractItemModel):
 
         return None
 
+    def _problem_data(self, node: BoQTreeNode, role: int):
+        """Error/warning badge and tooltip from the cached validation."""
+        errors = self.validator.result_for(node.data, self._phase).errors
+        if not errors:
+            return None
+        if role == Qt.ToolTipRole:
+            return "\n".join(e.message for e in errors)
+        severity = "error" if any(e.severity == "error" for e in errors) else "warning"
+        if severity not in self._badges:
+            from lvgenerator.resources.icons import icon_badge
+            color = theme.HTML_ERROR if severity == "error" else theme.HTML_WARNING
+            self._badges[severity] = icon_badge(color)
+        return self._badges[severity]
+
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
@@ -123,17 +154,15 @@ class BoQTreeModel(QAbstractItemModel):
 
     def index(self, row: int, column: int,
               parent: QModelIndex = QModelIndex()) -> QModelIndex:
-        if not self.hasIndex(row, column, parent):
-            return QModelIndex()
-
-        if not parent.isValid():
-            if row < len(self._root_nodes):
-                return self.createIndex(row, column, self._root_nodes[row])
-            return QModelIndex()
-
-        parent_node: BoQTreeNode = parent.internalPointer()
-        if row < len(parent_node.children):
-            return self.createIndex(row, column, parent_node.children[row])
+        # Bounds checked here instead of hasIndex(), which calls back into
+        # rowCount()/columnCount(); views ask for every row they check
+        if parent.isValid():
+            parent_node: BoQTreeNode = parent.internalPointer()
+            nodes = parent_node.children
+        else:
+            nodes = self._root_nodes
+        if 0 <= row < len(nodes) and 0 <= column < len(COLUMNS):
+            return self.createIndex(row, column, nodes[row])
         return QModelIndex()
 
     def parent(self, index: QModelIndex) -> QModelIndex:
@@ -149,14 +178,12 @@ class BoQTreeModel(QAbstractItemModel):
         return self.createIndex(parent_node.row(), 0, parent_node)
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
-        default = Qt.ItemIsEnabled | Qt.ItemIsSelectable
         if not index.isValid():
-            return default | Qt.ItemIsDropEnabled
+            return _ROOT_FLAGS
         node: BoQTreeNode = index.internalPointer()
-        flags = default | Qt.ItemIsDragEnabled
         if node.node_type == "category":
-            flags |= Qt.ItemIsDropEnabled
-        return flags
+            return _CATEGORY_FLAGS
+        return _ITEM_FLAGS
 
     def supportedDropActions(self) -> Qt.DropActions:
         return Qt.MoveAction
@@ -228,6 +255,48 @@ class BoQTreeModel(QAbstractItemModel):
                 return found
         return None
 
+    def nodes_changed(self, nodes) -> None:
+        """Notify views about changed field values of items or categories.
+
+        The structure is unchanged, so instead of a reset one dataChanged is
+        emitted per run of adjacent changed rows, plus the rows of the Titel
+        above them (their GP changes too). View and proxy then only look at
+        these rows; a range spanning the top level made them re-check every
+        expanded row below it.
+        """
+        changed = {id(node) for node in nodes}
+        if not changed:
+            return
+        row_of: dict[int, int] = {}
+        rows: dict[Optional[BoQTreeNode], set[int]] = {}
+        stack = list(enumerate(self._root_nodes))
+        while stack:
+            row, node = stack.pop()
+            row_of[id(node)] = row
+            stack.extend(enumerate(node.children))
+            if id(node.data) not in changed:
+                continue
+            # The node and every Titel above it, up to one already marked
+            while node is not None:
+                marked = rows.setdefault(node.parent_node, set())
+                row = row_of[id(node)]
+                if row in marked:
+                    break
+                marked.add(row)
+                node = node.parent_node
+        last_column = self.columnCount() - 1
+        for parent, marked in rows.items():
+            parent_index = (QModelIndex() if parent is None
+                            else self.createIndex(row_of[id(parent)], 0, parent))
+            ordered = sorted(marked)
+            first = ordered[0]
+            for prev, row in zip(ordered, ordered[1:] + [None]):
+                if row == prev + 1:
+                    continue
+                self.dataChanged.emit(self.index(first, 0, parent_index),
+                                      self.index(prev, last_column, parent_index))
+                first = row
+
     def get_node(self, index: QModelIndex) -> Optional[BoQTreeNode]:
         if index.isValid():
             return index.internalPointer()
@@ -0,0 +1,95 @@
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QLabel,
+    QLineEdit,
+    QStackedWidget,
+    QVBoxLayout,
+)
+
+from lvgenerator.commands.item_commands import BulkEditItemsCommand
+from lvgenerator.models.item import Item
+from lvgenerator.resources import theme
+
+# (Anzeige, Schlüssel)
+OPERATIONS = [
+    ("Einheit setzen", "qu"),
+    ("EP prozentual ändern", "uplift"),
+    ("Nicht angeboten setzen", "not_offered"),
+]
+
+
+class BulkEditDialog(QDialog):
+    """Dialog für die Mehrfachbearbeitung ausgewählter Positionen."""
+
+    def __init__(self, item_count: int, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Mehrfachbearbeitung")
+        self.setMinimumWidth(360)
+        self._setup_ui(item_count)
+
+    def _setup_ui(self, item_count: int) -> None:
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"{item_count} Positionen ausgewählt"))
+
+        form = QFormLayout()
+        self._operation_combo = QComboBox()
+        for label, key in OPERATIONS:
+            self._operation_combo.addItem(label, key)
+        form.addRow("Änderung:", self._operation_combo)
+
+        self._value_stack = QStackedWidget()
+        self._qu_edit = QLineEdit()
+        self._qu_edit.setPlaceholderText("z.B. m2")
+        self._value_stack.addWidget(self._qu_edit)
+        self._percent_edit = QLineEdit()
+        self._percent_edit.setPlaceholderText("z.B. 3,5 oder -2")
+        self._value_stack.addWidget(self._percent_edit)
+        self._not_offered_check = QCheckBox("Nicht angeboten")
+        self._not_offered_check.setChecked(True)
+        self._value_stack.addWidget(self._not_offered_check)
+        form.addRow("Wert:", self._value_stack)
+        layout.addLayout(form)
+
+        self._error_label = QLabel("")
+        self._error_label.setStyleSheet(theme.ERROR_TEXT)
+        layout.addWidget(self._error_label)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self._on_accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self._operation_combo.currentIndexChanged.connect(
+            self._value_stack.setCurrentIndex
+        )
+
+    def _percent(self) -> Optional[Decimal]:
+        text = self._percent_edit.text().strip().replace(",", ".")
+        try:
+            percent = Decimal(text)
+        except InvalidOperation:
+            return None
+        return percent if percent.is_finite() and percent > -100 else None
+
+    def _on_accept(self) -> None:
+        if self._operation_combo.currentData() == "uplift" and self._percent() is None:
+            self._error_label.setText("Bitte einen Prozentwert größer als -100 eingeben.")
+            return
+        self.accept()
+
+    def create_command(self, items: list[Item]) -> BulkEditItemsCommand:
+        operation = self._operation_combo.currentData()
+        if operation == "uplift":
+            return BulkEditItemsCommand.uplift_up(items, self._percent())
+        if operation == "not_offered":
+            return BulkEditItemsCommand.set_value(
+                items, "not_offered", self._not_offered_check.isChecked()
+            )
+        return BulkEditItemsCommand.set_value(items, "qu", self._qu_edit.text().strip())
@@ -12,7 +12,9 @@ from PySide6.QtWidgets import (
 )
 
 from lvgenerator.commands.category_commands import EditCategoryPropertyCommand
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.node_cache import invalidate_node_caches
 from lvgenerator.resources import theme
 from lvgenerator.validators import CategoryValidator
 
@@ -25,6 +27,7 @@ class CategoryEditorWidget(QWidget):
         self._current_category: Optional[BoQCategory] = None
         self._updating = False
         self._undo_stack: Optional[QUndoStack] = None
+        self._boq_index: Optional[BoQIndex] = None
         self._validator = CategoryValidator()
         self._setup_ui()
         self._connect_signals()
@@ -32,6 +35,10 @@ class CategoryEditorWidget(QWidget):
     def set_undo_stack(self, stack: QUndoStack) -> None:
         self._undo_stack = stack
 
+    def set_boq_index(self, boq_index: Optional[BoQIndex]) -> None:
+        """Index of the edited BoQ, kept current when the OZ is edited."""
+        self._boq_index = boq_index
+
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
 
@@ -75,9 +82,12 @@ class CategoryEditorWidget(QWidget):
     def _push_command(self, prop: str, old_val, new_val) -> None:
         if self._undo_stack is None:
             setattr(self._current_category, prop, new_val)
+            self._current_category.revision += 1
+            invalidate_node_caches(self._current_category)
         else:
             cmd = EditCategoryPropertyCommand(
-                self._current_category, prop, old_val, new_val
+                self._current_category, prop, old_val, new_val,
+                boq_index=self._boq_index,
             )
             self._updating = True
             self._undo_stack.push(cmd)
@@ -176,7 +176,7 @@ class GlobalConstantsDialog(QDialog):
             new_constants[name] = (value, desc)
 
         # Apply to global singleton
-        global_constants._constants = new_constants
+        global_constants.replace_all(new_constants)
         global_constants.save()
 
         self.accept()
@@ -19,8 +19,10 @@ from lvgenerator.commands.item_commands import (
     EditItemPropertyCommand,
 )
 from lvgenerator.constants import GAEBPhase
+from lvgenerator.models.boq_index import BoQIndex
 from lvgenerator.models.formula_evaluator import evaluate_formula
 from lvgenerator.models.item import Item
+from lvgenerator.models.node_cache import invalidate_node_caches
 from lvgenerator.resources import theme
 from lvgenerator.validators import ItemValidator
 from lvgenerator.views.rich_text_edit import RichTextEditWidget
@@ -34,6 +36,7 @@ class ItemEditorWidget(QWidget):
         self._current_item: Optional[Item] = None
         self._updating = False
         self._undo_stack: Optional[QUndoStack] = None
+        self._boq_index: Optional[BoQIndex] = None
         self._phase: Optional[GAEBPhase] = None
         self._gaeb_ns: str = ""
         self._validator = ItemValidator()
@@ -43,6 +46,10 @@ class ItemEditorWidget(QWidget):
     def set_undo_stack(self, stack: QUndoStack) -> None:
         self._undo_stack = stack
 
+    def set_boq_index(self, boq_index: Optional[BoQIndex]) -> None:
+        """Index of the edited BoQ, kept current when the OZ is edited."""
+        self._boq_index = boq_index
+
     def set_gaeb_ns(self, ns: str) -> None:
         """Set the GAEB namespace for HTML conversion."""
         self._gaeb_ns = ns
@@ -209,9 +216,11 @@ class ItemEditorWidget(QWidget):
     def _push_item_command(self, prop: str, old_val, new_val) -> None:
         if self._undo_stack is None:
             setattr(self._current_item, prop, new_val)
+            self._current_item.revision += 1
+            invalidate_node_caches(self._current_item)
         else:
             cmd = EditItemPropertyCommand(
-                self._current_item, prop, old_val, new_val
+                self._current_item, prop, old_val, new_val, boq_index=self._boq_index,
             )
             self._updating = True
             self._undo_stack.push(cmd)
@@ -220,6 +229,8 @@ class ItemEditorWidget(QWidget):
     def _push_desc_command(self, field: str, old_val: str, new_val: str) -> None:
         if self._undo_stack is None:
             setattr(self._current_item.description, field, new_val)
+            self._current_item.description.revision += 1
+            invalidate_node_caches(self._current_item.description)
         else:
             cmd = EditItemDescriptionCommand(
                 self._current_item.description, field, old_val, new_val
@@ -1,4 +1,6 @@
+from decimal import Decimal
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QKeySequence
@@ -90,6 +92,9 @@ class MainWindow(QMainWindow):
         self.action_duplicate = QAction(icon_duplicate(), "Duplizieren", self)
         self.action_duplicate.setShortcut(QKeySequence("Ctrl+D"))
 
+        self.action_bulk_edit = QAction("Mehrfachbearbeitung...", self)
+        self.action_bulk_edit.setShortcut(QKeySequence("Ctrl+E"))
+
         self.action_convert_phase = QAction("Phase konvertieren...", self)
 
         self.action_project_info = QAction("Projektinformationen...", self)
@@ -110,6 +115,9 @@ class MainWindow(QMainWindow):
         self.action_renumber_all = QAction(
             "Gesamtes LV neu nummerieren", self,
         )
+        self.action_renumber_gaps = QAction(
+            "Fehlende OZ vergeben", self,
+        )
 
     def _setup_menu_bar(self) -> None:
         menu_bar = self.menuBar()
@@ -139,6 +147,7 @@ class MainWindow(QMainWindow):
         edit_menu.addAction(self.action_move_up)
         edit_menu.addAction(self.action_move_down)
         edit_menu.addAction(self.action_duplicate)
+        edit_menu.addAction(self.action_bulk_edit)
         edit_menu.addSeparator()
         edit_menu.addAction(self.action_convert_phase)
         edit_menu.addAction(self.action_project_info)
@@ -189,6 +198,9 @@ class MainWindow(QMainWindow):
         self.tree_view = QTreeView()
         self.tree_view.setAlternatingRowColors(True)
         self.tree_view.setSelectionBehavior(QTreeView.SelectRows)
+        self.tree_view.setSelectionMode(QTreeView.ExtendedSelection)
+        # Single-line rows; spares per-row size hints on large dataChanged ranges
+        self.tree_view.setUniformRowHeights(True)
         self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree_view.setHeaderHidden(False)
         self.tree_view.setExpandsOnDoubleClick(True)
@@ -233,6 +245,9 @@ class MainWindow(QMainWindow):
         self.selection_info_label = QLabel("")
         self.status_bar.addWidget(self.selection_info_label)
 
+        self.undo_memory_label = QLabel("")
+        self.status_bar.addPermanentWidget(self.undo_memory_label)
+
         self.phase_label = QLabel("")
         self.status_bar.addPermanentWidget(self.phase_label)
 
@@ -251,9 +266,23 @@ class MainWindow(QMainWindow):
     def set_phase_label(self, text: str) -> None:
         self.phase_label.setText(text)
 
-    def update_counts(self, categories: int, items: int) -> None:
-        self.item_count_label.setText(
-            f"{categories} Kategorien, {items} Positionen"
+    def update_counts(self, categories: int, items: int,
+                      total: Optional[Decimal] = None) -> None:
+        text = f"{categories} Kategorien, {items} Positionen"
+        if total is not None:
+            text += f", Summe: {total}"
+        self.item_count_label.setText(text)
+
+    def update_undo_memory(self, report) -> None:
+        if report.commands == 0:
+            self.undo_memory_label.clear()
+            return
+        self.undo_memory_label.setText(
+            f"Rückgängig: {report.commands} Schritte, {report.size_mb:.1f} MB"
+        )
+        self.undo_memory_label.setToolTip(
+            f"Budget {report.budget / (1024 * 1024):.0f} MB, "
+            f"{report.evicted} alte Schritte verworfen"
         )
 
     def update_selection_info(self, text: str) -> None:
@@ -19,20 +19,19 @@ from PySide6.QtWidgets import (
 
 from lvgenerator.export.preisspiegel_exporter import PreisSpiegelExporter
 from lvgenerator.models.preisspiegel import (
-    PreisSpiegel,
     PreisSpiegelCategoryRow,
     PreisSpiegelRow,
 )
 from lvgenerator.models.project import GAEBProject
-from lvgenerator.services.preisspiegel_service import create_preisspiegel
+from lvgenerator.services.bidder_cache import BidderPriceCache
+from lvgenerator.services.preisspiegel_service import PreisSpiegelBuilder
 
 
 class PreisSpiegelDialog(QDialog):
     def __init__(self, project: GAEBProject, parent=None):
         super().__init__(parent)
         self._project = project
-        self._spiegel: Optional[PreisSpiegel] = None
-        self._file_paths: list[str] = []
+        self._builder = PreisSpiegelBuilder(project, cache=BidderPriceCache())
 
         self.setWindowTitle(
             f"Preisspiegel - {project.prj_info.name or 'Projekt'}"
@@ -40,7 +39,14 @@ class PreisSpiegelDialog(QDialog):
         self.setMinimumSize(900, 600)
         self.resize(1100, 700)
 
+        self._cat_bg = QColor("#2a3a5c")
+        self._min_bg = QColor("#1a4a2a")
+        self._max_bg = QColor("#4a1a1a")
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
         self._setup_ui()
+        self._populate_table()
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -54,6 +60,7 @@ class PreisSpiegelDialog(QDialog):
 
         btn_layout = QVBoxLayout()
         self._btn_add = QPushButton("X84 hinzufügen...")
+        self._btn_add.setDefault(True)
         self._btn_add.clicked.connect(self._on_add_files)
         btn_layout.addWidget(self._btn_add)
 
@@ -61,11 +68,6 @@ class PreisSpiegelDialog(QDialog):
         self._btn_remove.clicked.connect(self._on_remove_file)
         btn_layout.addWidget(self._btn_remove)
 
-        self._btn_create = QPushButton("Erstellen")
-        self._btn_create.setDefault(True)
-        self._btn_create.clicked.connect(self._on_create)
-        btn_layout.addWidget(self._btn_create)
-
         btn_layout.addStretch()
         top_layout.addLayout(btn_layout)
         layout.addLayout(top_layout)
@@ -98,86 +100,87 @@ class PreisSpiegelDialog(QDialog):
             self, "X84-Dateien auswählen", "", file_filter
         )
         for path in paths:
-            if path not in self._file_paths:
-                self._file_paths.append(path)
-                # Show just filename
-                name = path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
-                item = QListWidgetItem(name)
-                item.setData(Qt.UserRole, path)
-                item.setToolTip(path)
-                self._file_list.addItem(item)
+            if self._builder.index_of(path) >= 0:
+                continue
+            old_stats = self._row_statistics()
+            try:
+                self._builder.add_bidder(path)
+            except Exception as e:
+                QMessageBox.critical(
+                    self, "Fehler",
+                    f"Angebot konnte nicht gelesen werden:\n{path}\n{e}",
+                )
+                continue
+
+            # Show just filename
+            name = path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+            item = QListWidgetItem(name)
+            item.setData(Qt.UserRole, path)
+            item.setToolTip(path)
+            self._file_list.addItem(item)
+
+            index = self._builder.bidder_count - 1
+            ep_col = 4 + index * 2
+            self._table.insertColumn(ep_col)
+            self._table.insertColumn(ep_col + 1)
+            self._update_headers()
+            self._fill_bidder_columns(index)
+            self._refresh_changed_statistics(old_stats)
+
+        self._btn_export.setEnabled(self._builder.bidder_count > 0)
 
     def _on_remove_file(self) -> None:
         row = self._file_list.currentRow()
-        if row >= 0:
-            item = self._file_list.takeItem(row)
-            path = item.data(Qt.UserRole)
-            if path in self._file_paths:
-                self._file_paths.remove(path)
-
-    def _on_create(self) -> None:
-        if not self._file_paths:
-            QMessageBox.information(
-                self, "Keine Dateien",
-                "Bitte mindestens eine X84-Datei hinzufügen.",
-            )
+        if row < 0:
             return
-
-        try:
-            self._spiegel = create_preisspiegel(self._project, self._file_paths)
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Fehler",
-                f"Preisspiegel konnte nicht erstellt werden:\n{e}",
-            )
+        item = self._file_list.takeItem(row)
+        index = self._builder.index_of(item.data(Qt.UserRole))
+        if index < 0:
             return
 
-        self._populate_table()
-        self._btn_export.setEnabled(True)
-
-    def _populate_table(self) -> None:
-        if self._spiegel is None:
-            return
+        old_stats = self._row_statistics()
+        self._builder.remove_bidder(index)
+        ep_col = 4 + index * 2
+        self._table.removeColumn(ep_col + 1)
+        self._table.removeColumn(ep_col)
+        self._update_headers()
+        self._refresh_changed_statistics(old_stats)
 
-        n = len(self._spiegel.bidders)
+        self._btn_export.setEnabled(self._builder.bidder_count > 0)
 
-        # Headers
+    def _headers(self) -> list[str]:
         headers = ["OZ", "Kurztext", "Menge", "Einheit"]
-        for bidder in self._spiegel.bidders:
+        for bidder in self._builder.spiegel.bidders:
             headers.append(f"{bidder.name} EP")
             headers.append(f"{bidder.name} GP")
         headers.extend(["Min EP", "Max EP", "Avg EP"])
+        return headers
 
-        self._table.setColumnCount(len(headers))
-        self._table.setHorizontalHeaderLabels(headers)
-        self._table.setRowCount(len(self._spiegel.rows) + (1 if self._spiegel.grand_totals else 0))
-
-        cat_bg = QColor("#2a3a5c")
-        cat_font = QFont()
-        cat_font.setBold(True)
+    def _update_headers(self) -> None:
+        self._table.setHorizontalHeaderLabels(self._headers())
+        header_view = self._table.horizontalHeader()
+        header_view.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header_view.setSectionResizeMode(1, QHeaderView.Stretch)
+        for col in range(2, self._table.columnCount()):
+            header_view.setSectionResizeMode(col, QHeaderView.ResizeToContents)
 
-        min_bg = QColor("#1a4a2a")
-        max_bg = QColor("#4a1a1a")
+    def _populate_table(self) -> None:
+        spiegel = self._builder.spiegel
+        headers = self._headers()
 
-        total_font = QFont()
-        total_font.setBold(True)
+        self._table.setColumnCount(len(headers))
+        self._table.setRowCount(len(spiegel.rows) + 1)
+        self._update_headers()
 
-        for row_idx, data_row in enumerate(self._spiegel.rows):
+        for row_idx, data_row in enumerate(spiegel.rows):
             if isinstance(data_row, PreisSpiegelCategoryRow):
-                self._set_cell(row_idx, 0, data_row.oz, font=cat_font, bg=cat_bg)
-                self._set_cell(row_idx, 1, data_row.label, font=cat_font, bg=cat_bg)
+                self._set_cell(row_idx, 0, data_row.oz,
+                               font=self._bold_font, bg=self._cat_bg)
+                self._set_cell(row_idx, 1, data_row.label,
+                               font=self._bold_font, bg=self._cat_bg)
                 # Fill remaining columns with background
                 for col in range(2, len(headers)):
-                    self._set_cell(row_idx, col, "", bg=cat_bg)
-                # Category GP totals
-                for i, total in enumerate(data_row.totals):
-                    gp_col = 4 + i * 2 + 1  # GP column for bidder i
-                    if total is not None:
-                        self._set_cell(
-                            row_idx, gp_col,
-                            str(total.quantize(Decimal("0.01"))),
-                            font=cat_font, bg=cat_bg, align_right=True,
-                        )
+                    self._set_cell(row_idx, col, "", bg=self._cat_bg)
             else:
                 self._set_cell(row_idx, 0, data_row.oz)
                 self._set_cell(row_idx, 1, data_row.short_text)
@@ -187,78 +190,109 @@ class PreisSpiegelDialog(QDialog):
                     align_right=True,
                 )
                 self._set_cell(row_idx, 3, data_row.qu)
+                self._set_statistics(row_idx, data_row)
 
-                # Bidder EP/GP
-                for i in range(n):
-                    ep_col = 4 + i * 2
-                    gp_col = ep_col + 1
-
-                    if data_row.not_offered[i]:
-                        self._set_cell(row_idx, ep_col, "n.a.")
-                        self._set_cell(row_idx, gp_col, "n.a.")
-                    else:
-                        ep_bg = None
-                        if data_row.unit_prices[i] is not None and n > 1:
-                            if data_row.unit_prices[i] == data_row.min_up:
-                                ep_bg = min_bg
-                            elif data_row.unit_prices[i] == data_row.max_up:
-                                ep_bg = max_bg
-
-                        self._set_cell(
-                            row_idx, ep_col,
-                            str(data_row.unit_prices[i].quantize(Decimal("0.01")))
-                            if data_row.unit_prices[i] is not None else "",
-                            align_right=True, bg=ep_bg,
-                        )
-                        self._set_cell(
-                            row_idx, gp_col,
-                            str(data_row.total_prices[i].quantize(Decimal("0.01")))
-                            if data_row.total_prices[i] is not None else "",
-                            align_right=True,
-                        )
-
-                # Statistics
-                stat_base = 4 + n * 2
+        # Grand total row
+        total_row = len(spiegel.rows)
+        self._set_cell(total_row, 0, "Gesamtsumme", font=self._bold_font)
+        for col in range(1, len(headers)):
+            self._set_cell(total_row, col, "", font=self._bold_font)
+
+        for i in range(len(spiegel.bidders)):
+            self._fill_bidder_columns(i)
+
+    def _fill_bidder_columns(self, index: int) -> None:
+        """Write the EP/GP cells of one bidder for all rows."""
+        spiegel = self._builder.spiegel
+        n = len(spiegel.bidders)
+        ep_col = 4 + index * 2
+        gp_col = ep_col + 1
+
+        for row_idx, data_row in enumerate(spiegel.rows):
+            if isinstance(data_row, PreisSpiegelCategoryRow):
+                total = data_row.totals[index]
+                self._set_cell(row_idx, ep_col, "", bg=self._cat_bg)
                 self._set_cell(
-                    row_idx, stat_base,
-                    str(data_row.min_up.quantize(Decimal("0.01")))
-                    if data_row.min_up is not None else "",
-                    align_right=True,
+                    row_idx, gp_col,
+                    str(total.quantize(Decimal("0.01"))) if total is not None else "",
+                    font=self._bold_font, bg=self._cat_bg, align_right=True,
                 )
+            elif data_row.not_offered[index]:
+                self._set_cell(row_idx, ep_col, "n.a.")
+                self._set_cell(row_idx, gp_col, "n.a.")
+            else:
+                up = data_row.unit_prices[index]
+                tp = data_row.total_prices[index]
                 self._set_cell(
-                    row_idx, stat_base + 1,
-                    str(data_row.max_up.quantize(Decimal("0.01")))
-                    if data_row.max_up is not None else "",
-                    align_right=True,
+                    row_idx, ep_col,
+                    str(up.quantize(Decimal("0.01"))) if up is not None else "",
+                    align_right=True, bg=self._ep_background(data_row, up, n),
                 )
                 self._set_cell(
-                    row_idx, stat_base + 2,
-                    str(data_row.avg_up.quantize(Decimal("0.01")))
-                    if data_row.avg_up is not None else "",
+                    row_idx, gp_col,
+                    str(tp.quantize(Decimal("0.01"))) if tp is not None else "",
                     align_right=True,
                 )
 
-        # Grand total row
-        if self._spiegel.grand_totals:
-            total_row = len(self._spiegel.rows)
-            self._set_cell(total_row, 0, "Gesamtsumme", font=total_font)
-            for col in range(1, len(headers)):
-                self._set_cell(total_row, col, "", font=total_font)
-            for i, total in enumerate(self._spiegel.grand_totals):
-                if total is not None:
-                    gp_col = 4 + i * 2 + 1
-                    self._set_cell(
-                        total_row, gp_col,
-                        str(total.quantize(Decimal("0.01"))),
-                        font=total_font, align_right=True,
-                    )
-
-        # Resize columns
-        header_view = self._table.horizontalHeader()
-        header_view.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header_view.setSectionResizeMode(1, QHeaderView.Stretch)
-        for col in range(2, len(headers)):
-            header_view.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        total_row = len(spiegel.rows)
+        total = spiegel.grand_totals[index]
+        self._set_cell(total_row, ep_col, "", font=self._bold_font)
+        self._set_cell(
+            total_row, gp_col,
+            str(total.quantize(Decimal("0.01"))) if total is not None else "",
+            font=self._bold_font, align_right=True,
+        )
+
+    def _row_statistics(self) -> list[tuple]:
+        return [
+            (r.min_up, r.max_up, r.avg_up, len(r.unit_prices))
+            if isinstance(r, PreisSpiegelRow) else None
+            for r in self._builder.spiegel.rows
+        ]
+
+    def _refresh_changed_statistics(self, old_stats: list[tuple]) -> None:
+        """Rewrite statistics and min/max highlighting of rows whose stats changed."""
+        spiegel = self._builder.spiegel
+        n = len(spiegel.bidders)
+        for row_idx, data_row in enumerate(spiegel.rows):
+            if not isinstance(data_row, PreisSpiegelRow):
+                continue
+            old = old_stats[row_idx]
+            # Highlighting is only shown with more than one bidder
+            if (old[:3] == (data_row.min_up, data_row.max_up, data_row.avg_up)
+                    and (old[3] > 1) == (n > 1)):
+                continue
+            self._set_statistics(row_idx, data_row)
+            for i in range(n):
+                if data_row.not_offered[i]:
+                    continue
+                cell = self._table.item(row_idx, 4 + i * 2)
+                if cell is None:
+                    continue
+                bg = self._ep_background(data_row, data_row.unit_prices[i], n)
+                cell.setBackground(QBrush(bg) if bg else QBrush())
+
+    def _set_statistics(self, row_idx: int, data_row: PreisSpiegelRow) -> None:
+        stat_base = 4 + len(self._builder.spiegel.bidders) * 2
+        for offset, value in enumerate(
+            (data_row.min_up, data_row.max_up, data_row.avg_up)
+        ):
+            self._set_cell(
+                row_idx, stat_base + offset,
+                str(value.quantize(Decimal("0.01"))) if value is not None else "",
+                align_right=True,
+            )
+
+    def _ep_background(
+        self, data_row: PreisSpiegelRow, up: Optional[Decimal], n: int,
+    ) -> Optional[QColor]:
+        if up is None or n <= 1:
+            return None
+        if up == data_row.min_up:
+            return self._min_bg
+        if up == data_row.max_up:
+            return self._max_bg
+        return None
 
     def _set_cell(
         self, row: int, col: int, text: str, *,
@@ -276,7 +310,7 @@ class PreisSpiegelDialog(QDialog):
         self._table.setItem(row, col, item)
 
     def _on_export(self) -> None:
-        if self._spiegel is None:
+        if self._builder.bidder_count == 0:
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
@@ -289,7 +323,7 @@ class PreisSpiegelDialog(QDialog):
 
         try:
             exporter = PreisSpiegelExporter()
-            exporter.export(self._spiegel, file_path)
+            exporter.export(self._builder.spiegel, file_path)
             QMessageBox.information(
                 self, "Export erfolgreich",
                 f"Preisspiegel wurde exportiert:\n{file_path}",
@@ -1,7 +1,12 @@
+import copy
 from typing import Optional
 
+from lxml import etree
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QKeySequence, QTextBlockFormat, QTextCharFormat, QTextCursor, QTextListFormat
+from PySide6.QtGui import (
+    QFont, QKeySequence, QTextBlock, QTextBlockFormat, QTextCharFormat, QTextCursor,
+    QTextDocument, QTextListFormat,
+)
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QTextEdit,
@@ -14,6 +19,90 @@ from lvgenerator.gaeb.html_converter import gaeb_html_to_qt_html, qt_html_to_gae
 from lvgenerator.models.text_style_settings import text_style_settings
 
 
+_BULLET_STYLES = {
+    QTextListFormat.Style.ListDisc, QTextListFormat.Style.ListCircle,
+    QTextListFormat.Style.ListSquare,
+}
+_DIRTY = -1  # QTextBlock.userState() of new or changed blocks
+
+
+class _GaebBlockCache:
+    """GAEB ``<p>`` elements per text block; only changed blocks are reconverted.
+
+    Blocks carry a cache key in ``userState()``. ``contentsChange`` resets the
+    key of every touched block (text and format changes alike), so a later
+    conversion reuses the elements of all untouched blocks.
+    """
+
+    def __init__(self, document: QTextDocument):
+        self._document = document
+        self._elements: dict[int, etree._Element] = {}
+        self._next_key = 0
+        document.contentsChange.connect(self._on_contents_change)
+
+    def reset(self) -> None:
+        self._elements.clear()
+
+    def _on_contents_change(self, position: int, _removed: int, added: int) -> None:
+        block = self._document.findBlock(position)
+        last = self._document.findBlock(position + added)
+        while block.isValid():
+            block.setUserState(_DIRTY)
+            if block == last:
+                break
+            block = block.next()
+
+    def to_gaeb_html(self, parent_tag: str, ns: str) -> str:
+        parent = etree.Element(f"{{{ns}}}{parent_tag}")
+        elements: dict[int, etree._Element] = {}
+        block = self._document.begin()
+        while block.isValid():
+            text_list = block.textList()
+            if text_list is not None:
+                # List prefixes depend on the position, so they are rebuilt
+                parent.append(self._list_paragraph(block, text_list, ns))
+            else:
+                key = block.userState()
+                p = self._elements.get(key)
+                if p is None:
+                    p = self._convert_block(block, ns)
+                    key = self._next_key
+                    self._next_key += 1
+                    block.setUserState(key)
+                elements[key] = p
+                parent.append(copy.copy(p))
+            block = block.next()
+        self._elements = elements
+        return etree.tostring(parent, encoding="unicode")
+
+    @staticmethod
+    def _convert_block(block: QTextBlock, ns: str) -> etree._Element:
+        if block.length() <= 1:
+            p = etree.Element(f"{{{ns}}}p")
+            etree.SubElement(p, f"{{{ns}}}span").text = ""
+            return p
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+        qt_html = (cursor.selection().toHtml()
+                   .replace("<!--StartFragment-->", "").replace("<!--EndFragment-->", ""))
+        gaeb = qt_html_to_gaeb_html(qt_html, "Text", ns)
+        if not gaeb:
+            p = etree.Element(f"{{{ns}}}p")
+            etree.SubElement(p, f"{{{ns}}}span").text = block.text()
+            return p
+        return etree.fromstring(gaeb)[0]
+
+    @staticmethod
+    def _list_paragraph(block: QTextBlock, text_list, ns: str) -> etree._Element:
+        if text_list.format().style() in _BULLET_STYLES:
+            prefix = "\u2022 "
+        else:
+            prefix = f"{text_list.itemNumber(block) + 1}. "
+        p = etree.Element(f"{{{ns}}}p")
+        etree.SubElement(p, f"{{{ns}}}span").text = prefix + block.text()
+        return p
+
+
 class RichTextEditWidget(QWidget):
     """Rich text editor with formatting toolbar for GAEB text fields."""
 
@@ -25,9 +114,8 @@ class RichTextEditWidget(QWidget):
         self._max_height = max_height
         self._gaeb_parent_tag = "Text"
         self._gaeb_ns = ""
-        self._snapshot_html = ""
-        self._snapshot_text = ""
         self._setup_ui()
+        self._blocks = _GaebBlockCache(self._text_edit.document())
         self._connect_signals()
 
     def _setup_ui(self) -> None:
@@ -123,7 +211,7 @@ class RichTextEditWidget(QWidget):
         else:
             self._text_edit.clear()
         self._text_edit.blockSignals(False)
-        self._take_snapshot()
+        self._mark_unchanged()
 
     def set_plain_text(self, text: str) -> None:
         """Load plain text (fallback when no HTML available)."""
@@ -135,14 +223,13 @@ class RichTextEditWidget(QWidget):
         )
         self._text_edit.setPlainText(text)
         self._text_edit.blockSignals(False)
-        self._take_snapshot()
+        self._mark_unchanged()
 
     def get_gaeb_html(self) -> str:
-        """Get current content as GAEB HTML."""
+        """Get current content as GAEB HTML (only changed blocks are converted)."""
         if not self._gaeb_ns:
             return ""
-        qt_html = self._text_edit.toHtml()
-        return qt_html_to_gaeb_html(qt_html, self._gaeb_parent_tag, self._gaeb_ns)
+        return self._blocks.to_gaeb_html(self._gaeb_parent_tag, self._gaeb_ns)
 
     def get_plain_text(self) -> str:
         """Get current content as plain text."""
@@ -152,8 +239,7 @@ class RichTextEditWidget(QWidget):
         self._text_edit.blockSignals(True)
         self._text_edit.clear()
         self._text_edit.blockSignals(False)
-        self._snapshot_html = ""
-        self._snapshot_text = ""
+        self._mark_unchanged()
 
     def setPlaceholderText(self, text: str) -> None:
         self._text_edit.setPlaceholderText(text)
@@ -167,20 +253,25 @@ class RichTextEditWidget(QWidget):
     def setToolTip(self, tip: str) -> None:
         self._text_edit.setToolTip(tip)
 
-    def _take_snapshot(self) -> None:
-        """Snapshot current state for change detection on focus-out."""
-        self._snapshot_html = self._text_edit.toHtml()
-        self._snapshot_text = self._text_edit.toPlainText()
+    def _mark_unchanged(self) -> None:
+        """Start change tracking on freshly loaded content."""
+        self._blocks.reset()
+        self._text_edit.document().setModified(False)
+
+    def is_modified(self) -> bool:
+        return self._text_edit.document().isModified()
 
     def commit_if_changed(self) -> None:
-        """Check if content changed since last snapshot and emit editing_finished."""
-        current_text = self._text_edit.toPlainText()
-        if current_text != self._snapshot_text:
-            gaeb_html = self.get_gaeb_html()
-            plain_text = current_text
-            self._snapshot_html = self._text_edit.toHtml()
-            self._snapshot_text = current_text
-            self.editing_finished.emit(gaeb_html, plain_text)
+        """Emit editing_finished if the document was modified since the last commit.
+
+        Uses the document's modification state, so focus changes without
+        edits cost nothing regardless of the text length.
+        """
+        document = self._text_edit.document()
+        if not document.isModified():
+            return
+        document.setModified(False)
+        self.editing_finished.emit(self.get_gaeb_html(), self._text_edit.toPlainText())
 
     def focusOutEvent(self, event) -> None:
         self.commit_if_changed()
@@ -1,7 +1,13 @@
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.models.project import GAEBProject
+
 
 @pytest.fixture
 def fixtures_dir():
@@ -11,3 +17,26 @@ def fixtures_dir():
 @pytest.fixture
 def sample_x83(fixtures_dir):
     return str(fixtures_dir / "sample_x83.xml")
+
+
+def _make_item(n: int, rno: str) -> Item:
+    return Item(
+        id=f"i{n}", rno_part=rno, qty=Decimal("10"), qu="m2", up=Decimal("5.00"),
+        description=ItemDescription(outline_text=f"Position {n}"),
+    )
+
+
+@pytest.fixture
+def make_item():
+    """Factory for position ``n`` (id ``i<n>``) with OZ part ``rno``."""
+    return _make_item
+
+
+@pytest.fixture
+def two_titel_project():
+    """Titel 01 and 02 with two positions 0010 and 0020 each (i1-i4)."""
+    first = BoQCategory(id="c1", rno_part="01", label="Erdarbeiten",
+                        items=[_make_item(1, "0010"), _make_item(2, "0020")])
+    second = BoQCategory(id="c2", rno_part="02", label="Mauerarbeiten",
+                         items=[_make_item(3, "0010"), _make_item(4, "0020")])
+    return GAEBProject(boq=BoQ(categories=[first, second]))
@@ -0,0 +1,109 @@
+import io
+import json
+import shutil
+
+import pytest
+from openpyxl import load_workbook
+
+from lvgenerator.cli import JobResult, expand_patterns, main, run_jobs, validate_job
+from lvgenerator.gaeb.reader import GAEBReader
+
+
+@pytest.fixture
+def workdir(tmp_path, fixtures_dir):
+    for name in ("sample_x83.xml", "sample_x84.xml"):
+        shutil.copy(fixtures_dir / name, tmp_path / name)
+    return tmp_path
+
+
+def _failing_job(file_path):
+    raise ValueError("kaputt")
+
+
+class TestExpandPatterns:
+    def test_glob_and_dedup(self, workdir):
+        files = expand_patterns([str(workdir / "*.xml"), str(workdir / "sample_x83.xml")])
+        assert [f.rsplit("/", 1)[-1] for f in files] == ["sample_x83.xml", "sample_x84.xml"]
+
+    def test_missing_files_are_dropped(self, workdir):
+        assert expand_patterns([str(workdir / "nope.xml")]) == []
+
+
+class TestRunJobs:
+    def test_progress_and_errors(self, workdir):
+        out = io.StringIO()
+        results = run_jobs(_failing_job, [str(workdir / "sample_x83.xml")], out=out)
+        assert results == [JobResult(
+            file_path=str(workdir / "sample_x83.xml"), ok=False,
+            messages=["ValueError: kaputt"],
+        )]
+        assert out.getvalue().startswith("[1/1] FEHLER")
+
+    def test_process_pool(self, workdir):
+        files = expand_patterns([str(workdir / "*.xml")])
+        results = run_jobs(validate_job, files, jobs=2, out=io.StringIO())
+        assert sorted(r.file_path for r in results) == files
+
+
+class TestCommands:
+    def test_convert(self, workdir, capsys):
+        out_dir = workdir / "out"
+        code = main(["convert", str(workdir / "sample_x83.xml"), "--to", "X84",
+                     "-o", str(out_dir)])
+        assert code == 0
+        project = GAEBReader().read(str(out_dir / "sample_x83.x84"))
+        assert project.phase.name == "X84"
+        assert "1 erfolgreich" in capsys.readouterr().out
+
+    def test_convert_refuses_to_overwrite_source(self, workdir, capsys):
+        source = workdir / "lv.x83"
+        shutil.copy(workdir / "sample_x83.xml", source)
+        before = source.read_bytes()
+        assert main(["convert", str(source), "--to", "X83"]) == 2
+        assert "Eingabedatei" in capsys.readouterr().err
+        assert source.read_bytes() == before
+
+    def test_convert_refuses_duplicate_targets(self, workdir, capsys):
+        for folder in ("a", "b"):
+            (workdir / folder).mkdir()
+            shutil.copy(workdir / "sample_x83.xml", workdir / folder / "lv.xml")
+        out_dir = workdir / "out"
+        code = main(["convert", str(workdir / "*" / "lv.xml"), "--to", "X84",
+                     "-o", str(out_dir), "-j", "2"])
+        assert code == 2
+        assert "wird auch aus" in capsys.readouterr().err
+        assert not out_dir.exists()
+
+    def test_export_csv(self, workdir):
+        code = main(["export", str(workdir / "sample_x83.xml"), "-f", "csv"])
+        assert code == 0
+        assert (workdir / "sample_x83.csv").read_text(encoding="utf-8").startswith("project,oz")
+
+    def test_preisspiegel(self, workdir):
+        out = workdir / "ps.xlsx"
+        code = main(["preisspiegel", str(workdir / "sample_x83.xml"),
+                     str(workdir / "sample_x84.xml"), "-o", str(out)])
+        assert code == 0
+        assert load_workbook(out).active.max_row > 4
+
+    def test_merge_unchanged(self, workdir, capsys):
+        source, out = str(workdir / "sample_x83.xml"), workdir / "merged.xml"
+        assert main(["merge", source, source, source, "-o", str(out)]) == 0
+        assert GAEBReader().read(str(out)).boq.categories
+        assert "0 Änderungen übernommen, 0 Konflikte" in capsys.readouterr().out
+
+    def test_no_files(self, workdir):
+        assert main(["validate", str(workdir / "*.x99")]) == 2
+
+    def test_check_writes_jsonl_report(self, workdir, capsys):
+        report = workdir / "report.jsonl"
+        code = main(["check", str(workdir / "*.xml"), "-j", "2", "-r", str(report)])
+        records = [json.loads(line) for line in report.read_text(encoding="utf-8").splitlines()]
+        # The fixtures are GAEB 3.2, for which no XSD is shipped
+        assert code == 1
+        assert {r["file"] for r in records} == {
+            str(workdir / "sample_x83.xml"), str(workdir / "sample_x84.xml")
+        }
+        assert all(r["source"] == "xsd" for r in records)
+        assert main(["check", str(workdir / "*.xml"), "--no-xsd", "-r", str(report)]) == 0
+        assert report.read_text(encoding="utf-8") == ""
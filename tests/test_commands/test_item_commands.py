@@ -3,6 +3,7 @@ from decimal import Decimal
 import pytest
 
 from lvgenerator.commands.item_commands import (
+    BulkEditItemsCommand,
     EditItemDescriptionCommand,
     EditItemPropertyCommand,
 )
@@ -112,3 +113,45 @@ class TestEditItemDescriptionCommand:
             item.description, "detail_text", "c", "d"
         )
         assert cmd1.mergeWith(cmd2) is False
+
+
+class TestBulkEditItemsCommand:
+    @pytest.fixture
+    def items(self):
+        return [
+            Item(id=f"i{n}", qty=Decimal("2"), qu="m2", up=Decimal(up))
+            for n, up in enumerate(["10.00", "3.333", "0.99"])
+        ] + [Item(id="ohne-ep", qu="m2")]
+
+    def test_set_value_skips_unchanged(self, items):
+        items[1].qu = "m3"
+        cmd = BulkEditItemsCommand.set_value(items, "qu", "m3")
+        assert len(cmd.items) == 3
+        cmd.redo()
+        assert {i.qu for i in items} == {"m3"}
+        cmd.undo()
+        assert [i.qu for i in items] == ["m2", "m3", "m2", "m2"]
+
+    def test_uplift_up(self, items):
+        cmd = BulkEditItemsCommand.uplift_up(items, Decimal("10"))
+        cmd.redo()
+        assert [i.up for i in items[:3]] == [
+            Decimal("11.00"), Decimal("3.666"), Decimal("1.09")
+        ]
+        assert items[3].up is None
+        cmd.undo()
+        assert items[1].up == Decimal("3.333")
+
+    def test_updates_statistics_and_revision(self, items):
+        from lvgenerator.models.boq import BoQ
+        from lvgenerator.models.category import BoQCategory
+
+        cat = BoQCategory(items=items)
+        boq = BoQ(categories=[cat])
+        before = boq.statistics.grand_total
+        cmd = BulkEditItemsCommand.uplift_up(items, Decimal("-50"))
+        cmd.redo()
+        assert boq.statistics.grand_total == cat.calculate_total() != before
+        assert all(i.revision == 1 for i in items[:3])
+        cmd.undo()
+        assert boq.statistics.grand_total == cat.calculate_total() == before
@@ -0,0 +1,119 @@
+from decimal import Decimal
+
+import pytest
+from PySide6.QtGui import QUndoStack
+
+from lvgenerator.commands import undo_memory
+from lvgenerator.commands.item_commands import EditItemPropertyCommand
+from lvgenerator.commands.project_commands import ChangeOZMaskCommand
+from lvgenerator.commands.structure_commands import DeleteItemCommand
+from lvgenerator.commands.undo_memory import (
+    UndoMemoryBudget,
+    command_size,
+    estimate_size,
+    live_ids,
+)
+from lvgenerator.models.boq import BoQ, BoQBkdn, BoQInfo
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.models.project import GAEBProject
+
+
+def _item(i: int) -> Item:
+    return Item(
+        id=f"item-{i}", rno_part=f"{i:04d}",
+        description=ItemDescription(outline_text="Langtext " * 50),
+    )
+
+
+@pytest.fixture
+def project():
+    category = BoQCategory(id="cat-1", rno_part="01", items=[_item(i) for i in range(20)])
+    return GAEBProject(boq=BoQ(categories=[category]))
+
+
+@pytest.fixture
+def stack(qapp):
+    return QUndoStack()
+
+
+class TestEstimates:
+    def test_shared_objects_are_free(self, project):
+        item = project.boq.categories[0].items[0]
+        assert estimate_size(item) > 0
+        assert estimate_size(item, live_ids(project)) == 0
+
+    def test_deleted_item_is_counted(self, project):
+        category = project.boq.categories[0]
+        cmd = DeleteItemCommand(category, category.items[0])
+        cmd.redo()
+        assert command_size(cmd, live_ids(project)) >= estimate_size(cmd.item)
+
+
+class TestUndoMemoryBudget:
+    def _delete_all(self, stack, project, count):
+        category = project.boq.categories[0]
+        for _ in range(count):
+            stack.push(DeleteItemCommand(category, category.items[0]))
+
+    def test_reports_usage(self, stack, project):
+        budget = UndoMemoryBudget(stack, lambda: project)
+        self._delete_all(stack, project, 3)
+        report = budget.report()
+        assert report.commands == 3
+        assert report.size > 0
+        assert report.evicted == 0
+
+    def test_evicts_oldest_over_budget(self, stack, project):
+        one = estimate_size(project.boq.categories[0].items[0])
+        budget = UndoMemoryBudget(stack, lambda: project, budget=int(one * 2.5))
+        self._delete_all(stack, project, 5)
+        report = budget.report()
+        assert report.size <= budget.budget
+        assert report.evicted == 3
+        assert [stack.command(i).isObsolete() for i in range(5)] == [
+            True, True, True, False, False
+        ]
+
+        # Undo restores the kept steps, evicted ones are dropped silently
+        for _ in range(5):
+            stack.undo()
+        assert len(project.boq.categories[0].items) == 17
+        assert stack.count() == 2
+
+    def test_keeps_last_step(self, stack, project):
+        budget = UndoMemoryBudget(stack, lambda: project, budget=0)
+        self._delete_all(stack, project, 2)
+        assert not stack.command(1).isObsolete()
+        stack.undo()
+        assert len(project.boq.categories[0].items) == 19
+        assert budget.report().evicted == 1
+
+    def test_field_edits_keep_shared_set(self, stack, project, monkeypatch):
+        calls = []
+        monkeypatch.setattr(undo_memory, "live_ids",
+                            lambda p: calls.append(p) or live_ids(p))
+        budget = UndoMemoryBudget(stack, lambda: project)
+        items = project.boq.categories[0].items
+        for i, item in enumerate(items[:3]):
+            stack.push(EditItemPropertyCommand(item, "qty", item.qty, Decimal(i)))
+        stack.undo()
+        stack.redo()
+        assert len(calls) == 1
+        self._delete_all(stack, project, 1)
+        assert len(calls) == 2
+        stack.undo()
+        assert len(calls) == 3
+        assert budget.report().commands == 4
+
+
+class TestChangeOZMaskCommand:
+    def test_shares_lists(self):
+        old = [BoQBkdn(type="BoQLevel", length=2), BoQBkdn(type="Item", length=4)]
+        new = [BoQBkdn(type="BoQLevel", length=3), BoQBkdn(type="Item", length=4)]
+        boq = BoQ(info=BoQInfo(breakdowns=old))
+        cmd = ChangeOZMaskCommand(boq, new)
+        cmd.redo()
+        assert boq.info.breakdowns is new
+        cmd.undo()
+        assert boq.info.breakdowns is old
@@ -138,6 +138,20 @@ class TestExcelExporter:
                 break
         assert found
 
+    def test_totals_after_direct_edit_and_invalidate(self, exporter, tmp_xlsx):
+        cat = BoQCategory(id="c1", rno_part="01", label="Test", items=[
+            _make_item("i1", "0010", it=Decimal("100.00")),
+        ])
+        project = _make_project(GAEBPhase.X84, [cat])
+        exporter.export(project, tmp_xlsx)
+        cat.items[0].it = Decimal("150.00")
+        project.boq.invalidate()
+        exporter.export(project, tmp_xlsx)
+        ws = load_workbook(tmp_xlsx).active
+        totals = [ws.cell(row=row, column=7).value for row in range(1, ws.max_row + 1)
+                  if ws.cell(row=row, column=1).value in ("01", "Gesamtsumme")]
+        assert totals == [150.0, 150.0]
+
     def test_empty_project(self, exporter, tmp_xlsx):
         project = _make_project(GAEBPhase.X83)
         exporter.export(project, tmp_xlsx)
@@ -0,0 +1,147 @@
+import csv
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.constants import GAEBPhase
+from lvgenerator.export.tabular_exporter import TabularExporter
+from lvgenerator.models.boq import BoQ, BoQInfo
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.models.preisspiegel import (
+    BidderInfo,
+    PreisSpiegel,
+    PreisSpiegelCategoryRow,
+    PreisSpiegelRow,
+)
+from lvgenerator.models.project import GAEBProject, PrjInfo, AwardInfo, GAEBInfo
+
+
+def _make_item(id, rno, qty=None, qu="", up=None, it=None, text="Position"):
+    return Item(
+        id=id, rno_part=rno, qty=qty, qu=qu, up=up, it=it,
+        description=ItemDescription(outline_text=text),
+    )
+
+
+def _make_project(name="Testprojekt"):
+    inner = BoQCategory(
+        id="c2", rno_part="01", label="Mauerwerk",
+        items=[_make_item("i2", "0010", Decimal("2"), "m2", Decimal("5.00"))],
+    )
+    outer = BoQCategory(
+        id="c1", rno_part="01", label="Rohbau",
+        subcategories=[inner],
+        items=[_make_item("i1", "0020", Decimal("3"), "St", it=Decimal("9.99"))],
+    )
+    return GAEBProject(
+        gaeb_info=GAEBInfo(),
+        prj_info=PrjInfo(name=name),
+        award_info=AwardInfo(),
+        phase=GAEBPhase.X84,
+        boq=BoQ(id="boq-1", info=BoQInfo(name="LV"), categories=[outer]),
+    )
+
+
+def _make_spiegel():
+    return PreisSpiegel(
+        project_name="Testprojekt",
+        bidders=[BidderInfo("A", "a.x84"), BidderInfo("B", "b.x84")],
+        rows=[
+            PreisSpiegelCategoryRow(oz="01", label="Rohbau"),
+            PreisSpiegelRow(
+                oz="01.0010", short_text="Beton", qty=Decimal("10"), qu="m3",
+                unit_prices=[Decimal("1.00"), None],
+                total_prices=[Decimal("10.00"), None],
+                not_offered=[False, True],
+                min_up=Decimal("1.00"), max_up=Decimal("1.00"), avg_up=Decimal("1.00"),
+            ),
+        ],
+    )
+
+
+def _read_csv(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+class TestLVExport:
+    def test_rows_in_lv_order(self):
+        batches = list(TabularExporter().lv_batches([_make_project()]))
+        assert len(batches) == 1
+        batch = batches[0]
+        assert batch["oz"] == ["01.01.0010", "01.0020"]
+        assert batch["path"] == ["Rohbau > Mauerwerk", "Rohbau"]
+        assert batch["phase"] == ["X84", "X84"]
+
+    def test_total_falls_back_to_calculation(self):
+        batch = next(TabularExporter().lv_batches([_make_project()]))
+        assert batch["it"] == [Decimal("10.00"), Decimal("9.99")]
+
+    def test_sees_changes_without_invalidate(self):
+        project = _make_project()
+        exporter = TabularExporter()
+        project.boq.snapshot()
+        project.boq.categories[0].items.append(_make_item("i3", "0030"))
+        batch = next(exporter.lv_batches([project]))
+        assert batch["oz"][-1] == "01.0030"
+
+    def test_batch_size(self):
+        projects = [_make_project("P1"), _make_project("P2")]
+        batches = list(TabularExporter(batch_size=3).lv_batches(projects))
+        assert [len(b["oz"]) for b in batches] == [3, 1]
+        assert batches[1]["project"] == ["P2"]
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "lv.csv"
+        count = TabularExporter().export_lv_csv([_make_project()], str(path))
+        rows = _read_csv(path)
+        assert count == 2
+        assert list(rows[0]) == TabularExporter.LV_COLUMNS
+        assert rows[0]["up"] == "5.00"
+        assert rows[1]["up"] == ""
+
+    def test_deep_tree_without_recursion(self):
+        root = cat = BoQCategory(id="c0", rno_part="1", label="L0")
+        for depth in range(1, 3000):
+            sub = BoQCategory(id=f"c{depth}", rno_part="1", label=f"L{depth}")
+            cat.subcategories.append(sub)
+            cat = sub
+        cat.items.append(_make_item("i", "1"))
+        project = _make_project()
+        project.boq.categories = [root]
+        batch = next(TabularExporter().lv_batches([project]))
+        assert batch["oz"][0].count(".") == 3000
+
+
+class TestPreisSpiegelExport:
+    def test_long_format(self):
+        batch = next(TabularExporter().preisspiegel_batches([_make_spiegel()]))
+        assert batch["bidder"] == ["A", "B"]
+        assert batch["oz"] == ["01.0010", "01.0010"]
+        assert batch["not_offered"] == [False, True]
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "ps.csv"
+        TabularExporter().export_preisspiegel_csv([_make_spiegel()], str(path))
+        rows = _read_csv(path)
+        assert rows[0]["tp"] == "10.00"
+        assert rows[1]["up"] == ""
+
+
+class TestParquet:
+    def test_lv_roundtrip(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "lv.parquet"
+        TabularExporter(batch_size=1).export_lv_parquet([_make_project()], str(path))
+        table = pq.read_table(str(path))
+        assert table.num_rows == 2
+        assert table.column("up").to_pylist()[0] == Decimal("5.000000")
+        assert table.column("oz").to_pylist() == ["01.01.0010", "01.0020"]
+
+    def test_preisspiegel_roundtrip(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "ps.parquet"
+        TabularExporter().export_preisspiegel_parquet([_make_spiegel()], str(path))
+        table = pq.read_table(str(path))
+        assert table.column("not_offered").to_pylist() == [False, True]
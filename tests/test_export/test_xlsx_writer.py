@@ -0,0 +1,70 @@
+import pytest
+from openpyxl import load_workbook
+from openpyxl.styles import Font, NamedStyle, PatternFill
+
+from lvgenerator.export.xlsx_writer import StreamingSheetWriter
+
+
+@pytest.fixture
+def tmp_xlsx(tmp_path):
+    return str(tmp_path / "test_output.xlsx")
+
+
+def _styles():
+    return [
+        NamedStyle("bold", font=Font(bold=True)),
+        NamedStyle("money", number_format="#,##0.00"),
+        NamedStyle("shaded", fill=PatternFill(start_color="D9E1F2", fill_type="solid")),
+    ]
+
+
+class TestStreamingSheetWriter:
+    def test_values_and_styles(self, tmp_xlsx):
+        sheet = StreamingSheetWriter("Test", _styles())
+        sheet.append([("Titel", "bold"), "plain", (12.5, "money"), (3.0, "money")])
+        sheet.save(tmp_xlsx)
+
+        ws = load_workbook(tmp_xlsx)["Test"]
+        assert ws.cell(row=1, column=1).value == "Titel"
+        assert ws.cell(row=1, column=1).font.bold
+        assert ws.cell(row=1, column=2).value == "plain"
+        assert ws.cell(row=1, column=3).value == 12.5
+        assert ws.cell(row=1, column=3).number_format == "#,##0.00"
+        assert ws.cell(row=1, column=4).value == 3.0
+
+    def test_empty_styled_cell_keeps_fill(self, tmp_xlsx):
+        sheet = StreamingSheetWriter("Test", _styles())
+        sheet.append(["a", (None, "shaded")])
+        sheet.save(tmp_xlsx)
+
+        ws = load_workbook(tmp_xlsx)["Test"]
+        assert ws.cell(row=1, column=2).value is None
+        assert ws.cell(row=1, column=2).fill.start_color.rgb == "00D9E1F2"
+
+    def test_widths_grow_with_content(self):
+        sheet = StreamingSheetWriter("Test", [], min_widths=[10, 10])
+        sheet.append(["kurz", "x" * 20])
+        assert sheet.column_widths == [10, 20 + StreamingSheetWriter.WIDTH_PADDING]
+
+    def test_widths_capped(self):
+        sheet = StreamingSheetWriter("Test", [])
+        sheet.append(["x" * 500])
+        assert sheet.column_widths == [StreamingSheetWriter.MAX_WIDTH]
+
+    def test_multiline_uses_longest_line(self):
+        sheet = StreamingSheetWriter("Test", [])
+        sheet.append(["abc\n" + "y" * 15 + "\nde"])
+        assert sheet.column_widths == [15 + StreamingSheetWriter.WIDTH_PADDING]
+
+    def test_unmeasured_rows_do_not_widen(self):
+        sheet = StreamingSheetWriter("Test", [], min_widths=[8])
+        sheet.append(["Ein sehr langer Projekttitel"], measure=False)
+        assert sheet.column_widths == [8]
+
+    def test_widths_written(self, tmp_xlsx):
+        sheet = StreamingSheetWriter("Test", [], min_widths=[12])
+        sheet.append(["x" * 30])
+        sheet.save(tmp_xlsx)
+
+        ws = load_workbook(tmp_xlsx)["Test"]
+        assert ws.column_dimensions["A"].width == 30 + StreamingSheetWriter.WIDTH_PADDING
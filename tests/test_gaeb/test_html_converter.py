@@ -5,6 +5,8 @@ from lxml import etree
 import pytest
 
 from lvgenerator.gaeb.html_converter import (
+    clear_conversion_caches,
+    conversion_cache_stats,
     gaeb_html_to_qt_html,
     qt_html_to_gaeb_html,
     _parse_css,
@@ -287,3 +289,27 @@ class TestRoundTrip:
         assert "Normal" in text
         assert "Fett" in text
         assert "Kursiv" in text
+
+
+class TestConversionCache:
+    def test_repeated_conversion_hits_cache(self):
+        clear_conversion_caches()
+        gaeb = _gaeb_text("Beton C25/30", "Bewehrung")
+        first = gaeb_html_to_qt_html(gaeb, "Arial", 10)
+        assert gaeb_html_to_qt_html(gaeb, "Arial", 10) == first
+        stats = conversion_cache_stats()["to_qt"]
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_font_is_part_of_the_key(self):
+        clear_conversion_caches()
+        gaeb = _gaeb_text("Text")
+        assert gaeb_html_to_qt_html(gaeb, "Arial", 10) != gaeb_html_to_qt_html(gaeb, "Arial", 12)
+        assert conversion_cache_stats()["to_qt"].misses == 2
+
+    def test_reverse_direction(self):
+        clear_conversion_caches()
+        qt = "<html><body><p>Hallo</p></body></html>"
+        assert qt_html_to_gaeb_html(qt, "Text", NS) == qt_html_to_gaeb_html(qt, "Text", NS)
+        assert conversion_cache_stats()["to_gaeb"].hits == 1
+        assert conversion_cache_stats()["to_gaeb"].size == 1
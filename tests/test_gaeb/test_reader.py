@@ -100,3 +100,26 @@ class TestGAEBReader:
                 total += len(subcat.items)
             total += len(cat.items)
         assert total == 4
+
+    def test_read_interns_repeated_texts(self, tmp_path, sample_x83):
+        source = open(sample_x83, encoding="utf-8").read()
+        path = tmp_path / "twice.x83"
+        # Same LV body twice: every text of the second copy is a duplicate
+        start = source.index("<BoQCtgy")
+        end = source.rindex("</BoQCtgy>") + len("</BoQCtgy>")
+        path.write_text(source[:end] + source[start:end] + source[end:], encoding="utf-8")
+
+        reader = GAEBReader()
+        project = reader.read(str(path))
+        categories = project.boq.categories
+        first, second = categories[0], categories[len(categories) // 2]
+        a = first.subcategories[0].items[0]
+        b = second.subcategories[0].items[0]
+        assert a.description.detail_html is b.description.detail_html
+        assert a.qu is b.qu
+        assert reader.text_pool.stats().hits > 0
+
+    def test_read_without_interning(self, sample_x83):
+        reader = GAEBReader(intern_texts=False)
+        reader.read(sample_x83)
+        assert reader.text_pool is None
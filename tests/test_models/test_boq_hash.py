@@ -0,0 +1,183 @@
+import pickle
+from copy import deepcopy
+from dataclasses import asdict
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.commands.drag_drop_commands import DragDropMoveCommand
+from lvgenerator.commands.item_commands import (
+    EditItemDescriptionCommand,
+    EditItemPropertyCommand,
+)
+from lvgenerator.commands.structure_commands import (
+    AddCategoryCommand,
+    AddItemCommand,
+    DeleteCategoryCommand,
+    RenumberCommand,
+)
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.boq_hash import boq_fingerprint, changed_since, content_hash
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.clone import clone_category
+from lvgenerator.models.node_cache import (
+    invalidate_node_caches,
+    invalidate_parent_caches,
+    reset_node_caches,
+)
+from lvgenerator.services.renumbering import RenumberPlan
+
+
+@pytest.fixture
+def boq(make_item):
+    inner = BoQCategory(id="c11", rno_part="01", label="Aushub",
+                        items=[make_item(1, "0010"), make_item(2, "0020")])
+    first = BoQCategory(id="c1", rno_part="01", label="Erdarbeiten",
+                        subcategories=[inner])
+    second = BoQCategory(id="c2", rno_part="02", label="Mauerarbeiten",
+                         items=[make_item(3, "0010")])
+    return BoQ(categories=[first, second])
+
+
+def _cached(node) -> bool:
+    return node._content_hash is not None
+
+
+class TestHashes:
+    def test_changed_representation_changes_hash(self, make_item):
+        a, b = make_item(1, "0010"), make_item(1, "0010")
+        assert content_hash(a) == content_hash(b)
+        b.qty = Decimal("10.000")
+        invalidate_node_caches(b)
+        assert content_hash(a) != content_hash(b)
+
+    def test_item_number_not_part_of_item_hash(self, make_item):
+        assert content_hash(make_item(1, "0010")) == content_hash(make_item(1, "0099"))
+
+    def test_fingerprint_covers_numbers(self, boq):
+        before = boq_fingerprint(boq)
+        item = boq.categories[1].items[0]
+        item.rno_part = "0015"
+        invalidate_parent_caches(item)
+        assert boq_fingerprint(boq) != before
+
+
+class TestCache:
+    def test_hash_is_cached_bottom_up(self, boq):
+        first = boq.categories[0]
+        digest = content_hash(first)
+        inner = first.subcategories[0]
+        assert _cached(inner) and _cached(inner.items[0])
+        assert content_hash(first) is digest
+
+    def test_invalidation_follows_parent_chain(self, boq):
+        boq_fingerprint(boq)
+        first, second = boq.categories
+        inner = first.subcategories[0]
+        invalidate_node_caches(inner.items[0].description)
+        assert not _cached(inner.items[0]) and not _cached(inner) and not _cached(first)
+        assert _cached(inner.items[1]) and _cached(second)
+
+    def test_changed_since(self, boq):
+        first = boq.categories[0]
+        before = content_hash(first)
+        item = first.subcategories[0].items[0]
+        item.up = Decimal("6.00")
+        invalidate_node_caches(item)
+        assert changed_since(first, before)
+        item.up = Decimal("5.00")
+        invalidate_node_caches(item)
+        assert not changed_since(first, before)
+
+    def test_reset_after_direct_changes(self, boq):
+        before = boq_fingerprint(boq)
+        boq.categories[1].items[0].qty = Decimal("11")
+        assert boq_fingerprint(boq) == before
+        reset_node_caches(boq.categories)
+        assert boq_fingerprint(boq) != before
+
+    def test_copies_start_uncached(self, boq):
+        fingerprint = boq_fingerprint(boq)
+        first = boq.categories[0]
+        for copy in (deepcopy(first), clone_category(first),
+                     pickle.loads(pickle.dumps(first))):
+            item = copy.subcategories[0].items[0]
+            assert not _cached(copy) and not _cached(item)
+            assert item._cache_parent is None and item.description._cache_parent is None
+            assert content_hash(copy) == content_hash(first)
+        assert boq_fingerprint(deepcopy(boq)) == fingerprint
+
+    def test_asdict_after_hashing(self, boq):
+        boq_fingerprint(boq)
+        first = boq.categories[0]
+        data = asdict(first)
+        assert data["subcategories"][0]["items"][0]["id"] == "i1"
+        assert asdict(first.subcategories[0].items[0])["description"]["outline_text"] \
+            == "Position 1"
+
+
+class TestCommands:
+    def test_edit_item(self, boq):
+        before = boq_fingerprint(boq)
+        item = boq.categories[1].items[0]
+        cmd = EditItemPropertyCommand(item, "qty", item.qty, Decimal("12"))
+        cmd.redo()
+        assert boq_fingerprint(boq) != before
+        cmd.undo()
+        assert boq_fingerprint(boq) == before
+
+    def test_edit_description(self, boq):
+        first = boq.categories[0]
+        before = content_hash(first)
+        description = first.subcategories[0].items[1].description
+        cmd = EditItemDescriptionCommand(description, "outline_text",
+                                         description.outline_text, "Abfuhr")
+        cmd.redo()
+        assert changed_since(first, before)
+        cmd.undo()
+        assert not changed_since(first, before)
+
+    def test_add_category_to_empty_titel(self, boq):
+        second = boq.categories[1]
+        before = content_hash(second)
+        cmd = AddCategoryCommand(second.subcategories,
+                                 BoQCategory(id="c21", rno_part="01"), parent=second)
+        cmd.redo()
+        assert changed_since(second, before)
+        cmd.undo()
+        assert not changed_since(second, before)
+
+    def test_delete_category_and_add_item(self, boq, make_item):
+        first = boq.categories[0]
+        inner = first.subcategories[0]
+        before = boq_fingerprint(boq)
+        delete = DeleteCategoryCommand(first.subcategories, inner, parent=first)
+        delete.redo()
+        assert boq_fingerprint(boq) != before
+        delete.undo()
+        assert boq_fingerprint(boq) == before
+        add = AddItemCommand(inner, make_item(4, "0030"))
+        add.redo()
+        assert boq_fingerprint(boq) != before
+
+    def test_renumber_and_move(self, boq):
+        first, second = boq.categories
+        inner = first.subcategories[0]
+        before = boq_fingerprint(boq)
+        item = inner.items[1]
+        renumber = RenumberCommand(RenumberPlan((item,), ("0020",), ("0030",)))
+        renumber.redo()
+        assert boq_fingerprint(boq) != before
+        renumber.undo()
+        assert boq_fingerprint(boq) == before
+        move = DragDropMoveCommand(inner.items, item, 1, second.items, 1,
+                                   source_parent=inner, target_parent=second)
+        move.redo()
+        assert second.items[1] is item
+        moved = boq_fingerprint(boq)
+        assert moved != before
+        reset_node_caches(boq.categories)
+        assert boq_fingerprint(boq) == moved
+        move.undo()
+        assert boq_fingerprint(boq) == before
+
@@ -0,0 +1,149 @@
+import copy
+
+from lvgenerator.commands.copy_commands import DuplicateItemCommand
+from lvgenerator.commands.drag_drop_commands import DragDropMoveCommand
+from lvgenerator.commands.item_commands import EditItemPropertyCommand
+from lvgenerator.commands.structure_commands import (
+    AddCategoryCommand,
+    AddItemCommand,
+    DeleteCategoryCommand,
+    DeleteItemCommand,
+    RenumberCommand,
+)
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.boq_index import BoQIndex
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.services.renumbering import RenumberPlan
+
+
+def _make_boq():
+    item_a = Item(id="i1", rno_part="0010")
+    item_b = Item(id="i2", rno_part="0020")
+    sub = BoQCategory(id="c2", rno_part="02", items=[item_a, item_b])
+    top = BoQCategory(id="c1", rno_part="01", subcategories=[sub])
+    return BoQ(categories=[top]), top, sub, item_a, item_b
+
+
+class TestBoQIndex:
+    def test_lookup_by_oz_and_id(self):
+        boq, top, sub, item_a, _ = _make_boq()
+        assert boq.index.item("01.02.0010") is item_a
+        assert boq.index.category("01.02") is sub
+        assert boq.index.by_id("c1") is top
+        assert boq.index.full_oz(item_a) == "01.02.0010"
+
+    def test_parents(self):
+        boq, top, sub, item_a, _ = _make_boq()
+        assert boq.index.parent(item_a) is sub
+        assert boq.index.parent(top) is None
+        assert boq.index.parent_list(item_a) is sub.items
+        assert boq.index.parent_list(sub) is top.subcategories
+        assert boq.index.parent_list(top) is boq.categories
+
+    def test_equal_nodes_are_distinguished(self):
+        boq, _, sub, _, _ = _make_boq()
+        twin = Item(id="i1", rno_part="0010")
+        assert twin not in boq.index
+        assert boq.index.parent_list(twin) is None
+
+    def test_invalidate_after_structure_change(self):
+        boq, _, sub, item_a, _ = _make_boq()
+        index = boq.index
+        assert boq.index is index
+        sub.items.remove(item_a)
+        item_a.rno_part = "0030"
+        sub.items.append(item_a)
+        boq.invalidate()
+        assert boq.index.item("01.02.0030") is item_a
+        assert boq.index.item("01.02.0010") is None
+
+    def test_copy_does_not_share_index(self):
+        boq, *_ = _make_boq()
+        boq.index
+        clone = copy.deepcopy(boq)
+        assert clone.index.item("01.02.0010") is clone.categories[0].subcategories[0].items[0]
+
+
+def _assert_current(boq):
+    """The maintained index answers like one built from scratch."""
+    fresh = BoQIndex(boq)
+    index = boq.index
+    assert dict(index.items_by_oz()) == dict(fresh.items_by_oz())
+    assert len(index) == len(fresh)
+    for oz, _item in fresh.items_by_oz():
+        node = index.item(oz)
+        assert index.parent(node) is fresh.parent(node)
+        assert index.by_id(node.id) is node
+    for cat in (fresh.category("01"), fresh.category("01.02")):
+        assert index.category(fresh.full_oz(cat)) is cat
+
+
+class TestMaintainedByCommands:
+    def _run(self, boq, cmd):
+        index = boq.index
+        cmd.redo()
+        _assert_current(boq)
+        cmd.undo()
+        _assert_current(boq)
+        cmd.redo()
+        assert boq.index is index and not index._stale
+
+    def test_items(self):
+        boq, top, sub, item_a, _ = _make_boq()
+        self._run(boq, AddItemCommand(sub, Item(id="i3", rno_part="0030"),
+                                      boq_index=boq.index))
+        self._run(boq, DeleteItemCommand(sub, item_a, boq_index=boq.index))
+        self._run(boq, DuplicateItemCommand(sub, sub.items[0], boq_index=boq.index))
+        assert boq.index.item("01.02.0030").id == "i3"
+
+    def test_categories(self):
+        boq, top, sub, _, _ = _make_boq()
+        new = BoQCategory(id="c3", rno_part="03", items=[Item(id="i9", rno_part="0010")])
+        self._run(boq, AddCategoryCommand(top.subcategories, new, parent=top,
+                                          boq_index=boq.index))
+        assert boq.index.item("01.03.0010").id == "i9"
+        self._run(boq, DeleteCategoryCommand(top.subcategories, sub, parent=top,
+                                             boq_index=boq.index))
+        assert boq.index.item("01.02.0010") is None
+
+    def test_move_and_renumber(self):
+        boq, top, sub, item_a, _ = _make_boq()
+        other = BoQCategory(id="c4", rno_part="02")
+        boq.categories.append(other)
+        boq.invalidate()
+        self._run(boq, DragDropMoveCommand(
+            top.subcategories, sub, 0, other.subcategories, 0,
+            source_parent=top, target_parent=other, boq_index=boq.index,
+        ))
+        assert boq.index.item("02.02.0010") is item_a
+        plan = RenumberPlan((sub, item_a), ("02", "0010"), ("05", "0015"))
+        self._run(boq, RenumberCommand(plan, boq_index=boq.index))
+        assert boq.index.item("02.05.0015") is item_a
+        self._run(boq, EditItemPropertyCommand(item_a, "rno_part", "0015", "0017",
+                                               boq_index=boq.index))
+        assert boq.index.full_oz(item_a) == "02.05.0017"
+
+    def test_duplicate_oz_without_rebuild(self):
+        boq, top, sub, item_a, _ = _make_boq()
+        index = boq.index
+        len(index)
+        dup = DuplicateItemCommand(sub, item_a, boq_index=index)
+        dup.redo()
+        copy_a = dup.new_item
+        assert copy_a.rno_part == item_a.rno_part
+        assert index.item("01.02.0010") is copy_a
+        dup.undo()
+        assert not index._stale
+        assert index.item("01.02.0010") is item_a
+        dup.redo()
+        delete = DeleteItemCommand(sub, item_a, boq_index=index)
+        delete.redo()
+        assert not index._stale
+        assert index.item("01.02.0010") is copy_a
+        assert index.by_id(item_a.id) is None
+        delete.undo()
+        dup.undo()
+        assert not index._stale
+        _assert_current(boq)
+        assert index._items_by_oz.hidden == {}
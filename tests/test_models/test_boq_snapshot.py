@@ -0,0 +1,65 @@
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+
+
+def _make_boq():
+    item_a = Item(id="i1", rno_part="0010", qty=Decimal("2"), up=Decimal("10.50"), qu="m")
+    item_b = Item(id="i2", rno_part="0020", it=Decimal("100.00"))
+    item_c = Item(id="i3", rno_part="0030")
+    sub = BoQCategory(id="c2", rno_part="02", label="Sub", items=[item_a, item_b])
+    top = BoQCategory(id="c1", rno_part="01", label="Top", subcategories=[sub],
+                      items=[item_c])
+    other = BoQCategory(id="c3", rno_part="02", label="Leer")
+    return BoQ(categories=[top, other])
+
+
+class TestBoQSnapshot:
+    def test_lv_order_depth_and_parents(self):
+        snapshot = _make_boq().snapshot()
+        assert snapshot.oz == ("01", "01.02", "01.02.0010", "01.02.0020", "01.0030", "02")
+        assert snapshot.depth == (0, 1, 2, 2, 1, 0)
+        assert snapshot.parent == (-1, 0, 1, 1, 0, -1)
+        assert snapshot.is_item == (False, False, True, True, True, False)
+        assert (snapshot.category_count, snapshot.item_count) == (3, 3)
+        assert list(snapshot.item_rows()) == [2, 3, 4]
+
+    def test_columns_and_totals(self):
+        boq = _make_boq()
+        snapshot = boq.snapshot()
+        assert snapshot.qty[2] == Decimal("2")
+        assert snapshot.qu[2] == "m"
+        assert snapshot.short_text[0] == "Top"
+        assert snapshot.total[2] == Decimal("21.00")
+        assert snapshot.total[3] == Decimal("100.00")
+        assert snapshot.total[4] is None
+        assert snapshot.total[1] == Decimal("121.00")
+        assert snapshot.total[0] == boq.categories[0].calculate_total()
+        assert snapshot.total[5] is None
+        assert snapshot.grand_total == Decimal("121.00")
+
+    def test_is_immutable(self):
+        snapshot = _make_boq().snapshot()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.qty = ()
+        assert isinstance(snapshot.qty, tuple)
+
+    def test_cached_until_invalidated(self):
+        boq = _make_boq()
+        snapshot = boq.snapshot()
+        assert boq.snapshot() is snapshot
+        boq.categories.pop()
+        boq.invalidate()
+        assert boq.snapshot().category_count == 2
+
+    def test_shared_across_threads(self):
+        snapshot = _make_boq().snapshot()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            totals = list(pool.map(lambda _: snapshot.grand_total, range(8)))
+        assert set(totals) == {Decimal("121.00")}
@@ -0,0 +1,128 @@
+from decimal import Decimal
+
+from lvgenerator.commands.copy_commands import DuplicateCategoryCommand
+from lvgenerator.commands.drag_drop_commands import DragDropMoveCommand
+from lvgenerator.commands.item_commands import EditItemPropertyCommand
+from lvgenerator.commands.structure_commands import (
+    AddItemCommand,
+    DeleteCategoryCommand,
+    DeleteItemCommand,
+)
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.boq_statistics import BoQStatistics
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.models.node_cache import reset_node_caches
+
+
+def _make_boq():
+    priced = Item(id="i1", rno_part="0010", qty=Decimal("2"), up=Decimal("10.50"))
+    lump = Item(id="i2", rno_part="0020", it=Decimal("100.00"))
+    formula = Item(id="i3", rno_part="0030", formula="2*3")
+    sub = BoQCategory(id="c2", rno_part="02", items=[priced, lump])
+    top = BoQCategory(id="c1", rno_part="01", subcategories=[sub], items=[formula])
+    return BoQ(categories=[top])
+
+
+def _assert_matches_recount(boq):
+    cached = boq.statistics.as_dict()
+    reset_node_caches(boq.categories)
+    assert cached == BoQStatistics.from_boq(boq).as_dict()
+
+
+class TestBoQStatistics:
+    def test_initial_counts(self):
+        stats = _make_boq().statistics
+        assert (stats.categories, stats.items) == (2, 3)
+        assert stats.priced_items == 2
+        assert stats.formula_items == 1
+        assert stats.grand_total == Decimal("121.00")
+
+    def test_empty_boq_has_no_total(self):
+        assert BoQ().statistics.grand_total is None
+
+    def test_cached_per_titel(self):
+        boq = _make_boq()
+        boq.statistics
+        top = boq.categories[0]
+        sub = top.subcategories[0]
+        assert top._statistics.grand_total == Decimal("121.00")
+        assert sub._statistics.grand_total == Decimal("121.00")
+        assert sub._statistics.items == 2
+
+    def test_item_commands(self):
+        boq = _make_boq()
+        sub = boq.categories[0].subcategories[0]
+        new = Item(id="i4", rno_part="0040", it=Decimal("5.00"))
+
+        add = AddItemCommand(sub, new)
+        add.redo()
+        assert boq.statistics.grand_total == Decimal("126.00")
+        _assert_matches_recount(boq)
+
+        delete = DeleteItemCommand(sub, sub.items[0])
+        delete.redo()
+        _assert_matches_recount(boq)
+        delete.undo()
+        add.undo()
+        assert boq.statistics.grand_total == Decimal("121.00")
+        _assert_matches_recount(boq)
+
+    def test_property_edit_recounts_changed_path_only(self):
+        boq = _make_boq()
+        boq.categories.append(BoQCategory(id="c3", rno_part="03",
+                                          items=[Item(id="i5", it=Decimal("1.00"))]))
+        boq.statistics
+        other = boq.categories[1]._statistics
+        item = boq.categories[0].subcategories[0].items[0]
+        cmd = EditItemPropertyCommand(item, "up", item.up, None)
+        cmd.redo()
+        stats = boq.statistics
+        assert stats.priced_items == 2
+        assert stats.grand_total == Decimal("101.00")
+        assert boq.categories[1]._statistics is other
+        cmd.undo()
+        assert boq.statistics.grand_total == Decimal("122.00")
+        _assert_matches_recount(boq)
+
+    def test_category_commands(self):
+        boq = _make_boq()
+        top = boq.categories[0]
+        boq.statistics
+        dup = DuplicateCategoryCommand(boq.categories, top)
+        dup.redo()
+        stats = boq.statistics
+        assert (stats.categories, stats.items) == (4, 6)
+        assert stats.grand_total == Decimal("242.00")
+        delete = DeleteCategoryCommand(top.subcategories, top.subcategories[0], parent=top)
+        delete.redo()
+        assert boq.statistics.grand_total == Decimal("121.00")
+        _assert_matches_recount(boq)
+        delete.undo()
+        dup.undo()
+        assert boq.statistics.as_dict() == _make_boq().statistics.as_dict()
+
+    def test_drag_drop_between_titel(self):
+        boq = _make_boq()
+        top = boq.categories[0]
+        sub = top.subcategories[0]
+        other = BoQCategory(id="c3", rno_part="02")
+        boq.categories.append(other)
+        boq.invalidate()
+        boq.statistics
+        item = sub.items[0]
+        move = DragDropMoveCommand(sub.items, item, 0, other.items, 0,
+                                   source_parent=sub, target_parent=other)
+        move.redo()
+        assert boq.statistics.grand_total == Decimal("121.00")
+        assert other._statistics.grand_total == Decimal("21.00")
+        assert sub._statistics.grand_total == Decimal("100.00")
+        _assert_matches_recount(boq)
+
+    def test_invalidate_after_direct_changes(self):
+        boq = _make_boq()
+        stats = boq.statistics
+        boq.categories[0].items[0].it = Decimal("1.00")
+        assert boq.statistics.as_dict() == stats.as_dict()
+        boq.invalidate()
+        assert boq.statistics.grand_total == Decimal("122.00")
@@ -65,3 +65,32 @@ class TestCalculateTotal:
             items=[Item(id="1", rno_part="0010")],
         )
         assert cat.calculate_total() is None
+
+    def test_sub_cent_it_is_kept_exact(self):
+        cat = BoQCategory(
+            id="cat-1",
+            items=[
+                Item(id="1", it=Decimal("0.005")),
+                Item(id="2", qty=Decimal("2"), up=Decimal("1.50")),
+            ],
+        )
+        assert cat.calculate_total() == Decimal("3.005")
+
+    def test_total_follows_changed_values(self):
+        item = Item(id="1", qty=Decimal("2"), up=Decimal("1.50"))
+        cat = BoQCategory(id="cat-1", items=[item])
+        assert str(cat.calculate_total()) == "3.00"
+        item.qty = Decimal("4")
+        assert cat.calculate_total() == Decimal("6.00")
+        item.it = Decimal("7.10")
+        assert cat.calculate_total() == Decimal("7.10")
+
+    def test_cached_and_uncached_positions_mix(self):
+        cached = Item(id="1", qty=Decimal("2"), up=Decimal("1.50"))
+        assert cached.total_cents() == 300
+        cat = BoQCategory(id="cat-1", items=[
+            cached, Item(id="2", qty=Decimal("1"), up=Decimal("0.125")),
+        ])
+        assert str(cat.calculate_total()) == "3.12"
+        cached.up = Decimal("2.00")
+        assert cat.calculate_total() == Decimal("4.12")
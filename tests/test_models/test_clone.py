@@ -0,0 +1,55 @@
+from copy import deepcopy
+from decimal import Decimal
+
+from lxml import etree
+
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.clone import clone_category, clone_item
+from lvgenerator.models.item import CtlgAssignment, Item, ItemDescription
+
+
+def _item() -> Item:
+    item = Item(
+        id="item-1", rno_part="0010", qty=Decimal("12.5"), up=Decimal("3.20"),
+        description=ItemDescription(outline_text="Mauerwerk"),
+    )
+    item.description.perf_descr_raw = etree.fromstring("<PerfDescr><x/></PerfDescr>")
+    item.ctlg_assignments.append(CtlgAssignment(ctlg_id="K1", ctlg_code="4711"))
+    item.up_components[1] = Decimal("1.10")
+    return item
+
+
+class TestCloneItem:
+    def test_equal_to_deepcopy(self):
+        item = _item()
+        clone = clone_item(item, new_ids=False)
+        expected = deepcopy(item)
+        # lxml elements compare by identity; the clone shares them
+        expected.description.perf_descr_raw = item.description.perf_descr_raw
+        assert clone == expected
+
+    def test_shares_immutables_copies_containers(self):
+        item = _item()
+        clone = clone_item(item)
+        assert clone.id != item.id
+        assert clone.qty is item.qty
+        assert clone.description is not item.description
+        assert clone.description.perf_descr_raw is item.description.perf_descr_raw
+        assert clone.ctlg_assignments is not item.ctlg_assignments
+        assert clone.ctlg_assignments[0] is not item.ctlg_assignments[0]
+        clone.up_components[2] = Decimal("1")
+        assert 2 not in item.up_components
+
+
+class TestCloneCategory:
+    def test_new_ids_in_same_pass(self):
+        sub = BoQCategory(id="sub", rno_part="02", items=[_item()])
+        cat = BoQCategory(id="cat", rno_part="01", subcategories=[sub], items=[_item()])
+        clone = clone_category(cat)
+        ids = {clone.id, clone.subcategories[0].id, clone.items[0].id,
+               clone.subcategories[0].items[0].id}
+        assert len(ids) == 4
+        assert not ids & {"cat", "sub", "item-1"}
+        assert clone.subcategories[0].rno_part == "02"
+        assert clone.subcategories is not cat.subcategories
+        assert clone.calculate_total() == cat.calculate_total()
@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.models.formula_evaluator import evaluate_formula
+from lvgenerator.models.global_constants import (
+    GlobalConstants,
+    JsonFileStorage,
+    MemoryStorage,
+    global_constants,
+)
+
+
+class _CountingStorage(MemoryStorage):
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return super().load()
+
+
+class TestGlobalConstants:
+    def test_loads_lazily_once(self):
+        storage = _CountingStorage()
+        constants = GlobalConstants(storage)
+        assert storage.loads == 0
+        assert constants.get_value("pi") > Decimal("3.14")
+        constants.get_value("E")
+        assert storage.loads == 1
+
+    def test_version_increases_on_change(self):
+        constants = GlobalConstants(MemoryStorage())
+        v0 = constants.version
+        constants.set_constant("x", Decimal("1"))
+        v1 = constants.version
+        constants.remove_constant("X")
+        v2 = constants.version
+        constants.remove_constant("X")
+        assert v0 < v1 < v2 == constants.version
+
+    def test_save_and_reload(self):
+        storage = MemoryStorage()
+        constants = GlobalConstants(storage)
+        constants.replace_all({"breite": (Decimal("2.5"), "Breite")})
+        constants.save()
+        assert storage.data == {"BREITE": {"value": "2.5", "description": "Breite"}}
+        assert GlobalConstants(storage).get_constant("breite") == (Decimal("2.5"), "Breite")
+
+    def test_json_file_storage(self, tmp_path):
+        path = tmp_path / "sub" / "constants.json"
+        constants = GlobalConstants(JsonFileStorage(path))
+        constants.set_constant("A", Decimal("3"))
+        constants.save()
+        assert json.loads(path.read_text(encoding="utf-8"))["A"]["value"] == "3"
+
+    def test_corrupt_file_falls_back_to_defaults(self, tmp_path):
+        path = tmp_path / "constants.json"
+        path.write_text("{kaputt", encoding="utf-8")
+        assert "PI" in GlobalConstants(JsonFileStorage(path)).get_all_constants()
+
+    def test_import_is_qt_free_and_without_io(self, tmp_path):
+        code = (
+            "import sys, lvgenerator.models.formula_evaluator, lvgenerator.models.project;"
+            "assert not [m for m in sys.modules if m.startswith('PySide6')];"
+            "import os; assert not os.path.exists(os.path.join(sys.argv[1], 'LVGenerator'))"
+        )
+        env = {"XDG_DATA_HOME": str(tmp_path), "APPDATA": str(tmp_path),
+               "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code, str(tmp_path)], env=env, check=True)
+
+
+class TestFormulaCache:
+    @pytest.fixture(autouse=True)
+    def _memory_storage(self):
+        old = global_constants.storage
+        global_constants.set_storage(MemoryStorage())
+        yield
+        global_constants.set_storage(old)
+
+    def test_cache_follows_constant_changes(self):
+        global_constants.set_constant("BREITE", Decimal("2"))
+        assert evaluate_formula("BREITE*3") == (Decimal("6"), None)
+        global_constants.set_constant("BREITE", Decimal("4"))
+        assert evaluate_formula("BREITE*3") == (Decimal("12"), None)
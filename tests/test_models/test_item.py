@@ -1,6 +1,10 @@
+import copy
+import pickle
+from dataclasses import asdict, replace
 from decimal import Decimal
+from itertools import chain
 
-from lvgenerator.models.item import Item
+from lvgenerator.models.item import Item, ItemDescription
 
 
 def test_calculate_total():
@@ -28,3 +32,43 @@ def test_calculate_total_large():
     item = Item(qty=Decimal("1000.000"), up=Decimal("199.990"))
     total = item.calculate_total()
     assert total == Decimal("199990.00")
+
+
+def test_item_has_no_instance_dict():
+    assert not hasattr(Item(), "__dict__")
+    assert not hasattr(ItemDescription(), "__dict__")
+
+
+def test_asdict_and_replace():
+    item = Item(id="a", qty=Decimal("2"), bid_comments=["Kommentar"],
+                up_components={1: Decimal("1.50")})
+    data = asdict(item)
+    assert data["bid_comments"] == ["Kommentar"]
+    assert data["up_components"] == {1: Decimal("1.50")}
+    assert data["description"]["outline_text"] == ""
+    other = replace(item, id="b")
+    assert other.id == "b" and other.qty == item.qty
+    assert other.bid_comments is item.bid_comments
+
+
+def test_lists_are_plain_lists():
+    item = Item()
+    assert type(item.bid_comments) is list and type(item.up_components) is dict
+    comments = item.bid_comments
+    comments.append("Kommentar")
+    assert [0] + item.bid_comments == [0, "Kommentar"]
+    assert list(chain([0], comments)) == [0, "Kommentar"]
+    assert Item().bid_comments is not comments
+
+
+def test_copies():
+    item = Item(id="a", qty=Decimal("1"))
+    item.ctlg_assignments.append("x")
+    for clone in (copy.copy(item), copy.deepcopy(item),
+                  pickle.loads(pickle.dumps(item))):
+        assert clone == item
+        assert type(clone.add_texts) is list
+    assert copy.copy(item).ctlg_assignments is item.ctlg_assignments
+    clone = copy.deepcopy(item)
+    clone.ctlg_assignments.append("y")
+    assert item.ctlg_assignments == ["x"]
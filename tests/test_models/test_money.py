@@ -0,0 +1,21 @@
+from decimal import Decimal
+
+from lvgenerator.models.money import from_cents, line_total_cents, to_cents
+
+
+def test_to_cents():
+    assert to_cents(Decimal("255.5")) == 25550
+    assert to_cents(Decimal("-1.01")) == -101
+    assert to_cents(Decimal("0.005")) is None
+
+
+def test_from_cents_keeps_two_places():
+    assert str(from_cents(25500)) == "255.00"
+    assert str(from_cents(0)) == "0.00"
+
+
+def test_line_total_rounds_like_quantize():
+    # Half-even as Decimal.quantize in the default context
+    assert line_total_cents(Decimal("1"), Decimal("0.125")) == 12
+    assert line_total_cents(Decimal("1"), Decimal("0.135")) == 14
+    assert line_total_cents(Decimal("3.333"), Decimal("7.77")) == 2590
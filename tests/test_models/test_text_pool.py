@@ -0,0 +1,29 @@
+from lvgenerator.models.text_pool import TextPool
+
+
+def test_intern_returns_pooled_instance():
+    pool = TextPool()
+    first = pool.intern("".join(["Beton", " C25/30"]))
+    second = pool.intern("".join(["Beton", " C25/30"]))
+    assert first is second
+    assert len(pool) == 1
+
+
+def test_stats():
+    pool = TextPool()
+    for text in ("m2", "m2", "St", "", "m2"):
+        pool.intern("".join(list(text)))  # distinct objects with equal content
+    stats = pool.stats()
+    assert stats.unique == 2
+    assert stats.requests == 4
+    assert stats.hits == 2
+    assert stats.hit_rate == 0.5
+    assert stats.saved_bytes > 0
+
+
+def test_clear():
+    pool = TextPool()
+    pool.intern("x")
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.stats().requests == 0
@@ -1,11 +1,11 @@
 import pytest
 from lvgenerator.models.boq import BoQBkdn
-from lvgenerator.controllers.boq_controller import (
-    generate_next_rno,
-    _get_mask_level_for_category,
-    _get_mask_level_for_item,
+from lvgenerator.controllers.boq_controller import generate_next_rno
+from lvgenerator.validators import (
+    mask_level_for_category,
+    mask_level_for_item,
+    validate_rno_part,
 )
-from lvgenerator.validators import validate_rno_part
 
 
 class TestGenerateNextRno:
@@ -37,16 +37,16 @@ class TestMaskLevelFinders:
             BoQBkdn(type="BoQLevel", length=3, numeric=True),
             BoQBkdn(type="Item", length=4, numeric=True),
         ]
-        assert _get_mask_level_for_category(bk, 0).length == 2
-        assert _get_mask_level_for_category(bk, 1).length == 3
-        assert _get_mask_level_for_category(bk, 2) is None
+        assert mask_level_for_category(bk, 0).length == 2
+        assert mask_level_for_category(bk, 1).length == 3
+        assert mask_level_for_category(bk, 2) is None
 
     def test_item_level(self):
         bk = [
             BoQBkdn(type="BoQLevel", length=2, numeric=True),
             BoQBkdn(type="Item", length=4, numeric=True),
         ]
-        assert _get_mask_level_for_item(bk).length == 4
+        assert mask_level_for_item(bk).length == 4
 
     def test_with_lot(self):
         bk = [
@@ -54,12 +54,12 @@ class TestMaskLevelFinders:
             BoQBkdn(type="BoQLevel", length=2, numeric=True),
             BoQBkdn(type="Item", length=4, numeric=True),
         ]
-        assert _get_mask_level_for_category(bk, 0).type == "Lot"
-        assert _get_mask_level_for_category(bk, 1).type == "BoQLevel"
+        assert mask_level_for_category(bk, 0).type == "Lot"
+        assert mask_level_for_category(bk, 1).type == "BoQLevel"
 
     def test_no_item_level(self):
         bk = [BoQBkdn(type="BoQLevel", length=2, numeric=True)]
-        assert _get_mask_level_for_item(bk) is None
+        assert mask_level_for_item(bk) is None
 
 
 class TestValidateRnoPart:
@@ -0,0 +1,61 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.gaeb.reader import GAEBReader
+from lvgenerator.gaeb.writer import GAEBWriter
+from lvgenerator.models.boq import BoQBkdn
+from lvgenerator.services.batch_validation import FileProblem, check_file, write_jsonl
+
+
+@pytest.fixture
+def broken_lv(tmp_path, sample_x83):
+    project = GAEBReader().read(sample_x83)
+    boq = project.boq
+    boq.info.breakdowns = [
+        BoQBkdn(type="BoQLevel", length=2),
+        BoQBkdn(type="BoQLevel", length=2),
+        BoQBkdn(type="Item", length=4),
+    ]
+    item = boq.index.items_by_oz().__next__()[1]
+    item.qty = Decimal("-5")
+    item.rno_part = "00A1"
+    target = tmp_path / "broken.x83"
+    GAEBWriter().write(project, str(target))
+    return str(target)
+
+
+class TestCheckFile:
+    def test_problems_are_tagged_with_oz(self, broken_lv):
+        problems = check_file(broken_lv, xsd=False)
+        by_source = {(p.source, p.field) for p in problems}
+        assert ("lv", "qty") in by_source
+        assert ("oz", "rno_part") in by_source
+        assert all(p.file == broken_lv for p in problems)
+        oz_problem = next(p for p in problems if p.source == "oz")
+        assert oz_problem.oz.endswith(".00A1")
+
+    def test_unreadable_file_is_reported(self, tmp_path):
+        path = tmp_path / "kaputt.x83"
+        path.write_text("<kein gaeb", encoding="utf-8")
+        problems = check_file(str(path), xsd=False)
+        assert [p.source for p in problems] == ["read"]
+
+    def test_project_name_is_checked(self, tmp_path, sample_x83):
+        project = GAEBReader().read(sample_x83)
+        project.prj_info.name = ""
+        target = tmp_path / "ohne_name.x83"
+        GAEBWriter().write(project, str(target))
+        problems = check_file(str(target), xsd=False)
+        assert [(p.source, p.field, p.severity) for p in problems
+                if p.field == "prj_name"] == [("lv", "prj_name", "warning")]
+
+    def test_write_jsonl(self):
+        out = io.StringIO()
+        problem = FileProblem("a.x83", "lv", "error", "Menge", oz="01.0010", field="qty")
+        assert write_jsonl([problem, problem], out) == 2
+        record = json.loads(out.getvalue().splitlines()[0])
+        assert record["oz"] == "01.0010"
+        assert record["severity"] == "error"
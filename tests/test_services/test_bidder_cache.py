@@ -0,0 +1,96 @@
+import os
+import shutil
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.gaeb.reader import GAEBReader
+from lvgenerator.models.preisspiegel import BidderPrice
+from lvgenerator.services.bidder_cache import BidderPriceCache
+from lvgenerator.services.preisspiegel_service import create_preisspiegel
+
+
+class _CountingReader(GAEBReader):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def read(self, file_path):
+        self.calls += 1
+        return super().read(file_path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BidderPriceCache(tmp_path / "cache.sqlite")
+
+
+@pytest.fixture
+def bid_file(tmp_path, fixtures_dir):
+    target = tmp_path / "bieter.x84"
+    shutil.copy(fixtures_dir / "sample_x84.xml", target)
+    return str(target)
+
+
+class TestBidderPriceCache:
+    def test_roundtrip(self, cache):
+        prices = {
+            "01.0010": BidderPrice(up=Decimal("12.50"), it=Decimal("125.00")),
+            "01.0020": BidderPrice(not_offered=True),
+            "02.0010": BidderPrice(up=Decimal("0.001")),
+        }
+        cache.put("abc", "Firma A", prices)
+        assert cache.get("abc") == ("Firma A", prices)
+
+    def test_miss(self, cache):
+        assert cache.get("unknown") is None
+
+    def test_file_key_depends_on_content(self, cache, bid_file):
+        key = cache.file_key(bid_file)
+        assert cache.file_key(bid_file) == key
+        with open(bid_file, "a", encoding="utf-8") as f:
+            f.write("\n")
+        assert cache.file_key(bid_file) != key
+
+    def test_touch_without_change_keeps_key(self, cache, bid_file):
+        key = cache.file_key(bid_file)
+        st = os.stat(bid_file)
+        os.utime(bid_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert cache.file_key(bid_file) == key
+
+    def test_size_bounded_eviction(self, tmp_path):
+        prices = {f"01.{i:04d}": BidderPrice(up=Decimal(i)) for i in range(200)}
+        probe = BidderPriceCache(tmp_path / "probe.sqlite")
+        probe.put("probe", "", prices)
+        entry_size = probe.total_size()
+
+        cache = BidderPriceCache(tmp_path / "cache.sqlite", max_bytes=entry_size * 2)
+        cache.put("a", "", prices)
+        cache.put("b", "", prices)
+        cache.put("c", "", prices)
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+        assert cache.total_size() <= entry_size * 2
+
+    def test_clear(self, cache):
+        cache.put("abc", "", {})
+        cache.clear()
+        assert cache.get("abc") is None
+
+
+class TestCreatePreisspiegelWithCache:
+    def test_cache_hit_skips_parsing(self, cache, bid_file, sample_x83, monkeypatch):
+        reference = GAEBReader().read(sample_x83)
+        uncached = create_preisspiegel(reference, [bid_file])
+
+        reader = _CountingReader()
+        monkeypatch.setattr(
+            "lvgenerator.services.preisspiegel_service.GAEBReader", lambda: reader
+        )
+        first = create_preisspiegel(reference, [bid_file], cache=cache)
+        second = create_preisspiegel(reference, [bid_file], cache=cache)
+
+        assert reader.calls == 1
+        assert first == uncached
+        assert second == uncached
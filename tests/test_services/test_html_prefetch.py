@@ -0,0 +1,47 @@
+from lvgenerator.gaeb.html_converter import (
+    clear_conversion_caches,
+    conversion_cache_stats,
+    gaeb_html_to_qt_html,
+)
+from lvgenerator.models.item import Item, ItemDescription
+from lvgenerator.services.html_prefetch import HtmlPrefetcher
+
+NS = "http://www.gaeb.de/GAEB_DA_XML/DA83/3.3"
+
+
+def _item(text: str) -> Item:
+    html = f'<Text xmlns="{NS}"><p><span>{text}</span></p></Text>'
+    return Item(description=ItemDescription(outline_text=text, detail_html=html))
+
+
+class TestHtmlPrefetcher:
+    def test_warms_conversion_cache(self):
+        clear_conversion_caches()
+        items = [_item(f"Langtext {i}") for i in range(3)] + [Item()]
+        prefetcher = HtmlPrefetcher()
+        try:
+            prefetcher.prefetch(items, "Arial", 10).result(timeout=5)
+        finally:
+            prefetcher.shutdown()
+        assert prefetcher.converted == 3
+
+        gaeb_html_to_qt_html(items[1].description.detail_html, "Arial", 10)
+        assert conversion_cache_stats()["to_qt"].hits == 1
+
+    def test_shutdown_stops_running_conversion(self):
+        clear_conversion_caches()
+        prefetcher = HtmlPrefetcher()
+        generation = prefetcher._generation
+        prefetcher.shutdown()
+        texts = [item.description.detail_html for item in (_item("A"), _item("B"))]
+        prefetcher._convert(texts, "Arial", 10, generation)
+        assert prefetcher.converted == 0
+
+    def test_prefetch_after_shutdown(self):
+        prefetcher = HtmlPrefetcher()
+        prefetcher.shutdown()
+        try:
+            prefetcher.prefetch([_item("Langtext")], "Arial", 10).result(timeout=5)
+        finally:
+            prefetcher.shutdown()
+        assert prefetcher.converted == 1
@@ -0,0 +1,86 @@
+from copy import deepcopy
+from decimal import Decimal
+
+from lvgenerator.models.project import GAEBProject
+from lvgenerator.services.lv_diff import diff_projects
+
+
+def _cat(project, n):
+    return project.boq.categories[n]
+
+
+class TestDiff:
+    def test_identical_skips_all_subtrees(self, two_titel_project):
+        diff = diff_projects(two_titel_project, deepcopy(two_titel_project))
+        assert not diff
+        assert diff.skipped_subtrees == 2
+
+    def test_field_changes(self, two_titel_project):
+        new = deepcopy(two_titel_project)
+        item = _cat(new, 1).items[0]
+        item.up = Decimal("6.00")
+        item.description.outline_text = "Mauerwerk"
+        diff = diff_projects(two_titel_project, new)
+        assert diff.skipped_subtrees == 1
+        [change] = diff.changed
+        assert change.oz == "02.0010"
+        assert [(f.field, f.old, f.new) for f in change.fields] == [
+            ("up", Decimal("5.00"), Decimal("6.00")),
+            ("outline_text", "Position 3", "Mauerwerk"),
+        ]
+
+    def test_formatting_only_change_not_reported(self, two_titel_project):
+        new = deepcopy(two_titel_project)
+        _cat(new, 0).items[0].description.outline_html = "<b>Position 1</b>"
+        _cat(new, 0).items[1].qty = Decimal("10.000")
+        assert not diff_projects(two_titel_project, new)
+
+    def test_added_and_removed(self, two_titel_project, make_item):
+        new = deepcopy(two_titel_project)
+        del _cat(new, 0).items[1]
+        _cat(new, 1).items.append(make_item(9, "0030"))
+        diff = diff_projects(two_titel_project, new)
+        assert [(c.oz, c.item_id) for c in diff.removed] == [("01.0020", "i2")]
+        assert [(c.oz, c.item_id) for c in diff.added] == [("02.0030", "i9")]
+
+    def test_moved_by_id(self, two_titel_project):
+        new = deepcopy(two_titel_project)
+        item = _cat(new, 0).items.pop(1)
+        item.rno_part = "0030"
+        item.qty = Decimal("12")
+        _cat(new, 1).items.append(item)
+        [moved] = diff_projects(two_titel_project, new).moved
+        assert (moved.old_oz, moved.oz) == ("01.0020", "02.0030")
+        assert [f.field for f in moved.fields] == ["qty"]
+
+    def test_moved_by_unique_content(self, two_titel_project):
+        new = deepcopy(two_titel_project)
+        item = _cat(new, 0).items.pop(0)
+        item.id = "other"
+        item.rno_part = "0030"
+        _cat(new, 1).items.append(item)
+        diff = diff_projects(two_titel_project, new)
+        assert [(c.old_oz, c.oz) for c in diff.moved] == [("01.0010", "02.0030")]
+        assert not diff.added and not diff.removed
+
+    def test_ambiguous_content_not_moved(self, two_titel_project):
+        new = deepcopy(two_titel_project)
+        for n, rno in ((7, "0030"), (8, "0040")):
+            copy = deepcopy(_cat(new, 0).items[0])
+            copy.id, copy.rno_part = f"x{n}", rno
+            _cat(new, 1).items.append(copy)
+        _cat(new, 0).items[0].id = "renamed"
+        _cat(new, 0).items[0].rno_part = "0005"
+        diff = diff_projects(two_titel_project, new)
+        assert not diff.moved
+        assert len(diff.added) == 3 and len(diff.removed) == 1
+
+    def test_removed_category(self, two_titel_project):
+        new = deepcopy(two_titel_project)
+        del new.boq.categories[0]
+        diff = diff_projects(two_titel_project, new)
+        assert sorted(c.oz for c in diff.removed) == ["01.0010", "01.0020"]
+
+    def test_missing_boq(self, two_titel_project):
+        diff = diff_projects(GAEBProject(), two_titel_project)
+        assert len(diff.added) == 4
@@ -0,0 +1,188 @@
+from copy import deepcopy
+from decimal import Decimal
+
+import pytest
+
+from lvgenerator.gaeb.reader import GAEBReader
+from lvgenerator.gaeb.writer import GAEBWriter
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.services.lv_merge import (
+    ADDED_BY_BOTH,
+    DELETED_BY_OURS,
+    DELETED_BY_THEIRS,
+    FIELD,
+    MISSING_PARENT,
+    MOVED_BY_BOTH,
+    merge_files,
+    merge_projects,
+)
+
+
+@pytest.fixture
+def base(two_titel_project):
+    """Common ancestor of ours and theirs."""
+    return two_titel_project
+
+
+def _cat(project, n):
+    return project.boq.categories[n]
+
+
+def _items(project):
+    return {
+        f"{cat.rno_part}.{item.rno_part}": item
+        for cat in project.boq.categories for item in cat.items
+    }
+
+
+class TestAutomatic:
+    def test_edits_in_different_titel(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(ours, 0).items[0].up = Decimal("7.00")
+        _cat(theirs, 1).items[1].qty = Decimal("20")
+        _cat(theirs, 1).label = "Mauerwerk"
+        result = merge_projects(base, ours, theirs)
+        assert result.clean and result.applied == 2
+        items = _items(result.project)
+        assert items["01.0010"].up == Decimal("7.00")
+        assert items["02.0020"].qty == Decimal("20")
+        assert _cat(result.project, 1).label == "Mauerwerk"
+
+    def test_different_fields_of_one_position(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(ours, 0).items[0].up = Decimal("7.00")
+        _cat(theirs, 0).items[0].description.outline_text = "Aushub"
+        result = merge_projects(base, ours, theirs)
+        assert result.clean
+        item = _items(result.project)["01.0010"]
+        assert (item.up, item.description.outline_text) == (Decimal("7.00"), "Aushub")
+
+    def test_fields_outside_hash_keep_ours(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(theirs, 0).items[0].markup_value = Decimal("3.5")
+        _cat(theirs, 0).items[1].up_components[1] = Decimal("2.00")
+        result = merge_projects(base, ours, theirs)
+        assert result.clean and result.applied == 0
+        items = _items(result.project)
+        assert items["01.0010"].markup_value is None
+        assert items["01.0020"].up_components == {}
+
+    def test_inputs_untouched(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(theirs, 0).items[0].qty = Decimal("99")
+        result = merge_projects(base, ours, theirs)
+        assert _cat(ours, 0).items[0].qty == Decimal("10")
+        assert _cat(result.project, 0) is not _cat(ours, 0)
+        assert result.project.prj_info is not ours.prj_info
+
+    def test_additions_and_deletions(self, base, make_item):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(ours, 0).items.append(make_item(5, "0030"))
+        _cat(theirs, 0).items.insert(1, make_item(6, "0015"))
+        del _cat(theirs, 1).items[0]
+        theirs.boq.categories.append(
+            BoQCategory(id="c3", rno_part="03", items=[make_item(7, "0010")])
+        )
+        result = merge_projects(base, ours, theirs)
+        assert result.clean
+        assert [i.rno_part for i in _cat(result.project, 0).items] == \
+            ["0010", "0015", "0020", "0030"]
+        assert [i.rno_part for i in _cat(result.project, 1).items] == ["0020"]
+        assert _cat(result.project, 2).items[0].id == "i7"
+        assert result.project.boq.index.item("03.0010") is not None
+
+    def test_move_into_new_titel(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        moved = _cat(theirs, 0).items.pop(1)
+        theirs.boq.categories.append(BoQCategory(id="c3", rno_part="03"))
+        _cat(theirs, 2).items.append(moved)
+        result = merge_projects(base, ours, theirs)
+        assert result.clean
+        assert [i.id for i in _cat(result.project, 0).items] == ["i1"]
+        assert [i.id for i in _cat(result.project, 2).items] == ["i2"]
+
+    def test_matches_by_oz_without_ids(self, base):
+        for item in _items(base).values():
+            item.id = ""
+        ours, theirs = deepcopy(base), deepcopy(base)
+        for item in _items(theirs).values():
+            item.id = f"new-{item.rno_part}"
+        _cat(theirs, 1).items[0].qu = "m3"
+        result = merge_projects(base, ours, theirs)
+        assert result.clean
+        assert _items(result.project)["02.0010"].qu == "m3"
+        assert len(_items(result.project)) == 4
+
+
+class TestConflicts:
+    def test_field_conflict_keeps_ours(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(ours, 0).items[0].up = Decimal("7.00")
+        _cat(theirs, 0).items[0].up = Decimal("8.00")
+        result = merge_projects(base, ours, theirs)
+        [conflict] = result.conflicts
+        assert (conflict.kind, conflict.oz, conflict.node_id, conflict.field) == \
+            (FIELD, "01.0010", "i1", "up")
+        assert (conflict.base, conflict.ours, conflict.theirs) == \
+            (Decimal("5.00"), Decimal("7.00"), Decimal("8.00"))
+        assert _items(result.project)["01.0010"].up == Decimal("7.00")
+
+    def test_same_change_on_both_sides(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        for project in (ours, theirs):
+            _cat(project, 0).items[0].up = Decimal("7.00")
+        assert merge_projects(base, ours, theirs).clean
+
+    def test_delete_modify(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        del _cat(ours, 0).items[0]
+        _cat(theirs, 0).items[0].qty = Decimal("1")
+        _cat(ours, 1).items[0].qty = Decimal("2")
+        del _cat(theirs, 1).items[0]
+        result = merge_projects(base, ours, theirs)
+        assert sorted((c.kind, c.oz) for c in result.conflicts) == [
+            (DELETED_BY_OURS, "01.0010"), (DELETED_BY_THEIRS, "02.0010"),
+        ]
+        assert set(_items(result.project)) == {"01.0020", "02.0010", "02.0020"}
+
+    def test_added_by_both(self, base, make_item):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        _cat(ours, 0).items.append(make_item(5, "0030"))
+        _cat(theirs, 0).items.append(make_item(6, "0030"))
+        [conflict] = merge_projects(base, ours, theirs).conflicts
+        assert (conflict.kind, conflict.oz) == (ADDED_BY_BOTH, "01.0030")
+
+    def test_added_into_titel_deleted_by_ours(self, base, make_item):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        del ours.boq.categories[1]
+        _cat(theirs, 1).items.append(make_item(5, "0030"))
+        kinds = {c.kind for c in merge_projects(base, ours, theirs).conflicts}
+        assert kinds == {DELETED_BY_OURS, MISSING_PARENT}
+
+    def test_moved_by_both(self, base):
+        ours, theirs = deepcopy(base), deepcopy(base)
+        ours.boq.categories.append(BoQCategory(id="c3", rno_part="03"))
+        _cat(ours, 2).items.append(_cat(ours, 0).items.pop(0))
+        _cat(theirs, 1).items.append(_cat(theirs, 0).items.pop(0))
+        _cat(theirs, 1).items[-1].rno_part = "0030"
+        result = merge_projects(base, ours, theirs)
+        [conflict] = result.conflicts
+        assert (conflict.kind, conflict.ours, conflict.theirs) == (MOVED_BY_BOTH, "03", "02")
+
+
+def test_merge_files(tmp_path, fixtures_dir):
+    base = GAEBReader().read(str(fixtures_dir / "sample_x83.xml"))
+    ozs = [oz for oz, _item in base.boq.index.items_by_oz()]
+    ours, theirs = deepcopy(base), deepcopy(base)
+    ours.boq.index.item(ozs[0]).qu = "Stk"
+    theirs.boq.index.item(ozs[-1]).qty = Decimal("42")
+    paths = []
+    for name, project in (("base", base), ("ours", ours), ("theirs", theirs)):
+        paths.append(str(tmp_path / f"{name}.x83"))
+        GAEBWriter().write(project, paths[-1])
+    out = str(tmp_path / "merged.x83")
+    result = merge_files(*paths, output_path=out)
+    assert result.clean and result.applied == 1
+    merged = GAEBReader().read(out).boq.index
+    assert merged.item(ozs[0]).qu == "Stk"
+    assert merged.item(ozs[-1]).qty == Decimal("42")
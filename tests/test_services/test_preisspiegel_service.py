@@ -11,6 +11,7 @@ from lvgenerator.models.preisspiegel import (
 )
 from lvgenerator.models.project import AwardInfo, GAEBInfo, GAEBProject, PrjInfo
 from lvgenerator.services.preisspiegel_service import (
+    PreisSpiegelBuilder,
     _build_item_map,
     _build_item_row,
     create_preisspiegel,
@@ -242,3 +243,87 @@ class TestCreatePreisspiegelIntegration:
         rows = []
         _traverse_structure(reference.boq.categories, "", [], rows, [])
         assert rows == []
+
+
+class TestPreisSpiegelBuilder:
+    def _reference(self):
+        sub = BoQCategory(id="s1", rno_part="01", label="Untergruppe", items=[
+            _item("0010", qty=Decimal("10"), qu="m2", text="Beton"),
+        ])
+        cat = BoQCategory(id="c1", rno_part="01", label="Rohbau",
+                          subcategories=[sub], items=[
+                              _item("0020", qty=Decimal("5"), qu="Stk"),
+                          ])
+        return _project(categories=[cat])
+
+    def _bid(self, up_0010, up_0020, name=""):
+        from lvgenerator.models.address import Address, Contractor
+        sub = BoQCategory(id="s1", rno_part="01", items=[
+            _item("0010", up=up_0010),
+        ])
+        cat = BoQCategory(id="c1", rno_part="01", subcategories=[sub], items=[
+            _item("0020", up=up_0020),
+        ])
+        project = _project(categories=[cat], phase=None)
+        if name:
+            project.contractor = Contractor(address=Address(name1=name))
+        return project
+
+    def test_initial_structure_without_bidders(self):
+        builder = PreisSpiegelBuilder(self._reference())
+        rows = builder.spiegel.rows
+        assert [r.oz for r in rows] == ["01", "01.01", "01.01.0010", "01.0020"]
+        assert builder.bidder_count == 0
+        assert rows[2].unit_prices == []
+        assert builder.spiegel.grand_totals == []
+
+    def test_add_bidder_updates_rows_and_totals(self):
+        builder = PreisSpiegelBuilder(self._reference())
+        builder.add_bidder_project(
+            self._bid(Decimal("100.00"), Decimal("20.00"), "Firma A"), "a.x84",
+        )
+        rows = builder.spiegel.rows
+        assert builder.spiegel.bidders[0].name == "Firma A"
+        assert rows[2].total_prices == [Decimal("1000.00")]
+        assert rows[0].totals == [Decimal("1100.00")]
+        assert rows[1].totals == [Decimal("1000.00")]
+        assert builder.spiegel.grand_totals == [Decimal("1100.00")]
+
+    def test_statistics_follow_added_bidders(self):
+        builder = PreisSpiegelBuilder(self._reference())
+        builder.add_bidder_project(self._bid(Decimal("100.00"), None), "a.x84")
+        builder.add_bidder_project(self._bid(Decimal("80.00"), None), "b.x84")
+        row = builder.spiegel.rows[2]
+        assert row.min_up == Decimal("80.00")
+        assert row.max_up == Decimal("100.00")
+        assert row.avg_up == Decimal("90.00")
+        # Position without any unit price has no statistics
+        assert builder.spiegel.rows[3].min_up is None
+
+    def test_remove_bidder(self):
+        builder = PreisSpiegelBuilder(self._reference())
+        builder.add_bidder_project(self._bid(Decimal("100.00"), None), "a.x84")
+        builder.add_bidder_project(self._bid(Decimal("80.00"), None), "b.x84")
+        removed = builder.remove_bidder(builder.index_of("b.x84"))
+        assert removed.file_path == "b.x84"
+        row = builder.spiegel.rows[2]
+        assert row.unit_prices == [Decimal("100.00")]
+        assert row.min_up == row.max_up == Decimal("100.00")
+        assert builder.spiegel.rows[0].totals == [Decimal("1000.00")]
+        assert builder.spiegel.grand_totals == [Decimal("1000.00")]
+        assert builder.index_of("b.x84") == -1
+
+    def test_matches_create_preisspiegel(self, fixtures_dir):
+        from lvgenerator.gaeb.reader import GAEBReader
+        reference = GAEBReader().read(str(fixtures_dir / "sample_x83.xml"))
+        files = [
+            str(fixtures_dir / "sample_x84.xml"),
+            str(fixtures_dir / "sample_x84_bidcomm.xml"),
+        ]
+        builder = PreisSpiegelBuilder(reference)
+        for fp in files:
+            builder.add_bidder(fp)
+        assert builder.spiegel == create_preisspiegel(reference, files)
+
+        builder.remove_bidder(0)
+        assert builder.spiegel == create_preisspiegel(reference, files[1:])
@@ -7,14 +7,11 @@ from lvgenerator.services.recent_files import MAX_RECENT_FILES, RecentFilesManag
 
 
 @pytest.fixture
-def manager(tmp_path, monkeypatch):
+def manager(tmp_path, monkeypatch, qapp):
     """Create a RecentFilesManager with isolated QSettings."""
-    # Use a unique org/app name to avoid polluting real settings
-    from PySide6.QtCore import QCoreApplication
-    # Ensure QCoreApplication exists
-    app = QCoreApplication.instance()
-    if app is None:
-        app = QCoreApplication([])
+    # Use a unique org/app name to avoid polluting real settings;
+    # pytest-qt's QApplication so later widget tests can share it
+    app = qapp
     app.setOrganizationName("LVGenerator-Test")
     app.setApplicationName("test-recent-files")
 
@@ -0,0 +1,89 @@
+import pytest
+
+from lvgenerator.commands.structure_commands import RenumberCommand
+from lvgenerator.models.boq import BoQBkdn
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.services.renumbering import (
+    plan_renumber_all,
+    plan_renumber_items,
+    plan_renumber_subtree,
+)
+
+BREAKDOWNS = [
+    BoQBkdn(type="Lot", length=1),
+    BoQBkdn(type="BoQLevel", length=2),
+    BoQBkdn(type="Item", length=4),
+]
+
+
+def _items(*rnos):
+    return [Item(id=f"i{n}", rno_part=rno) for n, rno in enumerate(rnos)]
+
+
+@pytest.fixture
+def lots():
+    titel = BoQCategory(id="t", rno_part="07", items=_items("0010", "", "0011"))
+    second = BoQCategory(id="t2", rno_part="07", items=_items("0001"))
+    return [BoQCategory(id="los", rno_part="3", subcategories=[titel, second])]
+
+
+def _ozs(categories):
+    result = []
+    for lot in categories:
+        for cat in lot.subcategories:
+            result.append([lot.rno_part, cat.rno_part, [i.rno_part for i in cat.items]])
+    return result
+
+
+class TestPlans:
+    def test_all_levels(self, lots):
+        plan = plan_renumber_all(lots, BREAKDOWNS)
+        RenumberCommand(plan).redo()
+        assert _ozs(lots) == [
+            ["1", "01", ["0001", "0002", "0003"]],
+            ["1", "02", ["0001"]],
+        ]
+
+    def test_plan_does_not_modify_and_is_minimal(self, lots):
+        plan = plan_renumber_all(lots, BREAKDOWNS)
+        assert lots[0].rno_part == "3"
+        # second item already has the right number
+        assert len(plan) == 6
+        assert set(plan.old) >= {"3", "0010", ""}
+
+    def test_gaps_only_keeps_ascending_numbers(self, lots):
+        plan = plan_renumber_all(lots, BREAKDOWNS, gaps_only=True)
+        RenumberCommand(plan).redo()
+        assert _ozs(lots) == [
+            ["3", "07", ["0010", "0011", "0012"]],
+            ["3", "08", ["0001"]],
+        ]
+
+    def test_subtree_keeps_own_number(self, lots):
+        plan = plan_renumber_subtree(lots[0], 0, BREAKDOWNS, step=10)
+        RenumberCommand(plan).redo()
+        assert _ozs(lots) == [
+            ["3", "10", ["0010", "0020", "0030"]],
+            ["3", "20", ["0010"]],
+        ]
+
+    def test_items_only(self, lots):
+        titel = lots[0].subcategories[0]
+        plan = plan_renumber_items(titel, BREAKDOWNS)
+        assert all(isinstance(n, Item) for n in plan.nodes)
+
+    def test_level_without_mask_is_kept(self, lots):
+        plan = plan_renumber_all(lots, [BoQBkdn(type="Item", length=4)])
+        assert not any(isinstance(n, BoQCategory) for n in plan.nodes)
+
+
+class TestRenumberCommand:
+    def test_undo_restores_and_bumps_revision(self, lots):
+        plan = plan_renumber_all(lots, BREAKDOWNS)
+        cmd = RenumberCommand(plan, "Gesamtes LV neu nummerieren")
+        cmd.redo()
+        cmd.undo()
+        assert _ozs(lots)[0] == ["3", "07", ["0010", "", "0011"]]
+        assert lots[0].revision == 2
+        assert not plan_renumber_all([], BREAKDOWNS)
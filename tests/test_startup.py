@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+from lvgenerator.main import DEFERRED_MODULES
+
+
+def test_main_does_not_import_deferred_modules():
+    code = (
+        "import sys, lvgenerator.main;"
+        f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    assert out.strip() == "[]"
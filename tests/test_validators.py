@@ -7,8 +7,11 @@ from lvgenerator.models.category import BoQCategory
 from lvgenerator.models.item import Item, ItemDescription
 from lvgenerator.models.project import GAEBProject, PrjInfo
 from lvgenerator.models.boq import BoQ, BoQInfo
+from lvgenerator.commands.category_commands import EditCategoryPropertyCommand
+from lvgenerator.commands.item_commands import EditItemPropertyCommand
 from lvgenerator.validators import (
     CategoryValidator,
+    IncrementalValidator,
     ItemValidator,
     ProjectValidator,
     validate_decimal_input,
@@ -141,6 +144,73 @@ class TestProjectValidator:
         result = ProjectValidator().validate(project)
         assert result.is_valid
 
+    def test_sees_changes_and_keeps_tree_order(self):
+        sub = BoQCategory(id="c2", rno_part="01", label="")
+        cat = BoQCategory(id="c1", rno_part="01", label="Test", subcategories=[sub])
+        project = GAEBProject(
+            prj_info=PrjInfo(name="Testprojekt"),
+            phase=GAEBPhase.X83,
+            boq=BoQ(id="1", info=BoQInfo(), categories=[cat]),
+        )
+        validator = ProjectValidator()
+        assert [e.field_name for e in validator.validate(project).errors] == ["label"]
+        cat.items.append(Item(id="i1", rno_part=""))
+        fields = [e.field_name for e in validator.validate(project).errors]
+        assert fields[0] == "rno_part" and fields[-1] == "label"
+
+
+def _project_with_problems():
+    cat = BoQCategory(id="c1", rno_part="01", label="")
+    cat.items.append(Item(id="i1", rno_part="0010", qty=Decimal("-1"), qu="m2"))
+    cat.items.append(
+        Item(id="i2", rno_part="0020", qty=Decimal("1"), qu="m",
+             description=ItemDescription(outline_text="OK"))
+    )
+    return GAEBProject(
+        prj_info=PrjInfo(name="Testprojekt"),
+        phase=GAEBPhase.X83,
+        boq=BoQ(id="1", info=BoQInfo(), categories=[cat]),
+    )
+
+
+class TestIncrementalValidator:
+    def test_same_result_as_project_validator(self):
+        project = _project_with_problems()
+        expected = ProjectValidator().validate(project).errors
+        assert IncrementalValidator().validate(project).errors == expected
+
+    def test_query_by_severity_and_field(self):
+        project = _project_with_problems()
+        validator = IncrementalValidator()
+        errors = validator.problems(project, severity="error")
+        assert [(p.oz, p.error.field_name) for p in errors] == [("01.0010", "qty")]
+        labels = validator.problems(project, field_name="label")
+        assert [p.oz for p in labels] == ["01"]
+
+    def test_unchanged_nodes_are_cached(self):
+        project = _project_with_problems()
+        validator = IncrementalValidator()
+        validator.validate(project)
+        assert validator.misses == 3
+        validator.validate(project)
+        assert validator.misses == 3
+        assert validator.hits == 3
+
+    def test_command_invalidates_only_edited_node(self):
+        project = _project_with_problems()
+        validator = IncrementalValidator()
+        validator.validate(project)
+        cat = project.boq.categories[0]
+        cmd = EditItemPropertyCommand(cat.items[0], "qty", Decimal("-1"), Decimal("2"))
+        cmd.redo()
+        assert validator.problems(project, severity="error") == []
+        assert validator.misses == 4
+        EditCategoryPropertyCommand(cat, "label", "", "Rohbau").redo()
+        assert validator.problems(project, field_name="label") == []
+        assert validator.misses == 5
+        cmd.undo()
+        assert len(validator.problems(project, severity="error")) == 1
+
 
 class TestValidateDecimalInput:
     def test_valid_number(self):
@@ -0,0 +1,78 @@
+from lvgenerator.models.boq import BoQ
+from lvgenerator.models.category import BoQCategory
+from lvgenerator.models.item import Item
+from lvgenerator.models.project import GAEBProject
+from lvgenerator.viewmodels.boq_tree_model import BoQFilterProxyModel, BoQTreeModel
+
+
+def test_nodes_changed_emits_changed_rows(qapp):
+    roots = [
+        BoQCategory(id=f"c{n}", rno_part=f"{n:02d}", items=[Item(id=f"i{n}")])
+        for n in range(4)
+    ]
+    roots[2].subcategories.append(BoQCategory(id="sub", items=[Item(id="tief")]))
+    model = BoQTreeModel()
+    model.set_project(GAEBProject(boq=BoQ(categories=roots)))
+
+    emitted = []
+    model.dataChanged.connect(lambda tl, br, roles=(): emitted.append(
+        (model.get_node(tl.parent()).data.id if tl.parent().isValid() else None,
+         tl.row(), br.row(), tl.column(), br.column())
+    ))
+    model.nodes_changed([roots[1].items[0], roots[2].subcategories[0].items[0]])
+    # The rows themselves and the Titel above them (GP); adjacent rows in one range
+    assert sorted(emitted, key=str) == sorted([
+        (None, 1, 2, 0, 5),
+        ("c1", 0, 0, 0, 5),
+        ("c2", 0, 0, 0, 5),
+        ("sub", 0, 0, 0, 5),
+    ], key=str)
+
+    emitted.clear()
+    model.nodes_changed([])
+    assert emitted == []
+
+
+def test_nodes_changed_splits_runs(qapp):
+    cat = BoQCategory(id="c", items=[Item(id=f"i{n}") for n in range(5)])
+    model = BoQTreeModel()
+    model.set_project(GAEBProject(boq=BoQ(categories=[cat])))
+    emitted = []
+    model.dataChanged.connect(lambda tl, br, roles=(): emitted.append(
+        (tl.parent().isValid(), tl.row(), br.row())
+    ))
+    model.nodes_changed([cat.items[0], cat.items[1], cat.items[3]])
+    assert sorted(emitted) == [(False, 0, 0), (True, 0, 1), (True, 3, 3)]
+
+
+def test_nodes_changed_refilters_proxy(qapp):
+    items = [Item(id=f"i{n}", qu="m") for n in range(3)]
+    sub = BoQCategory(id="sub", items=items)
+    roots = [BoQCategory(id="c1", subcategories=[sub]),
+             BoQCategory(id="c2", items=[Item(id="x", qu="m")])]
+    model = BoQTreeModel()
+    model.set_project(GAEBProject(boq=BoQ(categories=roots)))
+    proxy = BoQFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setFilterFixedString("stk")
+    assert proxy.rowCount() == 0
+
+    items[1].qu = "Stk"
+    model.nodes_changed([items[1]])
+    top = proxy.index(0, 0)
+    assert proxy.rowCount() == 1
+    assert proxy.rowCount(proxy.index(0, 0, top)) == 1
+
+    items[1].qu = "m"
+    model.nodes_changed([items[1]])
+    assert proxy.rowCount() == 0
+
+
+def test_nodes_changed_for_category(qapp):
+    roots = [BoQCategory(id=f"c{n}", rno_part=f"{n:02d}") for n in range(3)]
+    model = BoQTreeModel()
+    model.set_project(GAEBProject(boq=BoQ(categories=roots)))
+    emitted = []
+    model.dataChanged.connect(lambda tl, br, roles=(): emitted.append((tl.row(), br.row())))
+    model.nodes_changed([roots[2]])
+    assert emitted == [(2, 2)]
@@ -0,0 +1,84 @@
+import pytest
+from PySide6.QtGui import QTextCharFormat, QTextCursor, QTextListFormat
+
+from lvgenerator.gaeb.html_converter import qt_html_to_gaeb_html
+from lvgenerator.views.rich_text_edit import RichTextEditWidget
+
+NS = "http://www.gaeb.de/GAEB_DA_XML/DA83/3.3"
+GAEB = (
+    f'<Text xmlns="{NS}"><p><span>Hallo </span><span style="font-weight: bold">fett</span>'
+    f'</p><p><span style="font-style: italic">kursiv</span></p><p><span>a &amp; b</span></p></Text>'
+)
+
+
+@pytest.fixture
+def editor(qtbot):
+    widget = RichTextEditWidget()
+    qtbot.addWidget(widget)
+    widget.set_gaeb_html(GAEB, "Text", NS)
+    return widget
+
+
+def _full_conversion(widget):
+    return qt_html_to_gaeb_html(widget._text_edit.toHtml(), "Text", NS)
+
+
+class TestChangeTracking:
+    def test_no_commit_without_edit(self, editor, qtbot):
+        with qtbot.assertNotEmitted(editor.editing_finished):
+            editor.commit_if_changed()
+        assert not editor.is_modified()
+
+    def test_commit_once_after_edit(self, editor, qtbot):
+        cursor = editor._text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(" mehr")
+        with qtbot.waitSignal(editor.editing_finished) as blocker:
+            editor.commit_if_changed()
+        assert blocker.args[1].endswith("a & b mehr")
+        with qtbot.assertNotEmitted(editor.editing_finished):
+            editor.commit_if_changed()
+
+    def test_format_change_is_detected(self, editor, qtbot):
+        cursor = editor._text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock,
+                            QTextCursor.MoveMode.KeepAnchor)
+        fmt = QTextCharFormat()
+        fmt.setFontUnderline(True)
+        cursor.mergeCharFormat(fmt)
+        with qtbot.waitSignal(editor.editing_finished) as blocker:
+            editor.commit_if_changed()
+        assert "underline" in blocker.args[0]
+
+
+class TestBlockConversion:
+    def test_matches_full_conversion(self, editor):
+        assert editor.get_gaeb_html() == _full_conversion(editor)
+
+    def test_after_edits_and_lists(self, editor):
+        assert editor.get_gaeb_html()
+        cursor = editor._text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.insertText("Neu ")
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertBlock()
+        cursor.insertBlock()
+        cursor.insertText("erster Punkt")
+        cursor.createList(QTextListFormat.Style.ListDecimal)
+        cursor.insertBlock()
+        cursor.insertText("zweiter Punkt")
+        assert editor.get_gaeb_html() == _full_conversion(editor)
+        assert "2. zweiter Punkt" in editor.get_gaeb_html()
+
+    def test_unchanged_blocks_are_reused(self, editor, monkeypatch):
+        editor.get_gaeb_html()
+        calls = []
+        original = editor._blocks._convert_block
+        monkeypatch.setattr(editor._blocks, "_convert_block",
+                            lambda block, ns: calls.append(block.text()) or original(block, ns))
+        cursor = editor._text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText("!")
+        editor.get_gaeb_html()
+        assert calls == ["a & b!"]